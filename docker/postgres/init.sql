@@ -299,6 +299,7 @@ CREATE TABLE IF NOT EXISTS code_article_versions (
 
   -- Change detection
   text_hash VARCHAR(64),  -- Hash of article text for comparison
+  text_hash_algo VARCHAR(16) DEFAULT 'md5',  -- Algorithm of text_hash (md5 or xxh3_128)
 
   created_at TIMESTAMP DEFAULT NOW(),
 
@@ -357,7 +358,9 @@ CREATE TABLE IF NOT EXISTS consolidated_codes (
 CREATE INDEX IF NOT EXISTS idx_code_article_versions_code_article ON code_article_versions(code_id, article_number);
 CREATE INDEX IF NOT EXISTS idx_code_article_versions_code_current ON code_article_versions(code_id, is_current);
 CREATE INDEX IF NOT EXISTS idx_code_article_versions_version_date ON code_article_versions(version_date);
-CREATE INDEX IF NOT EXISTS idx_code_article_versions_code_date ON code_article_versions(code_id, article_number, version_date);
+-- Covering indexes for VersionManager lookups (see migrations 004, 005)
+CREATE INDEX IF NOT EXISTS idx_code_article_versions_current ON code_article_versions(code_id, article_number, version_date DESC) INCLUDE (amendment_eo_number, is_repealed, repealed_date, text_hash) WHERE is_current = true;
+CREATE INDEX IF NOT EXISTS idx_code_article_versions_history ON code_article_versions(code_id, article_number, version_date DESC) INCLUDE (amendment_eo_number, is_current, is_repealed, text_hash, text_hash_algo);
 
 CREATE INDEX IF NOT EXISTS idx_amendment_applications_eo_number ON amendment_applications(amendment_eo_number);
 CREATE INDEX IF NOT EXISTS idx_amendment_applications_code_id ON amendment_applications(code_id);
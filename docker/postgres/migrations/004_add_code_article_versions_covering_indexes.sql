@@ -0,0 +1,39 @@
+-- Migration: Add covering indexes for code_article_versions lookups
+-- Date: 2026-10-16
+-- Description: VersionManager filters on (code_id, article_number) and orders by
+-- version_date, usually with LIMIT 1. These indexes match that shape and carry
+-- the small projected columns, so the chain/history lookups become index-only
+-- scans and current/dated lookups need a single heap fetch for the text.
+--
+-- article_text is deliberately not INCLUDEd: btree entries are capped at about
+-- 2.7 KB, so long articles would make inserts fail.
+--
+-- NOTE: CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block,
+-- so run this file without BEGIN/COMMIT (e.g. psql -f, not psql -1 -f).
+
+-- ============================================================================
+-- CURRENT VERSION LOOKUPS (get_current_version)
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_code_article_versions_current
+ON code_article_versions (code_id, article_number, version_date DESC)
+INCLUDE (amendment_eo_number, is_repealed, repealed_date, text_hash)
+WHERE is_current = true;
+
+-- ============================================================================
+-- HISTORY LOOKUPS (get_version_on_date, get_amendment_chain, get_article_history)
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_code_article_versions_history
+ON code_article_versions (code_id, article_number, version_date DESC)
+INCLUDE (amendment_eo_number, is_current, is_repealed, text_hash);
+
+-- Superseded by idx_code_article_versions_history (and the unique constraint)
+DROP INDEX CONCURRENTLY IF EXISTS idx_code_article_versions_code_date;
+
+-- Verification: get_amendment_chain should show "Index Only Scan"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT version_date, amendment_eo_number, is_current, is_repealed, text_hash
+-- FROM code_article_versions
+-- WHERE code_id = 'TK_RF' AND article_number = '1'
+-- ORDER BY version_date ASC;
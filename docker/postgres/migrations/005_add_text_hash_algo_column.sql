@@ -0,0 +1,30 @@
+-- Migration: Record the hash algorithm behind code_article_versions.text_hash
+-- Date: 2026-10-16
+-- Description: Article text hashes move from MD5 to xxh3_128 (non-cryptographic,
+-- only used for change detection). Existing rows keep their MD5 hashes and are
+-- labelled 'md5'; rows are rehashed lazily the next time they are saved.
+--
+-- NOTE: CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block,
+-- so run this file without BEGIN/COMMIT (e.g. psql -f, not psql -1 -f).
+
+-- ============================================================================
+-- ADD TEXT_HASH_ALGO COLUMN
+-- ============================================================================
+
+-- Constant default: existing rows are labelled without a table rewrite
+ALTER TABLE code_article_versions
+ADD COLUMN IF NOT EXISTS text_hash_algo VARCHAR(16) DEFAULT 'md5';
+
+COMMENT ON COLUMN code_article_versions.text_hash_algo IS
+'Algorithm of text_hash (md5 or xxh3_128); hashes are only comparable within one algorithm';
+
+-- ============================================================================
+-- KEEP AMENDMENT CHAIN LOOKUPS INDEX-ONLY
+-- ============================================================================
+
+-- get_amendment_chain now also reads text_hash_algo
+DROP INDEX CONCURRENTLY IF EXISTS idx_code_article_versions_history;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_code_article_versions_history
+ON code_article_versions (code_id, article_number, version_date DESC)
+INCLUDE (amendment_eo_number, is_current, is_repealed, text_hash, text_hash_algo);
@@ -0,0 +1,46 @@
+-- Migration: Add unique constraint to court_decisions table
+-- Date: 2026-10-16
+-- Description: Add unique constraint on (country_id, court_type, case_number, decision_date)
+--              so CourtDecisionImporter can upsert decisions in one statement
+--              with ON CONFLICT instead of a SELECT before every UPDATE/INSERT
+
+-- ============================================================================
+-- UNIQUE CONSTRAINT FOR COURT DECISIONS
+-- ============================================================================
+
+-- This is the key the importer has always used to find an existing decision.
+-- Rows with a NULL case_number never conflict, which matches the old lookup
+-- (case_number = $3 is never true for NULL).
+
+BEGIN;
+
+-- First, pick one row to keep per key (the most recently updated)
+CREATE TEMP TABLE court_decisions_dedup ON COMMIT DROP AS
+SELECT
+    id,
+    first_value(id) OVER (
+        PARTITION BY country_id, court_type, case_number, decision_date
+        ORDER BY updated_at DESC NULLS LAST, id DESC
+    ) AS keep_id
+FROM court_decisions
+WHERE case_number IS NOT NULL;
+
+-- Move legal positions off the duplicates (they would be deleted by ON DELETE CASCADE)
+UPDATE legal_positions p
+SET decision_id = d.keep_id
+FROM court_decisions_dedup d
+WHERE p.decision_id = d.id
+  AND d.id <> d.keep_id;
+
+-- Remove the duplicates
+DELETE FROM court_decisions c
+USING court_decisions_dedup d
+WHERE c.id = d.id
+  AND d.id <> d.keep_id;
+
+-- Now add the unique constraint (its index also serves the upsert lookups)
+ALTER TABLE court_decisions
+ADD CONSTRAINT court_decisions_unique_case
+UNIQUE (country_id, court_type, case_number, decision_date);
+
+COMMIT;
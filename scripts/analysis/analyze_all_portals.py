@@ -14,13 +14,16 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import requests
+
 from analyze_supreme_court import SupremeCourtAnalyzer
 from analyze_minfin import MinfinAnalyzer
 from analyze_moscow_duma import MoscowDumaAnalyzer
+from portal_analyzer import create_session
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +32,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def run_analyzer(index: int, name: str, analyzer_cls, session: requests.Session) -> None:
+    """Run a single portal analyzer, printing its section header first."""
+    print("\n" + "-"*70)
+    print(f"{index}/3: Analyzing {name} Portal...")
+    print("-"*70)
+    analyzer = analyzer_cls(session=session)
+    analyzer.run()
+
+
 def main():
     """Run all portal analyses."""
     print("\n" + "="*70)
@@ -36,35 +48,28 @@ def main():
     print("="*70)
     print(f"Started at: {datetime.now().isoformat()}")
 
-    # Analyze Supreme Court
-    print("\n" + "-"*70)
-    print("1/3: Analyzing Supreme Court Portal...")
-    print("-"*70)
-    try:
-        supreme_analyzer = SupremeCourtAnalyzer()
-        supreme_analyzer.run()
-    except Exception as e:
-        logger.error(f"Supreme Court analysis failed: {e}")
+    analyzers = [
+        ("Supreme Court", SupremeCourtAnalyzer),
+        ("Ministry of Finance", MinfinAnalyzer),
+        ("Moscow City Duma", MoscowDumaAnalyzer),
+    ]
 
-    # Analyze Ministry of Finance
-    print("\n" + "-"*70)
-    print("2/3: Analyzing Ministry of Finance Portal...")
-    print("-"*70)
-    try:
-        minfin_analyzer = MinfinAnalyzer()
-        minfin_analyzer.run()
-    except Exception as e:
-        logger.error(f"Ministry of Finance analysis failed: {e}")
+    # One pool shared by all analyzers, sized for three hosts at once; closed
+    # even if an analysis raises or the run is interrupted
+    with create_session(pool_connections=16, pool_maxsize=32) as session:
+        # Portals live on independent hosts, so they can be analyzed in parallel
+        # (bounded by the slowest); the pooled session keeps per-host connections
+        with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+            futures = [
+                (name, executor.submit(run_analyzer, index, name, analyzer_cls, session))
+                for index, (name, analyzer_cls) in enumerate(analyzers, start=1)
+            ]
 
-    # Analyze Moscow Duma
-    print("\n" + "-"*70)
-    print("3/3: Analyzing Moscow City Duma Portal...")
-    print("-"*70)
-    try:
-        moscow_analyzer = MoscowDumaAnalyzer()
-        moscow_analyzer.run()
-    except Exception as e:
-        logger.error(f"Moscow Duma analysis failed: {e}")
+            for name, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"{name} analysis failed: {e}")
 
     print("\n" + "="*70)
     print("ALL ANALYSES COMPLETE")
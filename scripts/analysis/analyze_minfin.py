@@ -15,14 +15,14 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING
 import re
 
-import requests
-from bs4 import BeautifulSoup
+from portal_analyzer import PortalAnalyzer
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,61 +30,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import and reused across scripts and pages
+# Single scan over inline JS; dispatch on the named group that matched
+_JS_SCAN_RE = re.compile(
+    r'(?P<api>["\']https?://[^"\']*(?:api|ajax|json|documents)["\'])'
+    r'|(?P<date>\d{2}\.\d{2}\.\d{4})'
+)
+_FILTER_NAME_RE = re.compile(r"filter|sort|type")
+_DOC_CARD_RE = re.compile(r"doc|card|item")
+_DATE_RE = re.compile(r"\d{2}\.\d{2}\.\d{4}")
+_NUMBER_RE = re.compile(r"\d{2}-\d{2}-\d{2}/\d+")
 
-class MinfinAnalyzer:
-    """Analyze Ministry of Finance portal structure."""
+# Only these tags (and their subtrees) are needed from the documents page
+_DOCUMENTS_PAGE_TAGS = ["script", "select", "input", "div"]
 
-    BASE_URL = "https://minfin.gov.ru"
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
-        self.findings = {
-            "portal": "Ministry of Finance (minfin.gov.ru)",
-            "timestamp": datetime.now().isoformat(),
-            "api_endpoints": [],
-            "html_structure": {},
-            "document_patterns": {},
-            "filters": {},
-            "errors": []
-        }
+class MinfinAnalyzer(PortalAnalyzer):
+    """Analyze Ministry of Finance portal structure."""
 
-    def analyze_documents_page(self):
-        """Analyze the main documents page."""
+    BASE_URL = "https://minfin.gov.ru"
+    PORTAL = "Ministry of Finance (minfin.gov.ru)"
+    API_PATHS = (
+        "/api/documents",
+        "/ru/api/document",
+        "/document/api",
+        "/ajax/get-documents",
+    )
+    FINDINGS_SECTIONS = ("document_patterns", "filters")
+    RESULTS_FILE = "minfin_analysis.json"
+    JS_SCAN_RE = _JS_SCAN_RE
+
+    def analyze_documents_page(self, soup: "BeautifulSoup"):
+        """Analyze the main documents page from its parsed soup."""
         logger.info("Analyzing documents page...")
 
-        url = f"{self.BASE_URL}/ru/document/"
         try:
-            logger.info(f"Fetching {url}...")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
             # Look for API calls in scripts
-            scripts = soup.find_all("script")
-            for script in scripts:
-                if script.string:
-                    # Look for API endpoints in JavaScript
-                    api_patterns = re.findall(
-                        r'["\']https?://[^"\']*(?:api|ajax|json|documents)["\']',
-                        script.string
-                    )
-                    for pattern in api_patterns:
-                        if pattern not in self.findings["api_endpoints"]:
-                            self.findings["api_endpoints"].append(pattern)
+            self._scan_scripts(soup)
 
             # Find filter section
-            filters = soup.find_all(["select", "input"], attrs={"name": re.compile(r"filter|sort|type")})
+            filters = soup.find_all(["select", "input"], attrs={"name": _FILTER_NAME_RE})
             if filters:
                 self.findings["filters"]["found"] = True
                 self.findings["filters"]["count"] = len(filters)
                 self.findings["filters"]["types"] = [f.get("name") for f in filters if f.get("name")]
 
             # Find document cards
-            doc_cards = soup.find_all("div", class_=re.compile(r"doc|card|item"))
+            doc_cards = soup.find_all("div", class_=_DOC_CARD_RE)
             if doc_cards:
                 self.findings["document_patterns"]["card_selector"] = doc_cards[0].get("class")
                 self.findings["document_patterns"]["count_on_page"] = len(doc_cards)
@@ -96,19 +88,16 @@ class MinfinAnalyzer:
                     if link:
                         self.findings["document_patterns"]["detail_link_pattern"] = link.get("href")
 
-                    # Look for metadata
-                    date_elem = card.find(string=re.compile(r"\d{2}\.\d{2}\.\d{4}"))
-                    if date_elem:
+                    # Look for metadata in the card text, extracted once
+                    card_text = card.get_text(" ", strip=True)
+                    if _DATE_RE.search(card_text):
                         self.findings["document_patterns"]["date_found"] = True
 
-                    number_elem = card.find(string=re.compile(r"\d{2}-\d{2}-\d{2}/\d+"))
-                    if number_elem:
+                    if _NUMBER_RE.search(card_text):
                         self.findings["document_patterns"]["number_format"] = "XX-XX-XX/XXXXX"
 
         except Exception as e:
-            error_msg = f"Error analyzing documents page: {e}"
-            logger.error(error_msg)
-            self.findings["errors"].append(error_msg)
+            self._record_error(f"Error analyzing documents page: {e}")
 
     def analyze_filters(self):
         """Analyze filter functionality."""
@@ -123,36 +112,6 @@ class MinfinAnalyzer:
 
         self.findings["filters"]["known_types"] = known_filters
 
-    def check_api_endpoints(self):
-        """Check for common API endpoints."""
-        logger.info("Checking for API endpoints...")
-
-        common_api_paths = [
-            "/api/documents",
-            "/ru/api/document",
-            "/document/api",
-            "/ajax/get-documents",
-        ]
-
-        for path in common_api_paths:
-            try:
-                url = f"{self.BASE_URL}{path}"
-                logger.info(f"Trying {url}...")
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        self.findings["api_endpoints"].append({
-                            "url": url,
-                            "status": "works",
-                            "response_structure": list(data.keys()) if isinstance(data, dict) else "array"
-                        })
-                        logger.info(f"✓ Found working API: {url}")
-                    except:
-                        pass
-            except Exception as e:
-                pass
-
     def print_findings(self):
         """Print analysis findings."""
         print("\n" + "="*70)
@@ -195,24 +154,16 @@ class MinfinAnalyzer:
         print("ANALYSIS COMPLETE")
         print("="*70 + "\n")
 
-    def save_findings(self):
-        """Save findings to JSON file."""
-        import json
-
-        output_file = Path(__file__).parent / "results" / "minfin_analysis.json"
-        output_file.parent.mkdir(exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(self.findings, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"Findings saved to {output_file}")
-
     def run(self):
         """Run complete analysis."""
         logger.info("Starting Ministry of Finance portal analysis...")
 
         self.check_api_endpoints()
-        self.analyze_documents_page()
+
+        # The documents page is fetched and parsed once, then shared
+        soup = self._load_soup(f"{self.BASE_URL}/ru/document/", _DOCUMENTS_PAGE_TAGS)
+        if soup is not None:
+            self.analyze_documents_page(soup)
         self.analyze_filters()
 
         self.print_findings()
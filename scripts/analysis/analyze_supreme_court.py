@@ -17,12 +17,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 import re
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+
+from portal_analyzer import PortalAnalyzer, parse_html
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,97 +33,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import and reused across pages
+_DOC_LINK_RE = re.compile(r"/documents/\d+")
+_OWN_DOC_LINK_RE = re.compile(r"/documents/own/\d+")
+_PAGINATION_RE = re.compile(r"page")
+_MAIN_CONTAINER_RE = re.compile(r"content|documents|items")
+_PDF_LINK_RE = re.compile(r"\.pdf")
+_CONTENT_CLASS_RE = re.compile(r"content|text|document")
+
+# Only these tags (and their subtrees) are needed from each kind of page
+_LISTING_TAGS = ["script", "a", "div"]
+_DETAIL_TAGS = ["h1", "a", "div"]
 
-class SupremeCourtAnalyzer:
+
+class SupremeCourtAnalyzer(PortalAnalyzer):
     """Analyze Supreme Court portal structure."""
 
     BASE_URL = "https://vsrf.gov.ru"
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
-        self.findings = {
-            "portal": "Supreme Court (vsrf.gov.ru)",
-            "timestamp": datetime.now().isoformat(),
-            "api_endpoints": [],
-            "html_structure": {},
-            "document_patterns": {},
-            "pagination": {},
-            "errors": []
-        }
-
-    def analyze_main_page(self):
-        """Analyze the main documents page."""
-        logger.info("Analyzing main documents page...")
+    PORTAL = "Supreme Court (vsrf.gov.ru)"
+    API_PATHS = (
+        "/api/documents",
+        "/api/v1/documents",
+        "/api/v2/documents",
+        "/json/documents",
+        "/ajax/documents",
+    )
+    FINDINGS_SECTIONS = ("document_patterns", "pagination")
+    RESULTS_FILE = "supreme_court_analysis.json"
+
+    async def _fetch_page(self, client: aiohttp.ClientSession, url: str) -> str:
+        """Fetch a page's HTML asynchronously, sharing the synchronous page cache."""
+        if url not in self._page_cache:
+            logger.info(f"Fetching {url}...")
+            async with client.get(url) as response:
+                response.raise_for_status()
+                self._page_cache[url] = await response.text()
+        return self._page_cache[url]
+
+    async def _fetch_soup(self, client: aiohttp.ClientSession, url: str) -> "BeautifulSoup":
+        """Fetch and parse a page, parsing off the event loop."""
+        html = await self._fetch_page(client, url)
+        # Parsing is CPU-bound; a worker thread keeps the loop free to drain
+        # the other responses while this page is parsed
+        return await asyncio.to_thread(parse_html, html, _LISTING_TAGS)
+
+    async def _fetch_listing_soups(self, urls: List[str]) -> List[Any]:
+        """Fetch and parse the listing pages concurrently."""
+        connect_timeout, read_timeout = self.PAGE_TIMEOUT
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        async with aiohttp.ClientSession(
+            headers=dict(self.session.headers),
+            timeout=timeout
+        ) as client:
+            return await asyncio.gather(
+                *[self._fetch_soup(client, url) for url in urls],
+                return_exceptions=True
+            )
+
+    def fetch_listing_pages(self) -> Dict[str, "BeautifulSoup"]:
+        """Fetch and parse each listing page once, keyed by URL."""
+        logger.info("Fetching documents listing pages...")
 
         urls = [
             f"{self.BASE_URL}/documents/own/",  # Plenary resolutions
             f"{self.BASE_URL}/documents/practice/",  # Practice reviews
         ]
 
-        for url in urls:
-            try:
-                logger.info(f"Fetching {url}...")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
+        listings = {}
+        for url, soup in zip(urls, asyncio.run(self._fetch_listing_soups(urls))):
+            if isinstance(soup, Exception):
+                self._record_error(f"Error analyzing {url}: {soup}")
+            else:
+                listings[url] = soup
+        return listings
 
-                # Analyze HTML structure
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Look for API calls in scripts
-                scripts = soup.find_all("script")
-                for script in scripts:
-                    if script.string:
-                        # Look for API endpoints in JavaScript
-                        api_patterns = re.findall(
-                            r'["\']https?://[^"\']*(?:api|ajax|json)["\']',
-                            script.string
-                        )
-                        for pattern in api_patterns:
-                            if pattern not in self.findings["api_endpoints"]:
-                                self.findings["api_endpoints"].append(pattern)
-
-                # Find document links
-                doc_links = soup.find_all("a", href=re.compile(r"/documents/\d+"))
-                if doc_links:
-                    self.findings["document_patterns"]["link_pattern"] = doc_links[0].get("href")
-                    self.findings["document_patterns"]["count_on_page"] = len(doc_links)
-
-                # Look for pagination
-                pagination = soup.find_all("a", href=re.compile(r"page"))
-                if pagination:
-                    self.findings["pagination"]["found"] = True
-                    self.findings["pagination"]["selector"] = "a[href*='page']"
-
-                # Analyze main content container
-                content_div = soup.find("div", class_=re.compile(r"content|documents|items"))
-                if content_div:
-                    self.findings["html_structure"]["main_container"] = content_div.get("class")
-
-            except Exception as e:
-                error_msg = f"Error analyzing {url}: {e}"
-                logger.error(error_msg)
-                self.findings["errors"].append(error_msg)
-
-    def analyze_document_page(self):
-        """Analyze a specific document detail page."""
-        logger.info("Analyzing document detail page...")
+    def analyze_main_page(self, url: str, soup: "BeautifulSoup"):
+        """Analyze a parsed documents listing page."""
+        logger.info(f"Analyzing documents listing {url}...")
 
-        # Try to find a document ID from the main page
         try:
-            response = self.session.get(f"{self.BASE_URL}/documents/own/", timeout=30)
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Look for API calls in scripts
+            self._scan_scripts(soup)
+
+            # Find document links
+            doc_links = soup.find_all("a", href=_DOC_LINK_RE)
+            if doc_links:
+                self.findings["document_patterns"]["link_pattern"] = doc_links[0].get("href")
+                self.findings["document_patterns"]["count_on_page"] = len(doc_links)
+
+            # Look for pagination
+            pagination = soup.find_all("a", href=_PAGINATION_RE)
+            if pagination:
+                self.findings["pagination"]["found"] = True
+                self.findings["pagination"]["selector"] = "a[href*='page']"
+
+            # Analyze main content container
+            content_div = soup.find("div", class_=_MAIN_CONTAINER_RE)
+            if content_div:
+                self.findings["html_structure"]["main_container"] = content_div.get("class")
 
+        except Exception as e:
+            self._record_error(f"Error analyzing {url}: {e}")
+
+    def analyze_document_page(self, listing_soup: "BeautifulSoup"):
+        """Analyze the first document detail page linked from a parsed listing."""
+        logger.info("Analyzing document detail page...")
+
+        try:
             # Find first document link
-            doc_link = soup.find("a", href=re.compile(r"/documents/own/\d+"))
+            doc_link = listing_soup.find("a", href=_OWN_DOC_LINK_RE)
             if doc_link:
                 doc_url = f"{self.BASE_URL}{doc_link.get('href')}"
                 logger.info(f"Fetching document detail: {doc_url}")
 
-                response = self.session.get(doc_url, timeout=30)
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = parse_html(self._get(doc_url), _DETAIL_TAGS)
 
                 # Analyze document structure
                 title = soup.find("h1")
@@ -128,50 +154,17 @@ class SupremeCourtAnalyzer:
                     self.findings["html_structure"]["title_selector"] = "h1"
 
                 # Look for PDF download link
-                pdf_link = soup.find("a", href=re.compile(r"\.pdf"))
+                pdf_link = soup.find("a", href=_PDF_LINK_RE)
                 if pdf_link:
                     self.findings["document_patterns"]["pdf_link_pattern"] = pdf_link.get("href")
 
                 # Look for document content
-                content = soup.find("div", class_=re.compile(r"content|text|document"))
+                content = soup.find("div", class_=_CONTENT_CLASS_RE)
                 if content:
                     self.findings["html_structure"]["content_selector"] = content.get("class")
 
         except Exception as e:
-            error_msg = f"Error analyzing document page: {e}"
-            logger.error(error_msg)
-            self.findings["errors"].append(error_msg)
-
-    def check_api_endpoints(self):
-        """Check for common API endpoints."""
-        logger.info("Checking for API endpoints...")
-
-        common_api_paths = [
-            "/api/documents",
-            "/api/v1/documents",
-            "/api/v2/documents",
-            "/json/documents",
-            "/ajax/documents",
-        ]
-
-        for path in common_api_paths:
-            try:
-                url = f"{self.BASE_URL}{path}"
-                logger.info(f"Trying {url}...")
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        self.findings["api_endpoints"].append({
-                            "url": url,
-                            "status": "works",
-                            "response_structure": list(data.keys()) if isinstance(data, dict) else "array"
-                        })
-                        logger.info(f"✓ Found working API: {url}")
-                    except:
-                        pass
-            except Exception as e:
-                pass
+            self._record_error(f"Error analyzing document page: {e}")
 
     def print_findings(self):
         """Print analysis findings."""
@@ -223,25 +216,20 @@ class SupremeCourtAnalyzer:
         print("ANALYSIS COMPLETE")
         print("="*70 + "\n")
 
-    def save_findings(self):
-        """Save findings to JSON file."""
-        import json
-
-        output_file = Path(__file__).parent / "results" / "supreme_court_analysis.json"
-        output_file.parent.mkdir(exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(self.findings, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"Findings saved to {output_file}")
-
     def run(self):
         """Run complete analysis."""
         logger.info("Starting Supreme Court portal analysis...")
 
         self.check_api_endpoints()
-        self.analyze_main_page()
-        self.analyze_document_page()
+
+        # Each listing page is fetched and parsed once, then shared
+        listings = self.fetch_listing_pages()
+        for url, soup in listings.items():
+            self.analyze_main_page(url, soup)
+
+        own_soup = listings.get(f"{self.BASE_URL}/documents/own/")
+        if own_soup is not None:
+            self.analyze_document_page(own_soup)
 
         self.print_findings()
         self.save_findings()
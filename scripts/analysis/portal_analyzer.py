@@ -0,0 +1,230 @@
+"""
+Shared plumbing for the Phase 7C portal analysis scripts.
+
+Each portal analyzer subclasses PortalAnalyzer and supplies its base URL,
+candidate API paths and page-specific analysis; page fetching and caching,
+inline-script scanning, API probing and saving findings live here.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    logger.info("lxml not available, falling back to html.parser")
+
+# libxml2-backed parser is roughly an order of magnitude faster than html.parser
+HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Single scan over inline JS; dispatch on the named group that matched
+JS_SCAN_RE = re.compile(
+    r'(?P<api>["\']https?://[^"\']*(?:api|ajax|json)["\'])'
+    r'|(?P<date>\d{2}\.\d{2}\.\d{4})'
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def parse_html(html: str, only: Optional[List[str]] = None) -> "BeautifulSoup":
+    """
+    Parse HTML, importing BeautifulSoup on first use to keep startup cheap.
+
+    If ``only`` is given, the parser skips everything except those tags and
+    their subtrees.
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    parse_only = SoupStrainer(only) if only else None
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+
+def create_session(pool_connections: int = 8, pool_maxsize: int = 16) -> requests.Session:
+    """
+    Create a pooled HTTP session that retries transient failures with backoff.
+
+    The User-Agent is set here, once, so a session shared between analyzer
+    threads is never mutated after creation.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",)
+    )
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    })
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class PortalAnalyzer:
+    """Base class for analyzing a portal's structure and API availability."""
+
+    BASE_URL: str = ""
+    # Human-readable portal name recorded in the findings
+    PORTAL: str = ""
+    # Candidate API paths probed under BASE_URL
+    API_PATHS: Tuple[str, ...] = ()
+    # Portal-specific findings sections, kept between the common ones
+    FINDINGS_SECTIONS: Tuple[str, ...] = ()
+    # File under results/ the findings are saved to
+    RESULTS_FILE: str = ""
+    JS_SCAN_RE = JS_SCAN_RE
+
+    # (connect, read) timeouts: fail fast on unreachable hosts, allow slow pages
+    PAGE_TIMEOUT = (3.05, 20)
+    PROBE_TIMEOUT = (3.05, 10)
+    # Probes share a couple of keep-alive connections instead of one per path
+    PROBE_CONNECTIONS = 2
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session if session is not None else create_session()
+        self.findings: Dict[str, Any] = {
+            "portal": self.PORTAL,
+            "timestamp": datetime.now().isoformat(),
+            "api_endpoints": [],
+            "html_structure": {},
+            **{section: {} for section in self.FINDINGS_SECTIONS},
+            "errors": []
+        }
+        self._page_cache: Dict[str, str] = {}
+        # Mirrors the string entries of findings["api_endpoints"] for O(1) dedup
+        self._api_seen: set[str] = set()
+        # Probe URLs that came back 404/410 during this analysis
+        self._known_missing_urls: set[str] = set()
+
+    def _record_error(self, error_msg: str):
+        """Log an error and keep it in the findings."""
+        logger.error(error_msg)
+        self.findings["errors"].append(error_msg)
+
+    def _get(self, url: str) -> str:
+        """Fetch a page's HTML, reusing the cached copy if already fetched."""
+        if url not in self._page_cache:
+            logger.info(f"Fetching {url}...")
+            response = self.session.get(url, timeout=self.PAGE_TIMEOUT)
+            response.raise_for_status()
+            self._page_cache[url] = response.text
+        return self._page_cache[url]
+
+    def _load_soup(self, url: str, only: Optional[List[str]] = None) -> Optional["BeautifulSoup"]:
+        """Fetch and parse a page once, recording an error if that fails."""
+        try:
+            return parse_html(self._get(url), only)
+        except Exception as e:
+            self._record_error(f"Error fetching {url}: {e}")
+            return None
+
+    def _scan_scripts(self, soup: "BeautifulSoup"):
+        """Scan inline scripts for API endpoints and embedded dates in one pass."""
+        for script in soup.find_all("script"):
+            if not script.string:
+                continue
+
+            for match in self.JS_SCAN_RE.finditer(script.string):
+                if match.lastgroup == "api":
+                    endpoint = match.group("api")
+                    if endpoint not in self._api_seen:
+                        self._api_seen.add(endpoint)
+                        self.findings["api_endpoints"].append(endpoint)
+                elif match.lastgroup == "date":
+                    # Dates embedded in JS suggest client-side rendered listings
+                    self.findings["html_structure"]["script_dates_found"] = True
+
+    async def _probe(self, client: aiohttp.ClientSession, url: str) -> Optional[Dict[str, Any]]:
+        """Probe a candidate API URL, returning its description if it serves JSON."""
+        if url in self._known_missing_urls:
+            return None
+
+        logger.info(f"Trying {url}...")
+        # HEAD first so misses don't download their HTML error pages. Only a
+        # 200 or a 404/410 is conclusive; servers that reject HEAD (405, 501,
+        # 403, ...) fall through to the GET below
+        async with client.head(url, allow_redirects=True) as head:
+            if head.status in (404, 410):
+                self._known_missing_urls.add(url)
+                return None
+            if head.status == 200 and "json" not in head.headers.get("Content-Type", ""):
+                return None
+
+        async with client.get(url) as response:
+            if response.status != 200:
+                return None
+            try:
+                data = orjson.loads(await response.read())
+            except ValueError:
+                return None
+
+        return {
+            "url": url,
+            "status": "works",
+            "response_structure": list(data.keys()) if isinstance(data, dict) else "array"
+        }
+
+    async def _probe_all(self, urls: List[str]) -> List[Any]:
+        """Probe all candidate API URLs concurrently."""
+        connect_timeout, read_timeout = self.PROBE_TIMEOUT
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        # All probes target one origin: cap per-host connections so they reuse
+        # the same TLS sessions, and resolve the host only once
+        connector = aiohttp.TCPConnector(limit_per_host=self.PROBE_CONNECTIONS, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=timeout
+        ) as client:
+            return await asyncio.gather(
+                *[self._probe(client, url) for url in urls],
+                return_exceptions=True
+            )
+
+    def check_api_endpoints(self):
+        """Check for common API endpoints."""
+        logger.info("Checking for API endpoints...")
+
+        # Probes are independent, so issue them concurrently instead of paying
+        # one round trip per candidate path
+        urls = [f"{self.BASE_URL}{path}" for path in self.API_PATHS]
+        results = asyncio.run(self._probe_all(urls))
+
+        for result in results:
+            if isinstance(result, dict):
+                self.findings["api_endpoints"].append(result)
+                logger.info(f"✓ Found working API: {result['url']}")
+
+    def save_findings(self):
+        """Save findings to JSON file."""
+        output_file = RESULTS_DIR / self.RESULTS_FILE
+        output_file.parent.mkdir(exist_ok=True)
+
+        # orjson serializes straight to UTF-8 bytes (non-ASCII kept as-is)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(self.findings, option=orjson.OPT_INDENT_2))
+
+        logger.info(f"Findings saved to {output_file}")
@@ -18,15 +18,19 @@ Usage:
 """
 
 import re
-from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, List, Sequence, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArticleNumber:
     """
     Represents a structured article number with base, insertion, and subdivision.
 
+    Instances are immutable, so parsed results can be cached and shared.
+    Equality and hashing come from the dataclass and cover all three fields.
+
     Attributes:
         base: The main article number (e.g., "25" in "25.12-1")
         insertion: Optional insertion point after decimal (e.g., "12" in "25.12-1")
@@ -35,94 +39,63 @@ class ArticleNumber:
     base: int
     insertion: Optional[int] = None
     subdivision: Optional[int] = None
+    # Ordering key, computed once: a missing part (-1) sorts before any number
+    _sort_key: Tuple[int, int, int] = field(init=False, repr=False, compare=False)
+    # String forms from the base down to the full number, e.g. ("25", "25.12", "25.12-1")
+    _hierarchy: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_sort_key', (
+            self.base,
+            -1 if self.insertion is None else self.insertion,
+            -1 if self.subdivision is None else self.subdivision,
+        ))
+
+        hierarchy = [str(self.base)]
+        if self.insertion is not None:
+            hierarchy.append(f"{self.base}.{self.insertion}")
+        if self.subdivision is not None:
+            hierarchy.append(f"{hierarchy[-1]}-{self.subdivision}")
+        object.__setattr__(self, '_hierarchy', tuple(hierarchy))
 
     def __str__(self) -> str:
         """Convert article number to standard string representation."""
-        result = str(self.base)
-        if self.insertion is not None:
-            result += f".{self.insertion}"
-        if self.subdivision is not None:
-            result += f"-{self.subdivision}"
-        return result
+        return self._hierarchy[-1]
 
     def __repr__(self) -> str:
         """Return detailed representation for debugging."""
         return f"ArticleNumber(base={self.base}, insertion={self.insertion}, subdivision={self.subdivision})"
 
-    def __eq__(self, other) -> bool:
-        """Check equality based on all components."""
-        if not isinstance(other, ArticleNumber):
-            return False
-        return (self.base == other.base and
-                self.insertion == other.insertion and
-                self.subdivision == other.subdivision)
-
-    def __hash__(self) -> int:
-        """Return hash for use in sets and dicts."""
-        return hash((self.base, self.insertion, self.subdivision))
-
     def __lt__(self, other) -> bool:
-        """Compare article numbers for less-than (for sorting)."""
-        if not isinstance(other, ArticleNumber):
-            return NotImplemented
-        # Compare base first
-        if self.base != other.base:
-            # When comparing across different bases, if either has an insertion,
-            # compare as decimal values (e.g., "23.1" vs "230" -> 23.1 vs 230)
-            if self.insertion is not None or other.insertion is not None:
-                self_val = self._to_decimal_value()
-                other_val = other._to_decimal_value()
-                return self_val < other_val
-            return self.base < other.base
-        # If base equal, compare insertion (None < 1 < 2, etc.)
-        if self.insertion != other.insertion:
-            if self.insertion is None:
-                return True  # No insertion comes before having insertion
-            if other.insertion is None:
-                return False
-            return self.insertion < other.insertion
-        # If insertion equal, compare subdivision
-        if self.subdivision != other.subdivision:
-            if self.subdivision is None:
-                return True
-            if other.subdivision is None:
-                return False
-            return self.subdivision < other.subdivision
-        return False  # Equal
-
-    def _to_decimal_value(self) -> float:
         """
-        Convert article number to decimal value for cross-base comparison.
+        Compare article numbers for less-than (for sorting).
 
-        Articles with insertions are treated as decimals (e.g., "23.1" -> 23.1).
-        This allows proper comparison like "230 < 23.1 < 232".
-
-        Returns:
-            Float value representing the article number
+        Orders by base, then insertion, then subdivision, with a missing part
+        before any number: 23 < 23-1 < 23.1 < 23.1-1 < 23.2 < 230. Across
+        different bases this agrees with reading "23.1" as the decimal 23.1,
+        since an insertion never reaches the next integer.
         """
-        if self.insertion is not None:
-            # Convert insertion to decimal (e.g., 1 -> 0.1, 12 -> 0.12, 123 -> 0.123)
-            insertion_decimal = self.insertion / (10 ** len(str(self.insertion)))
-            return float(self.base) + insertion_decimal
-        return float(self.base)
+        if not isinstance(other, ArticleNumber):
+            return NotImplemented
+        return self._sort_key < other._sort_key
 
     def __le__(self, other) -> bool:
         """Compare article numbers for less-than-or-equal."""
         if not isinstance(other, ArticleNumber):
             return NotImplemented
-        return self == other or self < other
+        return self._sort_key <= other._sort_key
 
     def __gt__(self, other) -> bool:
         """Compare article numbers for greater-than."""
         if not isinstance(other, ArticleNumber):
             return NotImplemented
-        return not self <= other
+        return self._sort_key > other._sort_key
 
     def __ge__(self, other) -> bool:
         """Compare article numbers for greater-than-or-equal."""
         if not isinstance(other, ArticleNumber):
             return NotImplemented
-        return not self < other
+        return self._sort_key >= other._sort_key
 
     def to_float_for_comparison(self) -> float:
         """
@@ -137,6 +110,80 @@ class ArticleNumber:
         return float(self.base)
 
 
+# Base, optional ".insertion", optional "-subdivision"
+_ARTICLE_NUMBER_RE = re.compile(r'^(\d+)(?:\.(\d+))?(?:-(\d+))?$')
+
+
+def _scan_article_number(article_str: str) -> Optional[ArticleNumber]:
+    """
+    Parse the common ASCII forms ("25", "25.12", "25-1", "25.12-1") without regex.
+
+    Splits on the separators with str.partition and checks each part with
+    str.isdigit, all of which run in C. Returns None for anything else, in
+    which case the caller falls back to the regex.
+    """
+    if not article_str.isascii():
+        return None
+
+    head, dash, subdivision = article_str.partition('-')
+    base, dot, insertion = head.partition('.')
+
+    if not base.isdigit():
+        return None
+    if dot and not insertion.isdigit():
+        return None
+    if dash and not subdivision.isdigit():
+        return None
+
+    return ArticleNumber(
+        base=int(base),
+        insertion=int(insertion) if dot else None,
+        subdivision=int(subdivision) if dash else None,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(article_str: str) -> ArticleNumber:
+    """
+    Parse an article number, memoized per input string.
+
+    Documents cite the same article numbers over and over, so most calls are
+    cache hits. Failures raise ValueError and are not cached. Clear with
+    _parse_cached.cache_clear().
+    """
+    parsed = _scan_article_number(article_str)
+    if parsed is not None:
+        return parsed
+
+    # Rare forms (non-ASCII digits, trailing newline) and errors
+    match = _ARTICLE_NUMBER_RE.match(article_str)
+    if not match:
+        raise ValueError(f"Invalid article number format: '{article_str}'")
+
+    base = int(match.group(1))
+    insertion = int(match.group(2)) if match.group(2) else None
+    subdivision = int(match.group(3)) if match.group(3) else None
+
+    return ArticleNumber(base=base, insertion=insertion, subdivision=subdivision)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(article_str: str) -> str:
+    """Canonical string form of an article number, memoized per input string."""
+    return str(_parse_cached(article_str))
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_cached(article_str: str) -> bool:
+    """
+    Check an article number against the pattern, memoized per input string.
+
+    Unlike _parse_cached, invalid inputs are cached too, and no ArticleNumber
+    is built or exception raised for them.
+    """
+    return _ARTICLE_NUMBER_RE.match(article_str) is not None
+
+
 class ArticleNumberParser:
     r"""
     Complete article number parser with error handling.
@@ -152,7 +199,7 @@ class ArticleNumberParser:
 
     def __init__(self):
         """Initialize the parser with the article number regex pattern."""
-        self.pattern = re.compile(r'^(\d+)(?:\.(\d+))?(?:-(\d+))?$')
+        self.pattern = _ARTICLE_NUMBER_RE
 
     def parse(self, article_str: str) -> ArticleNumber:
         """
@@ -176,15 +223,7 @@ class ArticleNumberParser:
             >>> parser.parse("25.12-1")
             ArticleNumber(base=25, insertion=12, subdivision=1)
         """
-        match = self.pattern.match(article_str)
-        if not match:
-            raise ValueError(f"Invalid article number format: '{article_str}'")
-
-        base = int(match.group(1))
-        insertion = int(match.group(2)) if match.group(2) else None
-        subdivision = int(match.group(3)) if match.group(3) else None
-
-        return ArticleNumber(base=base, insertion=insertion, subdivision=subdivision)
+        return _parse_cached(article_str)
 
     def parse_bulk(
         self, article_list: List[str]
@@ -214,11 +253,12 @@ class ArticleNumberParser:
         """
         successes = []
         failures = []
+        # Call the memoized parser directly; repeated numbers are cache hits
+        parse = _parse_cached
 
         for article_str in article_list:
             try:
-                parsed = self.parse(article_str)
-                successes.append(parsed)
+                successes.append(parse(article_str))
             except ValueError as e:
                 failures.append((article_str, str(e)))
 
@@ -248,8 +288,7 @@ class ArticleNumberParser:
             >>> parser.normalize("025")
             '25'
         """
-        parsed = self.parse(article_str)
-        return str(parsed)
+        return _normalize_cached(article_str)
 
     def get_hierarchy(self, article_str: str) -> List[str]:
         """
@@ -276,16 +315,41 @@ class ArticleNumberParser:
             >>> parser.get_hierarchy("25")
             ['25']
         """
-        parsed = self.parse(article_str)
-        hierarchy = [str(parsed.base)]
+        return list(self.parse(article_str)._hierarchy)
 
-        if parsed.insertion is not None:
-            hierarchy.append(f"{parsed.base}.{parsed.insertion}")
+    @staticmethod
+    def keys_array(articles: Sequence[ArticleNumber]):
+        """
+        Sort keys of many article numbers as an (N, 3) int64 NumPy array.
+
+        Each row is (base, insertion, subdivision) with -1 for a missing part,
+        the same key ArticleNumber comparisons use, so sorting the rows
+        lexicographically in NumPy gives the order sorted() would, without a
+        Python-level comparison per pair.
 
-        if parsed.subdivision is not None:
-            hierarchy.append(str(parsed))
+        Args:
+            articles: Parsed article numbers
+
+        Returns:
+            numpy.ndarray of shape (len(articles), 3)
+
+        Examples:
+            >>> import numpy as np
+            >>> parser = ArticleNumberParser()
+            >>> articles = parser.parse_bulk(["25.1", "25", "3-1"])[0]
+            >>> keys = parser.keys_array(articles)
+            >>> order = np.lexsort(keys.T[::-1])
+            >>> [str(articles[i]) for i in order]
+            ['3-1', '25', '25.1']
+        """
+        # Imported here so parsing doesn't pay for loading NumPy
+        import numpy as np
 
-        return hierarchy
+        return np.fromiter(
+            (article._sort_key for article in articles),
+            dtype=np.dtype((np.int64, 3)),
+            count=len(articles),
+        )
 
     def is_valid(self, article_str: str) -> bool:
         """
@@ -304,15 +368,11 @@ class ArticleNumberParser:
             >>> parser.is_valid("invalid")
             False
         """
-        try:
-            self.parse(article_str)
-            return True
-        except ValueError:
-            return False
+        return _is_valid_cached(article_str)
 
 
-# Singleton instance for convenience
-_default_parser = None
+# Singleton instance for convenience; the parser is stateless
+_default_parser = ArticleNumberParser()
 
 
 def parse_article_number(article_str: str) -> ArticleNumber:
@@ -328,9 +388,6 @@ def parse_article_number(article_str: str) -> ArticleNumber:
     Raises:
         ValueError: If the article number format is invalid
     """
-    global _default_parser
-    if _default_parser is None:
-        _default_parser = ArticleNumberParser()
     return _default_parser.parse(article_str)
 
 
@@ -347,7 +404,4 @@ def normalize_article_number(article_str: str) -> str:
     Raises:
         ValueError: If the article number format is invalid
     """
-    global _default_parser
-    if _default_parser is None:
-        _default_parser = ArticleNumberParser()
     return _default_parser.normalize(article_str)
@@ -4,34 +4,176 @@ Centralized configuration based on ygbis patterns
 """
 
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Mapping
 
-# Load from .env file with UTF-8 encoding (Windows compatibility)
-env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path, encoding="utf-8")
+# Load from .env file with UTF-8 encoding (Windows compatibility).
+# Set LAW7_SKIP_DOTENV=1 where the environment is injected (e.g. containers)
+# to skip the file entirely; python-dotenv is only imported when it is read.
+if os.environ.get("LAW7_SKIP_DOTENV") != "1":
+    env_path = Path(__file__).parent.parent.parent / ".env"
+    if env_path.exists():
+        from dotenv import load_dotenv
+
+        load_dotenv(dotenv_path=env_path, encoding="utf-8")
+
+
+def _env_int(env: Mapping[str, str], key: str, default: str) -> int:
+    """Read an integer setting."""
+    return int(env.get(key, default))
+
+
+def _env_bool(env: Mapping[str, str], key: str, default: str) -> bool:
+    """Read a boolean setting ("true", case-insensitive, is true)."""
+    return env.get(key, default).lower() == "true"
+
+
+# Configuration class for type safety
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Configuration class for type-safe access to settings."""
+
+    # Database
+    db_user: str
+    db_password: str = field(repr=False)
+    db_host: str
+    db_port: int
+    db_name: str
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_recycle: int
+    db_pool_timeout: int
+
+    # Pravo.gov.ru API
+    pravo_api_base_url: str
+    pravo_api_timeout: int
+    pravo_max_retries: int
+
+    # Retry (from ygbis pattern)
+    backoff_base_delay: int
+    backoff_multiplier: int
+    backoff_max_delay: int
+
+    # Import / Web Scraping
+    import_request_delay: int
+    amendment_import_request_delay: int
+    import_request_timeout: int
+    import_max_pages: int
+    use_selenium: bool
+
+    # Qdrant
+    qdrant_url: str
+    qdrant_collection: str
+    qdrant_vector_size: int
+
+    # Sync
+    sync_batch_size: int
+    daily_sync_time: str
+    amendment_batch_size: int
+    initial_sync_start_date: str
+    initial_sync_block: str
+
+    # Embeddings
+    embedding_model: str
+    embedding_device: str
+    embedding_batch_size: int
+
+    # Logging
+    log_level: str
+    log_format: str
+
+    # Progress
+    progress_bar_enabled: bool
+
+    # Derived settings
+    database_url: str = field(init=False, repr=False)
+    http_timeout: int = field(init=False)  # Alias for import_request_timeout
+    batch_size: int = field(init=False)  # Alias for sync_batch_size
+
+    def __post_init__(self):
+        database_url = (
+            f"postgresql://{self.db_user}:{self.db_password}"
+            f"@{self.db_host}:{self.db_port}/{self.db_name}"
+        )
+        object.__setattr__(self, "database_url", database_url)
+        object.__setattr__(self, "http_timeout", self.import_request_timeout)
+        object.__setattr__(self, "batch_size", self.sync_batch_size)
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "Config":
+        """Build the configuration from environment variables, with defaults."""
+        return cls(
+            db_user=env.get("DB_USER", "law7"),
+            db_password=env.get("DB_PASSWORD", ""),
+            db_host=env.get("DB_HOST", "localhost"),
+            db_port=_env_int(env, "DB_PORT", "5433"),
+            db_name=env.get("DB_NAME", "law7"),
+            db_pool_size=_env_int(env, "DB_POOL_SIZE", "20"),
+            db_max_overflow=_env_int(env, "DB_MAX_OVERFLOW", "40"),
+            db_pool_recycle=_env_int(env, "DB_POOL_RECYCLE", "1800"),  # 30 minutes
+            db_pool_timeout=_env_int(env, "DB_POOL_TIMEOUT", "30"),  # 30 seconds
+            pravo_api_base_url=env.get("PRAVO_API_BASE_URL", "http://publication.pravo.gov.ru/api"),
+            pravo_api_timeout=_env_int(env, "PRAVO_API_TIMEOUT", "30"),
+            pravo_max_retries=_env_int(env, "PRAVO_MAX_RETRIES", "3"),
+            backoff_base_delay=_env_int(env, "BACKOFF_BASE_DELAY", "1"),  # 1 second
+            backoff_multiplier=_env_int(env, "BACKOFF_MULTIPLIER", "2"),
+            backoff_max_delay=_env_int(env, "BACKOFF_MAX_DELAY", "60"),  # 60 seconds
+            import_request_delay=_env_int(env, "IMPORT_REQUEST_DELAY", "2"),
+            amendment_import_request_delay=_env_int(env, "AMENDMENT_IMPORT_REQUEST_DELAY", "10"),
+            import_request_timeout=_env_int(env, "IMPORT_REQUEST_TIMEOUT", "30"),
+            import_max_pages=_env_int(env, "IMPORT_MAX_PAGES", "500"),
+            use_selenium=_env_bool(env, "USE_SELENIUM", "true"),
+            qdrant_url=env.get("QDRANT_URL", "http://localhost:6333"),
+            qdrant_collection=env.get("QDRANT_COLLECTION", "law_chunks"),
+            qdrant_vector_size=_env_int(env, "QDRANT_VECTOR_SIZE", "1024"),
+            sync_batch_size=_env_int(env, "SYNC_BATCH_SIZE", "30"),
+            daily_sync_time=env.get("DAILY_SYNC_TIME", "02:00"),
+            amendment_batch_size=_env_int(env, "AMENDMENT_BATCH_SIZE", "20"),
+            initial_sync_start_date=env.get("INITIAL_SYNC_START_DATE", "2020-01-01"),
+            initial_sync_block=env.get("INITIAL_SYNC_BLOCK", "all"),
+            embedding_model=env.get(
+                "EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+            ),
+            embedding_device=env.get("EMBEDDING_DEVICE", "cpu"),
+            embedding_batch_size=_env_int(env, "EMBEDDING_BATCH_SIZE", "32"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            log_format=env.get("LOG_FORMAT", "text"),
+            progress_bar_enabled=_env_bool(env, "PROGRESS_BAR_ENABLED", "true"),
+        )
+
+
+# Export configuration instance; the environment is read once, here
+config = Config.from_env(os.environ.copy())
 
 # =============================================================================
 # Database Configuration
 # =============================================================================
-DB_USER = os.getenv("DB_USER", "law7")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "")
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", "5433"))
-DB_NAME = os.getenv("DB_NAME", "law7")
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DB_USER = config.db_user
+DB_PASSWORD = config.db_password
+DB_HOST = config.db_host
+DB_PORT = config.db_port
+DB_NAME = config.db_name
+DATABASE_URL = config.database_url
+
+# Connection pool: parallel workers share it, and connections older than
+# DB_POOL_RECYCLE seconds are replaced before the server drops them as idle
+DB_POOL_SIZE = config.db_pool_size
+DB_MAX_OVERFLOW = config.db_max_overflow
+DB_POOL_RECYCLE = config.db_pool_recycle
+DB_POOL_TIMEOUT = config.db_pool_timeout
 
 # =============================================================================
 # Pravo.gov.ru API Configuration
 # =============================================================================
-PRAVO_API_BASE_URL = os.getenv("PRAVO_API_BASE_URL", "http://publication.pravo.gov.ru/api")
-PRAVO_API_TIMEOUT = int(os.getenv("PRAVO_API_TIMEOUT", "30"))
-PRAVO_MAX_RETRIES = int(os.getenv("PRAVO_MAX_RETRIES", "3"))
+PRAVO_API_BASE_URL = config.pravo_api_base_url
+PRAVO_API_TIMEOUT = config.pravo_api_timeout
+PRAVO_MAX_RETRIES = config.pravo_max_retries
 
 # Retry configuration (from ygbis pattern)
-BACKOFF_BASE_DELAY = int(os.getenv("BACKOFF_BASE_DELAY", "1"))  # 1 second
-BACKOFF_MULTIPLIER = int(os.getenv("BACKOFF_MULTIPLIER", "2"))
-BACKOFF_MAX_DELAY = int(os.getenv("BACKOFF_MAX_DELAY", "60"))  # 60 seconds
+BACKOFF_BASE_DELAY = config.backoff_base_delay
+BACKOFF_MULTIPLIER = config.backoff_multiplier
+BACKOFF_MAX_DELAY = config.backoff_max_delay
 
 # =============================================================================
 # Import / Web Scraping Configuration
@@ -39,66 +181,62 @@ BACKOFF_MAX_DELAY = int(os.getenv("BACKOFF_MAX_DELAY", "60"))  # 60 seconds
 # Delay between requests to avoid rate limiting (in seconds)
 # Higher values = more polite to servers, slower imports
 # Recommended: 1-3 seconds for testing, 10-30 seconds for production
-IMPORT_REQUEST_DELAY = int(os.getenv("IMPORT_REQUEST_DELAY", "2"))
+IMPORT_REQUEST_DELAY = config.import_request_delay
 
 # Delay for amendment content fetching (in seconds)
 # Amendments need longer delays to avoid rate limiting from pravo.gov.ru
-AMENDMENT_IMPORT_REQUEST_DELAY = int(os.getenv("AMENDMENT_IMPORT_REQUEST_DELAY", "10"))
+AMENDMENT_IMPORT_REQUEST_DELAY = config.amendment_import_request_delay
 
 # Timeout for web requests (in seconds)
-IMPORT_REQUEST_TIMEOUT = int(os.getenv("IMPORT_REQUEST_TIMEOUT", "30"))
+IMPORT_REQUEST_TIMEOUT = config.import_request_timeout
 
 # Maximum pages to fetch from kremlin.ru/government.ru per code
 # Safety limit to prevent infinite loops if site doesn't return 404
-IMPORT_MAX_PAGES = int(os.getenv("IMPORT_MAX_PAGES", "500"))
+IMPORT_MAX_PAGES = config.import_max_pages
 
 # Use Selenium WebDriver for full document content extraction (enabled by default)
 # This allows fetching documents that load content dynamically via JavaScript
 # Set to false to use only API metadata (faster, but incomplete content)
-USE_SELENIUM = os.getenv("USE_SELENIUM", "true").lower() == "true"
+USE_SELENIUM = config.use_selenium
 
 # =============================================================================
 # Qdrant Configuration
 # =============================================================================
-QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
-QDRANT_COLLECTION = os.getenv("QDRANT_COLLECTION", "law_chunks")
-QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", "1024"))
+QDRANT_URL = config.qdrant_url
+QDRANT_COLLECTION = config.qdrant_collection
+QDRANT_VECTOR_SIZE = config.qdrant_vector_size
 
 # =============================================================================
 # Sync Configuration
 # =============================================================================
 # Note: pravo.gov.ru API has max pageSize of 30 for Documents endpoint
-SYNC_BATCH_SIZE = int(os.getenv("SYNC_BATCH_SIZE", "30"))
-DAILY_SYNC_TIME = os.getenv("DAILY_SYNC_TIME", "02:00")
+SYNC_BATCH_SIZE = config.sync_batch_size
+DAILY_SYNC_TIME = config.daily_sync_time
 
 # Batch size for amendment content database updates
-AMENDMENT_BATCH_SIZE = int(os.getenv("AMENDMENT_BATCH_SIZE", "20"))
+AMENDMENT_BATCH_SIZE = config.amendment_batch_size
 
 # Initial sync settings
-INITIAL_SYNC_START_DATE = os.getenv("INITIAL_SYNC_START_DATE", "2020-01-01")
-INITIAL_SYNC_BLOCK = os.getenv(
-    "INITIAL_SYNC_BLOCK", "all"
-)  # 'all', 'president', 'government', etc.
+INITIAL_SYNC_START_DATE = config.initial_sync_start_date
+INITIAL_SYNC_BLOCK = config.initial_sync_block  # 'all', 'president', 'government', etc.
 
 # =============================================================================
 # Embedding Configuration
 # =============================================================================
-EMBEDDING_MODEL = os.getenv(
-    "EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
-)
-EMBEDDING_DEVICE = os.getenv("EMBEDDING_DEVICE", "cpu")  # 'cpu' or 'cuda'
-EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+EMBEDDING_MODEL = config.embedding_model
+EMBEDDING_DEVICE = config.embedding_device  # 'cpu' or 'cuda'
+EMBEDDING_BATCH_SIZE = config.embedding_batch_size
 
 # =============================================================================
 # Logging Configuration
 # =============================================================================
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # 'text' or 'json'
+LOG_LEVEL = config.log_level
+LOG_FORMAT = config.log_format  # 'text' or 'json'
 
 # =============================================================================
 # Progress Bar Configuration (from ygbis pattern)
 # =============================================================================
-PROGRESS_BAR_ENABLED = os.getenv("PROGRESS_BAR_ENABLED", "true").lower() == "true"
+PROGRESS_BAR_ENABLED = config.progress_bar_enabled
 
 # =============================================================================
 # Paths
@@ -139,60 +277,6 @@ def calculate_backoff_delay(attempt: int) -> int:
     return delay
 
 
-# Configuration class for type safety
-class Config:
-    """Configuration class for type-safe access to settings."""
-
-    # Database
-    db_user: str = DB_USER
-    db_host: str = DB_HOST
-    db_port: int = DB_PORT
-    db_name: str = DB_NAME
-    database_url: str = DATABASE_URL
-
-    # Pravo.gov.ru API
-    pravo_api_base_url: str = PRAVO_API_BASE_URL
-    pravo_api_timeout: int = PRAVO_API_TIMEOUT
-    pravo_max_retries: int = PRAVO_MAX_RETRIES
-
-    # Retry
-    backoff_base_delay: int = BACKOFF_BASE_DELAY
-    backoff_multiplier: int = BACKOFF_MULTIPLIER
-    backoff_max_delay: int = BACKOFF_MAX_DELAY
-
-    # Import / Web Scraping
-    import_request_delay: int = IMPORT_REQUEST_DELAY
-    import_request_timeout: int = IMPORT_REQUEST_TIMEOUT
-    import_max_pages: int = IMPORT_MAX_PAGES
-    http_timeout: int = IMPORT_REQUEST_TIMEOUT  # Alias for import_request_timeout
-    batch_size: int = SYNC_BATCH_SIZE  # Alias for sync_batch_size
-
-    # Qdrant
-    qdrant_url: str = QDRANT_URL
-    qdrant_collection: str = QDRANT_COLLECTION
-    qdrant_vector_size: int = QDRANT_VECTOR_SIZE
-
-    # Sync
-    sync_batch_size: int = SYNC_BATCH_SIZE
-    daily_sync_time: str = DAILY_SYNC_TIME
-
-    # Embeddings
-    embedding_model: str = EMBEDDING_MODEL
-    embedding_device: str = EMBEDDING_DEVICE
-    embedding_batch_size: int = EMBEDDING_BATCH_SIZE
-
-    # Logging
-    log_level: str = LOG_LEVEL
-    log_format: str = LOG_FORMAT
-
-    # Progress
-    progress_bar_enabled: bool = PROGRESS_BAR_ENABLED
-
-
-# Export configuration instance
-config = Config()
-
-
 def get_settings() -> Config:
     """Get the configuration instance (for compatibility with existing code)."""
     return config
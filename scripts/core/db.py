@@ -4,17 +4,34 @@ Based on ygbis database patterns.
 """
 import logging
 from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.engine import Row
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
-from scripts.core.config import DATABASE_URL
+from scripts.core.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
 
 logger = logging.getLogger(__name__)
 
 # Create SQLAlchemy engine with connection pooling
-# pool_pre_ping=True verifies connections before using them
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# pool_pre_ping=True verifies connections before using them; pool sizes and
+# recycle age are tunable through the DB_POOL_* settings
+engine = create_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
+)
 
 # Session factory for ORM operations
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -71,12 +88,16 @@ def check_db_connection() -> bool:
     """
     Test database connection.
 
+    Checking a connection out of the pool is the test: a new connection has
+    just been established, and a pooled one is pinged by pool_pre_ping, so
+    no extra query is sent.
+
     Returns:
         True if connection successful, False otherwise
     """
     try:
-        with get_db_connection() as conn:
-            conn.execute(text("SELECT 1"))
+        with get_db_connection():
+            pass
         logger.info("Database connection successful")
         return True
     except Exception as e:
@@ -93,7 +114,7 @@ def execute_sql(query: str, params: dict = None) -> list:
         params: Optional query parameters
 
     Returns:
-        List of result rows
+        List of result rows (all fetched into memory; see execute_sql_iter)
 
     Example:
         results = execute_sql("SELECT * FROM documents LIMIT 10")
@@ -103,6 +124,36 @@ def execute_sql(query: str, params: dict = None) -> list:
         return result.fetchall()
 
 
+def execute_sql_iter(query: str, params: dict = None, chunk_size: int = 1000) -> Iterator[Row]:
+    """
+    Execute SQL query and stream the result rows.
+
+    Rows come from a server-side cursor, chunk_size at a time, so memory stays
+    bounded however many rows the query returns. Prefer this over execute_sql
+    for large reads in pipelines. The connection stays open until the
+    iterator is exhausted or closed.
+
+    Args:
+        query: SQL query string
+        params: Optional query parameters
+        chunk_size: Rows fetched from the server per round trip
+
+    Yields:
+        Result rows
+
+    Example:
+        for row in execute_sql_iter("SELECT id, title FROM documents"):
+            process(row)
+    """
+    with get_db_connection() as conn:
+        result = conn.execute(
+            text(query),
+            params or {},
+            execution_options={"stream_results": True, "yield_per": chunk_size},
+        )
+        yield from result
+
+
 def execute_sql_write(query: str, params: dict = None) -> int:
     """
     Execute SQL write operation (INSERT, UPDATE, DELETE).
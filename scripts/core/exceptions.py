@@ -13,8 +13,13 @@ class Law7Error(Exception):
 
     All custom exceptions in Law7 should inherit from this class
     to enable consistent error handling across the application.
+
+    Attributes live in __slots__ (each subclass lists its own), so no
+    per-instance __dict__ is created.
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: Optional[dict[str, Any]] = None):
         """
         Initialize Law7Error.
@@ -25,14 +30,37 @@ class Law7Error(Exception):
         """
         self.message = message
         self.details = details or {}
-        super().__init__(self.message)
 
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-            return f"{self.message} ({details_str})"
-        return self.message
+        # The full string (message, details and subclass context) is passed as
+        # args[0], so str() is the C-level BaseException.__str__ with no Python
+        # override. Subclasses set their attributes before calling this __init__.
+        details_str = (
+            " (" + ", ".join([f"{k}={v}" for k, v in self.details.items()]) + ")"
+            if self.details
+            else ""
+        )
+        super().__init__(" | ".join([f"{message}{details_str}", *self._context()]))
+
+    # (attribute, label) pairs shown as "label: value" when the attribute is set
+    _CONTEXT_LABELS: tuple[tuple[str, str], ...] = ()
+
+    def _context(self) -> list[str]:
+        """Return subclass-specific context appended to the string representation."""
+        return [
+            f"{label}: {value}"
+            for attr, label in self._CONTEXT_LABELS
+            if (value := getattr(self, attr))
+        ]
+
+    def __reduce__(self):
+        """Pickle slot attributes too; by default only __dict__ state is kept."""
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
 
 
 class DatabaseError(Law7Error):
@@ -42,6 +70,8 @@ class DatabaseError(Law7Error):
     Raised when database operations fail (PostgreSQL, Qdrant, Redis).
     """
 
+    __slots__ = ("original_error",)
+
     def __init__(
         self,
         message: str,
@@ -56,15 +86,14 @@ class DatabaseError(Law7Error):
             details: Optional dictionary with additional error context
             original_error: The original exception that caused this error
         """
-        super().__init__(message, details)
         self.original_error = original_error
+        super().__init__(message, details)
 
-    def __str__(self) -> str:
-        """Return string representation including original error if present."""
-        base = super().__str__()
+    def _context(self) -> list[str]:
+        """Return the original error, if present."""
         if self.original_error:
-            return f"{base} | Caused by: {type(self.original_error).__name__}: {self.original_error}"
-        return base
+            return [f"Caused by: {type(self.original_error).__name__}: {self.original_error}"]
+        return []
 
 
 class APIError(Law7Error):
@@ -74,6 +103,9 @@ class APIError(Law7Error):
     Raised when external API calls fail (pravo.gov.ru, government.ru, etc.).
     """
 
+    __slots__ = ("status_code", "url")
+    _CONTEXT_LABELS = (("status_code", "Status"), ("url", "URL"))
+
     def __init__(
         self,
         message: str,
@@ -90,19 +122,9 @@ class APIError(Law7Error):
             status_code: HTTP status code if applicable
             url: The URL that failed
         """
-        super().__init__(message, details)
         self.status_code = status_code
         self.url = url
-
-    def __str__(self) -> str:
-        """Return string representation including status code and URL if present."""
-        base = super().__str__()
-        parts = [base]
-        if self.status_code:
-            parts.append(f"Status: {self.status_code}")
-        if self.url:
-            parts.append(f"URL: {self.url}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        super().__init__(message, details)
 
 
 class ParsingError(Law7Error):
@@ -112,6 +134,9 @@ class ParsingError(Law7Error):
     Raised when document parsing fails (HTML, PDF, OCR).
     """
 
+    __slots__ = ("document_id", "parser_type")
+    _CONTEXT_LABELS = (("document_id", "Document"), ("parser_type", "Parser"))
+
     def __init__(
         self,
         message: str,
@@ -128,19 +153,9 @@ class ParsingError(Law7Error):
             document_id: The document ID that failed to parse
             parser_type: The type of parser (html, pdf, ocr, etc.)
         """
-        super().__init__(message, details)
         self.document_id = document_id
         self.parser_type = parser_type
-
-    def __str__(self) -> str:
-        """Return string representation including document ID and parser type if present."""
-        base = super().__str__()
-        parts = [base]
-        if self.document_id:
-            parts.append(f"Document: {self.document_id}")
-        if self.parser_type:
-            parts.append(f"Parser: {self.parser_type}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        super().__init__(message, details)
 
 
 class ConsolidationError(Law7Error):
@@ -150,6 +165,9 @@ class ConsolidationError(Law7Error):
     Raised when amendment application or consolidation fails.
     """
 
+    __slots__ = ("code_id", "article_number")
+    _CONTEXT_LABELS = (("code_id", "Code"), ("article_number", "Article"))
+
     def __init__(
         self,
         message: str,
@@ -166,19 +184,9 @@ class ConsolidationError(Law7Error):
             code_id: The legal code identifier (e.g., 'TK_RF', 'GK_RF')
             article_number: The article number that failed
         """
-        super().__init__(message, details)
         self.code_id = code_id
         self.article_number = article_number
-
-    def __str__(self) -> str:
-        """Return string representation including code and article if present."""
-        base = super().__str__()
-        parts = [base]
-        if self.code_id:
-            parts.append(f"Code: {self.code_id}")
-        if self.article_number:
-            parts.append(f"Article: {self.article_number}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        super().__init__(message, details)
 
 
 class EmbeddingError(Law7Error):
@@ -188,6 +196,9 @@ class EmbeddingError(Law7Error):
     Raised when embedding generation or indexing fails.
     """
 
+    __slots__ = ("model_name", "batch_size")
+    _CONTEXT_LABELS = (("model_name", "Model"), ("batch_size", "Batch"))
+
     def __init__(
         self,
         message: str,
@@ -204,19 +215,9 @@ class EmbeddingError(Law7Error):
             model_name: The embedding model that failed
             batch_size: The batch size being processed
         """
-        super().__init__(message, details)
         self.model_name = model_name
         self.batch_size = batch_size
-
-    def __str__(self) -> str:
-        """Return string representation including model and batch size if present."""
-        base = super().__str__()
-        parts = [base]
-        if self.model_name:
-            parts.append(f"Model: {self.model_name}")
-        if self.batch_size:
-            parts.append(f"Batch: {self.batch_size}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        super().__init__(message, details)
 
 
 class SyncError(Law7Error):
@@ -226,6 +227,9 @@ class SyncError(Law7Error):
     Raised when document synchronization fails.
     """
 
+    __slots__ = ("sync_type", "country_id")
+    _CONTEXT_LABELS = (("sync_type", "Sync"), ("country_id", "Country"))
+
     def __init__(
         self,
         message: str,
@@ -242,19 +246,9 @@ class SyncError(Law7Error):
             sync_type: The type of sync (initial, content, amendments)
             country_id: The country being synced
         """
-        super().__init__(message, details)
         self.sync_type = sync_type
         self.country_id = country_id
-
-    def __str__(self) -> str:
-        """Return string representation including sync type and country if present."""
-        base = super().__str__()
-        parts = [base]
-        if self.sync_type:
-            parts.append(f"Sync: {self.sync_type}")
-        if self.country_id:
-            parts.append(f"Country: {self.country_id}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        super().__init__(message, details)
 
 
 class ValidationError(Law7Error):
@@ -264,6 +258,8 @@ class ValidationError(Law7Error):
     Raised when input data validation fails.
     """
 
+    __slots__ = ("field_name", "field_value")
+
     def __init__(
         self,
         message: str,
@@ -280,19 +276,18 @@ class ValidationError(Law7Error):
             field_name: The field that failed validation
             field_value: The value that failed validation
         """
-        super().__init__(message, details)
         self.field_name = field_name
         self.field_value = field_value
+        super().__init__(message, details)
 
-    def __str__(self) -> str:
-        """Return string representation including field and value if present."""
-        base = super().__str__()
-        parts = [base]
+    def _context(self) -> list[str]:
+        """Return field and value, if present."""
+        parts = []
         if self.field_name:
             parts.append(f"Field: {self.field_name}")
         if self.field_value is not None:
             parts.append(f"Value: {self.field_value}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        return parts
 
 
 class ConfigurationError(Law7Error):
@@ -302,6 +297,9 @@ class ConfigurationError(Law7Error):
     Raised when configuration is missing or invalid.
     """
 
+    __slots__ = ("config_key", "config_file")
+    _CONTEXT_LABELS = (("config_key", "Key"), ("config_file", "File"))
+
     def __init__(
         self,
         message: str,
@@ -318,16 +316,6 @@ class ConfigurationError(Law7Error):
             config_key: The configuration key that is problematic
             config_file: The configuration file being read
         """
-        super().__init__(message, details)
         self.config_key = config_key
         self.config_file = config_file
-
-    def __str__(self) -> str:
-        """Return string representation including config key and file if present."""
-        base = super().__str__()
-        parts = [base]
-        if self.config_key:
-            parts.append(f"Key: {self.config_key}")
-        if self.config_file:
-            parts.append(f"File: {self.config_file}")
-        return " | ".join(parts) if len(parts) > 1 else base
+        super().__init__(message, details)
@@ -5,6 +5,7 @@ Provides consistent logging setup across all Law7 modules.
 Configurable via environment variables and supports multiple outputs.
 """
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -21,6 +22,19 @@ ENV_LOG_FORMAT = "LAW7_LOG_FORMAT"
 ENV_LOG_FILE = "LAW7_LOG_FILE"
 ENV_LOG_DIR = "LAW7_LOG_DIR"
 
+# Level names ("DEBUG", "INFO", "WARN", ...) to their numeric values
+_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+# Loggers already returned by get_logger, by name
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+
+# Formatters by (format_string, date_format); they hold no per-record state,
+# so handlers can share one instance
+_FORMATTER_CACHE: dict[tuple[str, str], logging.Formatter] = {}
+
+# Log directories already created by setup_logging in this process
+_MKDIR_DONE: set[str] = set()
+
 
 def setup_logging(
     name: str,
@@ -69,11 +83,11 @@ def setup_logging(
     """
     # Get log level from env var or parameter
     if level is None:
-        level = __import__("os").getenv(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
+        level = os.getenv(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
 
     # Get format from env var or parameter
     if format_string is None:
-        format_string = __import__("os").getenv(ENV_LOG_FORMAT, DEFAULT_LOG_FORMAT)
+        format_string = os.getenv(ENV_LOG_FORMAT, DEFAULT_LOG_FORMAT)
 
     # Get date format
     if date_format is None:
@@ -81,35 +95,44 @@ def setup_logging(
 
     # Get log directory
     if log_dir is None:
-        log_dir_str = __import__("os").getenv(ENV_LOG_DIR)
+        log_dir_str = os.getenv(ENV_LOG_DIR)
         log_dir = Path(log_dir_str) if log_dir_str else DEFAULT_LOG_DIR
 
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    level_int = _LEVELS.get(level.upper())
+    if level_int is None:
+        raise ValueError(f"Unknown log level: {level}")
+    logger.setLevel(level_int)
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
-    # Create formatter
-    formatter = logging.Formatter(format_string, datefmt=date_format)
+    # Create formatter (or reuse one with the same formats)
+    key = (format_string, date_format)
+    formatter = _FORMATTER_CACHE.get(key)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE[key] = logging.Formatter(format_string, datefmt=date_format)
 
     # Add console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        console_handler.setLevel(getattr(logging, level.upper()))
+        console_handler.setLevel(level_int)
         logger.addHandler(console_handler)
 
     # Add file handler if log_file is specified
     if log_file:
-        # Create log directory if it doesn't exist
-        log_dir.mkdir(parents=True, exist_ok=True)
+        # Create log directory if it doesn't exist (once per directory)
+        dir_key = str(log_dir)
+        if dir_key not in _MKDIR_DONE:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _MKDIR_DONE.add(dir_key)
 
         log_path = log_dir / log_file
         file_handler = logging.FileHandler(log_path, encoding="utf-8")
         file_handler.setFormatter(formatter)
-        file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setLevel(level_int)
         logger.addHandler(file_handler)
 
     return logger
@@ -119,7 +142,8 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with standard Law7 configuration.
 
-    Shortcut for setup_logging with defaults.
+    Shortcut for setup_logging with defaults. Loggers are configured on
+    the first call for a name; later calls return the same logger directly.
 
     Args:
         name: Logger name (usually __name__ from calling module)
@@ -132,10 +156,15 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Application started")
     """
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     # Check if logger already configured
     logger = logging.getLogger(name)
     if not logger.handlers:
-        return setup_logging(name)
+        logger = setup_logging(name)
+    _LOGGER_CACHE[name] = logger
     return logger
 
 
@@ -156,6 +185,8 @@ class LoggerContext:
         >>> logger.info("Back to normal")
     """
 
+    __slots__ = ("logger", "new_level", "old_level")
+
     def __init__(self, logger: logging.Logger, level: int):
         """
         Initialize context manager.
@@ -171,6 +202,8 @@ class LoggerContext:
     def __enter__(self):
         """Save current level and set new level."""
         self.old_level = self.logger.level
+        # setLevel (not a bare assignment to logger.level) so the cached
+        # isEnabledFor() results of this logger and its children are cleared
         self.logger.setLevel(self.new_level)
         return self
 
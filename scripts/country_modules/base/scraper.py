@@ -4,21 +4,40 @@ Base scraper abstract base class.
 This module defines the interface that all country-specific scrapers must implement.
 """
 
+import hashlib
+import hmac
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from datetime import date
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RawDocument:
-    """Raw document from scraper."""
+    """
+    Raw document from scraper.
+
+    Documents are immutable once fetched, so the SHA-256 content hash used by
+    manifests and verify_document is computed at most once per document.
+    """
 
     doc_id: str
     url: str
     content: bytes
     content_type: str  # "text/html", "application/pdf"
     metadata: Dict[str, Any]
+    _content_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the content, computed on first access."""
+        if self._content_hash is None:
+            object.__setattr__(self, "_content_hash", hashlib.sha256(self.content).hexdigest())
+        return self._content_hash
+
+    def __hash__(self) -> int:
+        """Hash by document ID and content hash (metadata is a dict and unhashable)."""
+        return hash((self.doc_id, self.content_hash))
 
 
 class BaseScraper(ABC):
@@ -102,16 +121,19 @@ class BaseScraper(ABC):
         """
         pass
 
-    @abstractmethod
     async def verify_document(self, doc_id: str, content_hash: str) -> bool:
         """
         Verify document content matches hash.
 
+        Fetches the document and compares its cached SHA-256 content hash.
+        Override only if a source can verify without fetching the content.
+
         Args:
             doc_id: Document identifier
-            content_hash: Expected hash value
+            content_hash: Expected hash value (SHA-256 hex digest)
 
         Returns:
             bool: True if hash matches
         """
-        pass
+        doc = await self.fetch_document(doc_id)
+        return hmac.compare_digest(doc.content_hash, content_hash)
@@ -7,32 +7,153 @@ IPFS, D-PC, etc.) to be used interchangeably.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Callable, Dict, Any, Optional
+from collections.abc import MutableMapping
+from typing import List, Callable, Dict, Any, Iterator, Mapping, Optional, Union
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
+from .scraper import RawDocument
 
-@dataclass
+# SHA-256 digest size; hashes of this size are stored as raw bytes
+_DIGEST_SIZE = 32
+
+
+class _ContentHashIndex(MutableMapping):
+    """
+    Mapping of doc_id -> content hash (hex) that packs the hashes.
+
+    SHA-256 hex digests are stored as 32 raw bytes each in one bytearray,
+    indexed by position, instead of as one 64-character string object per
+    document. Any other value (different length, upper case) is kept as is.
+    Raw 32-byte digests may be assigned directly; they read back as hex.
+    """
+
+    __slots__ = ("_index", "_doc_ids", "_digests", "_other")
+
+    def __init__(self, items: Optional[Mapping[str, str]] = None):
+        self._index: Dict[str, int] = {}  # doc_id -> slot in _digests
+        self._doc_ids: List[str] = []  # slot -> doc_id
+        self._digests = bytearray()
+        self._other: Dict[str, str] = {}
+        if items:
+            self.update(items)
+
+    def _pack(self, content_hash: Union[str, bytes]) -> Optional[bytes]:
+        """Raw bytes of a lowercase SHA-256 hex digest, or None for any other value."""
+        if isinstance(content_hash, bytes):
+            if len(content_hash) != _DIGEST_SIZE:
+                raise ValueError(f"Expected a {_DIGEST_SIZE}-byte digest, got {len(content_hash)}")
+            return content_hash
+        if len(content_hash) != 2 * _DIGEST_SIZE:
+            return None
+        try:
+            digest = bytes.fromhex(content_hash)
+        except ValueError:
+            return None
+        return digest if digest.hex() == content_hash else None
+
+    def __getitem__(self, doc_id: str) -> str:
+        slot = self._index.get(doc_id)
+        if slot is None:
+            return self._other[doc_id]
+        start = slot * _DIGEST_SIZE
+        return self._digests[start:start + _DIGEST_SIZE].hex()
+
+    def digest(self, doc_id: str) -> Optional[bytes]:
+        """Raw SHA-256 digest for doc_id, or None if absent or not a SHA-256 hash."""
+        slot = self._index.get(doc_id)
+        if slot is None:
+            return None
+        start = slot * _DIGEST_SIZE
+        return bytes(self._digests[start:start + _DIGEST_SIZE])
+
+    def __setitem__(self, doc_id: str, content_hash: Union[str, bytes]) -> None:
+        digest = self._pack(content_hash)
+        if digest is None:
+            if doc_id in self._index:
+                del self[doc_id]
+            self._other[doc_id] = content_hash
+            return
+
+        self._other.pop(doc_id, None)
+        slot = self._index.get(doc_id)
+        if slot is None:
+            self._index[doc_id] = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._digests += digest
+        else:
+            start = slot * _DIGEST_SIZE
+            self._digests[start:start + _DIGEST_SIZE] = digest
+
+    def __delitem__(self, doc_id: str) -> None:
+        slot = self._index.pop(doc_id, None)
+        if slot is None:
+            del self._other[doc_id]
+            return
+
+        # Move the last digest into the freed slot to keep the arrays dense
+        last_doc_id = self._doc_ids.pop()
+        if last_doc_id != doc_id:
+            start = slot * _DIGEST_SIZE
+            self._digests[start:start + _DIGEST_SIZE] = self._digests[-_DIGEST_SIZE:]
+            self._doc_ids[slot] = last_doc_id
+            self._index[last_doc_id] = slot
+        del self._digests[-_DIGEST_SIZE:]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._index
+        yield from self._other
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+@dataclass(slots=True)
 class DocumentManifest:
     """
     List of documents + their versions.
 
     This manifest represents the current state of documents for a country,
-    including content hashes for verification.
+    including content hashes for verification. `documents` behaves like a
+    dict of doc_id -> content_hash but stores SHA-256 hashes packed, which
+    keeps manifests of 10^5-10^6 documents small; use dict(documents) where
+    a real dict is needed (e.g. JSON).
     """
     country_id: str
-    documents: Dict[str, str] = field(default_factory=dict)  # doc_id -> content_hash
-    last_updated: str = ""
+    documents: MutableMapping = field(default_factory=_ContentHashIndex)  # doc_id -> content_hash
+    last_updated: int = 0  # Unix epoch seconds (UTC); 0 if never published
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def add_document(self, doc_id: str, content_hash: str) -> None:
-        """Add or update a document in the manifest."""
+    def __post_init__(self):
+        if not isinstance(self.documents, _ContentHashIndex):
+            self.documents = _ContentHashIndex(self.documents)
+
+    @property
+    def last_updated_iso(self) -> str:
+        """last_updated as an ISO 8601 UTC timestamp, or "" if never published."""
+        if not self.last_updated:
+            return ""
+        return datetime.fromtimestamp(self.last_updated, tz=timezone.utc).isoformat()
+
+    def add_document(self, doc_id: str, content_hash: Union[str, bytes]) -> None:
+        """Add or update a document in the manifest (hex hash or raw SHA-256 digest)."""
         self.documents[doc_id] = content_hash
 
+    def add_raw_document(self, raw: RawDocument) -> None:
+        """Add or update a fetched document, reusing its cached content hash."""
+        self.documents[raw.doc_id] = raw.content_hash
+
     def get_document_hash(self, doc_id: str) -> Optional[str]:
         """Get content hash for a document."""
         return self.documents.get(doc_id)
 
+    def get_document_digest(self, doc_id: str) -> Optional[bytes]:
+        """Get the raw SHA-256 digest for a document, without hex encoding."""
+        return self.documents.digest(doc_id)
+
 
 class DocumentSync(ABC):
     """
@@ -6,11 +6,13 @@ configurations. Each country module defines scrapers, parsers, and sync services
 specific to that country's legal system and data sources.
 """
 
-from typing import Dict, Optional, List
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, List, Mapping
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CountryModule:
     """
     Country-specific module configuration.
@@ -18,6 +20,9 @@ class CountryModule:
     This dataclass stores the configuration for a country's legal document
     processing pipeline, including scraper, parser, consolidation, and sync
     implementations.
+
+    Instances are frozen: the registry indexes and the cached config view are
+    built from the field values once, so they must not change afterwards.
     """
 
     country_id: str  # ISO 3166-1 alpha-3 (e.g., "RUS", "DEU", "USA")
@@ -31,16 +36,33 @@ class CountryModule:
     data_sources: Dict[str, str] = None  # Source URLs keyed by type
     jurisdiction_levels: List[str] = None  # ["federal", "regional", "municipal"]
     is_active: bool = True
+    # Read-only view returned by get_country_config, built once in __post_init__
+    _config_view: Mapping[str, Any] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # Frozen dataclass: defaults and the cached view go through object.__setattr__
         if self.data_sources is None:
-            self.data_sources = {}
+            object.__setattr__(self, 'data_sources', {})
         if self.jurisdiction_levels is None:
-            self.jurisdiction_levels = []
-
-
-# Country registry with all configured countries
-COUNTRIES: Dict[str, CountryModule] = {
+            object.__setattr__(self, 'jurisdiction_levels', [])
+        object.__setattr__(self, '_config_view', MappingProxyType({
+            'country_id': self.country_id,
+            'country_code': self.country_code,
+            'country_name': self.country_name,
+            'legal_system': self.legal_system,
+            'data_sources': self.data_sources,
+            'jurisdiction_levels': self.jurisdiction_levels,
+            'is_active': self.is_active,
+        }))
+
+    def __reduce__(self):
+        """Pickle through __init__; the mappingproxy view itself cannot be pickled."""
+        return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
+
+
+# Country registry with all configured countries (mutated only by register_country;
+# exposed read-only as COUNTRIES)
+_COUNTRIES: Dict[str, CountryModule] = {
     "RUS": CountryModule(
         country_id="RUS",
         country_name="Russia",
@@ -70,7 +92,25 @@ COUNTRIES: Dict[str, CountryModule] = {
     # ),
 }
 
+# Read-only live view of the registry
+COUNTRIES: Mapping[str, CountryModule] = MappingProxyType(_COUNTRIES)
+
+# Reverse index: ISO 3166-1 alpha-2 code -> module (kept in sync by register_country;
+# exposed read-only as COUNTRIES_BY_CODE)
+_COUNTRIES_BY_CODE: Dict[str, CountryModule] = {
+    module.country_code.upper(): module for module in COUNTRIES.values()
+}
+
+# Read-only live view of the reverse index
+COUNTRIES_BY_CODE: Mapping[str, CountryModule] = MappingProxyType(_COUNTRIES_BY_CODE)
+
+# IDs of active countries, in registration order (kept in sync by register_country)
+_ACTIVE_IDS: List[str] = [
+    country_id for country_id, module in COUNTRIES.items() if module.is_active
+]
+
 
+@lru_cache(maxsize=64)
 def get_country_module(country_id: str) -> Optional[CountryModule]:
     """
     Get country module by ID.
@@ -108,11 +148,7 @@ def get_country_module_by_code(country_code: str) -> Optional[CountryModule]:
     """
     if not country_code:
         return None
-    country_code_upper = country_code.upper()
-    for module in COUNTRIES.values():
-        if module.country_code == country_code_upper:
-            return module
-    return None
+    return COUNTRIES_BY_CODE.get(country_code.upper())
 
 
 def list_available_countries() -> List[str]:
@@ -136,22 +172,22 @@ def list_active_countries() -> List[str]:
     Returns:
         List of ISO 3166-1 alpha-3 country codes for active countries
     """
-    return [
-        country_id
-        for country_id, module in COUNTRIES.items()
-        if module.is_active
-    ]
+    return _ACTIVE_IDS.copy()
 
 
-def get_country_config(country_id: str) -> Optional[Dict[str, any]]:
+def get_country_config(country_id: str) -> Optional[Mapping[str, Any]]:
     """
-    Get country configuration as dict.
+    Get country configuration as a read-only mapping.
+
+    The mapping is built once per CountryModule and shared between callers,
+    so it is a MappingProxyType; callers must not mutate the nested
+    data_sources/jurisdiction_levels either. Use dict(config) for a copy.
 
     Args:
         country_id: ISO 3166-1 alpha-3 code (e.g., "RUS", "DEU", "USA")
 
     Returns:
-        Dict with country configuration or None if not found
+        Mapping with country configuration or None if not found
 
     Examples:
         >>> config = get_country_config("RUS")
@@ -161,17 +197,7 @@ def get_country_config(country_id: str) -> Optional[Dict[str, any]]:
         'civil_law'
     """
     module = get_country_module(country_id)
-    if not module:
-        return None
-    return {
-        'country_id': module.country_id,
-        'country_code': module.country_code,
-        'country_name': module.country_name,
-        'legal_system': module.legal_system,
-        'data_sources': module.data_sources,
-        'jurisdiction_levels': module.jurisdiction_levels,
-        'is_active': module.is_active,
-    }
+    return module._config_view if module else None
 
 
 def register_country(module: CountryModule) -> None:
@@ -201,4 +227,10 @@ def register_country(module: CountryModule) -> None:
     country_id = module.country_id.upper()
     if country_id in COUNTRIES:
         raise ValueError(f"Country {country_id} already registered")
-    COUNTRIES[country_id] = module
+    _COUNTRIES[country_id] = module
+    if module.is_active:
+        _ACTIVE_IDS.append(country_id)
+    # The first module registered for a code wins, as with the old linear scan
+    _COUNTRIES_BY_CODE.setdefault(module.country_code.upper(), module)
+    # Cached lookups may hold a None for this country_id
+    get_country_module.cache_clear()
@@ -10,10 +10,39 @@ Components:
 - Diff Engine: Applies amendments to create snapshots
 - Consolidate: Orchestrates the consolidation process
 """
-from .version_manager import VersionManager, VersionInfo, AmendmentChain, get_article_history
-from .amendment_parser import AmendmentParser, ParsedAmendment, AmendmentTarget, AmendmentChange
-from .diff_engine import ArticleDiffEngine, ArticleSnapshot, DiffResult
-from .consolidate import CodeConsolidator, consolidate_code
+import importlib
+
+# Public name -> submodule. Submodules are imported on first attribute access
+# (PEP 562), so importing the package does not pull in SQLAlchemy, difflib, etc.
+_LAZY = {
+    "VersionManager": "version_manager",
+    "VersionInfo": "version_manager",
+    "AmendmentChain": "version_manager",
+    "get_article_history": "version_manager",
+    "AmendmentParser": "amendment_parser",
+    "ParsedAmendment": "amendment_parser",
+    "AmendmentTarget": "amendment_parser",
+    "AmendmentChange": "amendment_parser",
+    "ArticleDiffEngine": "diff_engine",
+    "ArticleSnapshot": "diff_engine",
+    "DiffResult": "diff_engine",
+    "CodeConsolidator": "consolidate",
+    "consolidate_code": "consolidate",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     # Version Manager
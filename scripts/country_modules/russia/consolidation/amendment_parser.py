@@ -16,9 +16,11 @@ This is the Russia-specific parser for Russian legal amendment text.
 """
 import logging
 import re
-from dataclasses import dataclass, field
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +31,7 @@ country_name = "Russia"
 country_code = "RU"
 
 
-@dataclass
+@dataclass(slots=True)
 class AmendmentTarget:
     """Represents what an amendment affects."""
     code_id: str  # 'GK_RF', 'UK_RF', 'TK_RF', etc.
@@ -38,7 +40,7 @@ class AmendmentTarget:
     is_full_code: bool = False  # True if entire code is affected
 
 
-@dataclass
+@dataclass(slots=True)
 class AmendmentChange:
     """Represents a single change made by an amendment."""
     action_type: str  # 'addition', 'modification', 'repeal', 'reorganization'
@@ -48,7 +50,7 @@ class AmendmentChange:
     context: str = ""  # Surrounding text for reference
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAmendment:
     """Represents a fully parsed amendment."""
     eo_number: str  # Amendment document number
@@ -74,6 +76,14 @@ CODE_PATTERNS = {
     # Add more codes as needed
 }
 
+# (code_id, lowercased patterns, full code name), built once for _identify_target_code.
+# The id and name are interned: every target shares these objects, and results
+# unpickled from worker processes are mapped back onto them.
+CODE_PATTERNS_LOWER: List[Tuple[str, List[str], str]] = [
+    (sys.intern(code_id), [pattern.lower() for pattern in patterns], sys.intern(patterns[0]))
+    for code_id, patterns in CODE_PATTERNS.items()
+]
+
 
 class AmendmentParser:
     """
@@ -118,6 +128,26 @@ class AmendmentParser:
             '|'.join(self.ARTICLE_PATTERNS),
             re.IGNORECASE | re.UNICODE
         )
+        # One alternation per action type: an action is found if any of its
+        # patterns matches, so each type needs a single search. The types are
+        # not merged into one regex because their patterns overlap (several
+        # start with "Признать.*утратившим силу") and a combined scan would
+        # report only one of them.
+        self.action_regexes = [
+            (action_type, re.compile('|'.join(patterns), re.IGNORECASE))
+            for action_type, patterns in self.ACTION_PATTERNS.items()
+        ]
+        # Change-detail patterns used by parse_change_details
+        # "слово X заменить словом Y"
+        self.replacement_regex = re.compile(
+            r'(?:слово|фразу|абзац|пункт)\s+["«]([^"»]+)["»]\s+заменить\s+["«]([^"»]+)["»]',
+            re.IGNORECASE
+        )
+        # "дополнить статьей X: текст"
+        self.addition_regex = re.compile(
+            r'дополнить\s+стать(?:е|ей)\s+(\d+).*?:\s*([^.\n]+)',
+            re.IGNORECASE
+        )
 
     def parse_amendment(
         self,
@@ -138,14 +168,14 @@ class AmendmentParser:
         Returns:
             ParsedAmendment with extracted information
         """
-        # Identify target code
-        target = self._identify_target_code(title, text)
+        # Lowercased once and shared by the code and action-type scans
+        combined_lower = f"{title} {text}".lower()
 
-        # Extract article references
-        articles_affected = self._extract_articles(title, text)
+        # Identify target code
+        target = self._identify_target_code(title, text, combined_lower)
 
         # Determine action type
-        action_type = self._determine_action_type(title, text)
+        action_type = self._determine_action_type(title, text, combined_lower)
 
         # Create parsed amendment
         return ParsedAmendment(
@@ -158,30 +188,40 @@ class AmendmentParser:
             raw_text=text,
         )
 
-    def _identify_target_code(self, title: str, text: str) -> AmendmentTarget:
+    def _identify_target_code(
+        self,
+        title: str,
+        text: str,
+        combined_lower: Optional[str] = None,
+    ) -> AmendmentTarget:
         """
         Identify which code is being amended.
 
         Args:
             title: Amendment title
             text: Amendment text
+            combined_lower: f"{title} {text}".lower(), if already computed
 
         Returns:
             AmendmentTarget with code information
         """
-        combined = f"{title} {text}".lower()
-
-        for code_id, patterns in CODE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in combined:
-                    # Get the full code name
-                    code_name = patterns[0]  # First pattern is usually the full name
-                    return AmendmentTarget(
-                        code_id=code_id,
-                        code_name=code_name,
-                        articles_affected=[],
-                        is_full_code=False,
-                    )
+        # The title names the amended code in the common case, so it is
+        # searched on its own first; the (often long) text is only lowercased
+        # when the title has no match. A code named in the title takes
+        # precedence over other codes cited in the text.
+        match = self._match_code(title.lower())
+        if not match:
+            if combined_lower is None:
+                combined_lower = f"{title} {text}".lower()
+            match = self._match_code(combined_lower)
+        if match:
+            code_id, code_name = match
+            return AmendmentTarget(
+                code_id=code_id,
+                code_name=code_name,
+                articles_affected=[],
+                is_full_code=False,
+            )
 
         # Default: unknown code
         logger.warning(f"Could not identify target code in: {title[:100]}")
@@ -192,6 +232,15 @@ class AmendmentParser:
             is_full_code=False,
         )
 
+    @staticmethod
+    def _match_code(text_lower: str) -> Optional[Tuple[str, str]]:
+        """Return (code_id, code_name) of the first code whose pattern occurs in text_lower."""
+        for code_id, patterns, code_name in CODE_PATTERNS_LOWER:
+            for pattern in patterns:
+                if pattern in text_lower:
+                    return code_id, code_name
+        return None
+
     def _extract_articles(self, title: str, text: str) -> List[str]:
         """
         Extract article numbers affected by amendment.
@@ -208,32 +257,37 @@ class AmendmentParser:
         # Find all article references
         matches = self.article_regex.findall(combined)
 
-        # Deduplicate and clean
-        articles = list(set(matches))
+        # findall yields one tuple per match with a group for each alternative;
+        # flatten to the non-empty group and deduplicate in order of appearance
+        articles = list(dict.fromkeys(m for groups in matches for m in groups if m))
 
-        logger.debug(f"Found {len(articles)} article references: {articles}")
+        logger.debug("Found %d article references: %s", len(articles), articles)
         return articles
 
-    def _determine_action_type(self, title: str, text: str) -> str:
+    def _determine_action_type(
+        self,
+        title: str,
+        text: str,
+        combined_lower: Optional[str] = None,
+    ) -> str:
         """
         Determine the type of amendment action.
 
         Args:
             title: Amendment title
             text: Amendment text
+            combined_lower: f"{title} {text}".lower(), if already computed
 
         Returns:
             Action type: 'addition', 'modification', 'repeal', or 'mixed'
         """
-        combined = f"{title} {text}".lower()
-
-        actions_found = []
+        combined = combined_lower if combined_lower is not None else f"{title} {text}".lower()
 
-        for action_type, patterns in self.ACTION_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, combined, re.IGNORECASE):
-                    actions_found.append(action_type)
-                    break
+        actions_found = [
+            action_type
+            for action_type, regex in self.action_regexes
+            if regex.search(combined)
+        ]
 
         if len(actions_found) == 0:
             # Default to modification if no clear pattern found
@@ -264,9 +318,7 @@ class AmendmentParser:
         changes = []
         text = full_text.lower()
 
-        # Pattern: "слово X заменить словом Y"
-        replacement_pattern = r'(?:слово|фразу|абзац|пункт)\s+["«]([^"»]+)["»]\s+заменить\s+["«]([^"»]+)["»]'
-        for match in re.finditer(replacement_pattern, text, re.IGNORECASE):
+        for match in self.replacement_regex.finditer(text):
             changes.append(AmendmentChange(
                 action_type='modification',
                 old_text=match.group(1),
@@ -274,9 +326,7 @@ class AmendmentParser:
                 context=match.group(0),
             ))
 
-        # Pattern: "дополнить статьей X: текст"
-        addition_pattern = r'дополнить\s+стать(?:е|ей)\s+(\d+).*?:\s*([^.\n]+)'
-        for match in re.finditer(addition_pattern, text, re.IGNORECASE):
+        for match in self.addition_regex.finditer(text):
             changes.append(AmendmentChange(
                 action_type='addition',
                 article_number=match.group(1),
@@ -284,10 +334,14 @@ class AmendmentParser:
                 context=match.group(0),
             ))
 
-        logger.debug(f"Parsed {len(changes)} detailed changes")
+        logger.debug("Parsed %d detailed changes", len(changes))
         return changes
 
 
+# Singleton instance for the module-level helpers; the parser is stateless
+_default_parser = AmendmentParser()
+
+
 def parse_amendment_from_db(
     eo_number: str,
     title: str,
@@ -306,8 +360,7 @@ def parse_amendment_from_db(
     Returns:
         ParsedAmendment object
     """
-    parser = AmendmentParser()
-    return parser.parse_amendment(
+    return _default_parser.parse_amendment(
         eo_number=eo_number,
         title=title,
         text=full_text,
@@ -315,9 +368,28 @@ def parse_amendment_from_db(
     )
 
 
+def _parse_batch_item(amendment: Dict[str, Any]) -> Optional[ParsedAmendment]:
+    """Parse one amendment dict for parse_amendments_batch; None (logged) on failure."""
+    try:
+        return _default_parser.parse_amendment(
+            eo_number=amendment.get('eo_number', ''),
+            title=amendment.get('title', ''),
+            text=amendment.get('full_text', ''),
+            effective_date=amendment.get('document_date'),
+        )
+    except Exception as e:
+        logger.error(f"Failed to parse amendment {amendment.get('eo_number')}: {e}")
+        return None
+
+
+# Amendments sent to a worker process at a time by parse_amendments_batch
+_BATCH_CHUNK_SIZE = 64
+
+
 # Convenience function for batch processing
 def parse_amendments_batch(
     amendments: List[Dict[str, Any]],
+    max_workers: int = 1,
 ) -> List[ParsedAmendment]:
     """
     Parse multiple amendments in batch.
@@ -328,25 +400,53 @@ def parse_amendments_batch(
                    - title
                    - full_text
                    - document_date (optional)
+        max_workers: Number of worker processes. 1 (default) parses in this
+                    process; more only pays off for large batches on a
+                    multi-core machine, since every result (including its
+                    raw_text) is pickled back from the worker.
 
     Returns:
-        List of ParsedAmendment objects
+        List of ParsedAmendment objects, in input order. Repeated amendments
+        (same number, title, text and date, e.g. from a join) are parsed once;
+        each repeat gets its own copy of the result.
     """
-    parser = AmendmentParser()
-    results = []
-
-    for amendment in amendments:
-        try:
-            parsed = parser.parse_amendment(
-                eo_number=amendment.get('eo_number', ''),
-                title=amendment.get('title', ''),
-                text=amendment.get('full_text', ''),
-                effective_date=amendment.get('document_date'),
-            )
-            results.append(parsed)
-        except Exception as e:
-            logger.error(f"Failed to parse amendment {amendment.get('eo_number')}: {e}")
+    # Positions of each distinct amendment in the input, keyed by every input
+    # of parse_amendment
+    positions: Dict[Tuple[Any, ...], List[int]] = {}
+    for i, amendment in enumerate(amendments):
+        key = (
+            amendment.get('eo_number', ''),
+            amendment.get('title', ''),
+            amendment.get('full_text', ''),
+            amendment.get('document_date'),
+        )
+        positions.setdefault(key, []).append(i)
+    unique = [amendments[indexes[0]] for indexes in positions.values()]
+
+    if max_workers > 1 and len(unique) > _BATCH_CHUNK_SIZE:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            unique_parsed = list(executor.map(
+                _parse_batch_item, unique, chunksize=_BATCH_CHUNK_SIZE
+            ))
+        # Unpickling makes a copy of each code string per chunk; share them again
+        for amendment in unique_parsed:
+            if amendment is not None:
+                amendment.code_id = sys.intern(amendment.code_id)
+                amendment.code_name = sys.intern(amendment.code_name)
+    else:
+        unique_parsed = [_parse_batch_item(amendment) for amendment in unique]
+
+    # Spread results back to input order; repeats get copies (with their own
+    # changes list) since callers mutate parsed amendments
+    parsed: List[Optional[ParsedAmendment]] = [None] * len(amendments)
+    for indexes, amendment in zip(positions.values(), unique_parsed):
+        if amendment is None:
             continue
+        parsed[indexes[0]] = amendment
+        for i in indexes[1:]:
+            parsed[i] = replace(amendment, changes=list(amendment.changes))
+
+    results = [amendment for amendment in parsed if amendment is not None]
 
     logger.info(f"Parsed {len(results)}/{len(amendments)} amendments successfully")
     return results
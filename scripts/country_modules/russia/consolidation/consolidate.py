@@ -263,13 +263,20 @@ class CodeConsolidator:
         # Step 4: Save results
         logger.info("[Step 4] Saving consolidated versions...")
 
-        # For each article, save the final snapshot
-        snapshots_saved = 0
-        for article_number, article in self.current_articles.items():
-            if self.version_manager.save_snapshot(self.code_id, article):
-                snapshots_saved += 1
-
-        logger.info(f"  Saved {snapshots_saved} article snapshots")
+        # Final snapshots of all articles are written in one batch. The batch is
+        # all or nothing: one bad article rolls back every snapshot, where
+        # saving them one by one only skipped the failing article
+        snapshots_saved = self.version_manager.save_snapshots_bulk(
+            self.code_id, self.current_articles.values()
+        )
+
+        if snapshots_saved or not self.current_articles:
+            logger.info(f"  Saved {snapshots_saved} article snapshots")
+        else:
+            logger.error(
+                f"  Saved 0 of {len(self.current_articles)} article snapshots: "
+                f"the batch was rolled back (see the error above)"
+            )
 
         results = {
             'code_id': self.code_id,
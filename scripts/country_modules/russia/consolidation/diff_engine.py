@@ -11,15 +11,103 @@ The engine maintains version history for each article.
 
 This is the Russia-specific diff engine for applying amendments to Russian legal codes.
 """
+import hashlib
 import logging
+import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 from difflib import SequenceMatcher
 
 logger = logging.getLogger(__name__)
 
+# rapidfuzz provides C++ implementations of the similarity ratio and edit
+# opcodes; difflib is kept as a pure-Python fallback
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.info("rapidfuzz not available, using difflib for text comparison")
+
+# Without rapidfuzz, numba can JIT-compile the similarity kernel instead
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# xxh3 is a fast non-cryptographic hash, which is all change detection needs;
+# MD5 remains the fallback (and the algorithm of rows written before xxhash)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Algorithm behind ArticleSnapshot.text_hash, stored next to it as text_hash_algo
+TEXT_HASH_ALGO = "xxh3_128" if XXHASH_AVAILABLE else "md5"
+
+# Words for fuzzy matching: maximal runs of non-whitespace
+_WORD_RE = re.compile(r'\S+')
+
+# Above this combined length the difflib fallback aligns texts by paragraph
+# instead of matching characters across the whole text
+_CHUNKED_DIFF_CHARS = 200_000
+
+# Longest pair of chunks still compared character by character
+_MAX_CHUNK_DIFF_CHARS = 10_000
+
+
+def hash_text(text: Union[str, bytes]) -> str:
+    """
+    Hex digest of a text with the TEXT_HASH_ALGO algorithm.
+
+    Accepts the UTF-8 bytes directly, so callers that already hold them
+    (e.g. raw downloaded pages) don't pay for a decode/encode round trip.
+    """
+    data = text if isinstance(text, bytes) else text.encode('utf-8')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.md5(data).hexdigest()
+
+
+def _indel_ratio(a, b) -> float:
+    """
+    Indel similarity (same scale as rapidfuzz's fuzz.ratio / 100) of two code point arrays.
+
+    Computes 2 * LCS / (len(a) + len(b)) with a two-row DP table.
+    """
+    total = len(a) + len(b)
+    if total == 0:
+        return 1.0
+
+    prev = [0] * (len(b) + 1)
+    curr = [0] * (len(b) + 1)
+    for i in range(len(a)):
+        for j in range(len(b)):
+            if a[i] == b[j]:
+                curr[j + 1] = prev[j] + 1
+            elif prev[j + 1] >= curr[j]:
+                curr[j + 1] = prev[j + 1]
+            else:
+                curr[j + 1] = curr[j]
+        prev, curr = curr, prev
+
+    return 2.0 * prev[len(b)] / total
+
+
+if NUMBA_AVAILABLE and not RAPIDFUZZ_AVAILABLE:
+    _indel_ratio_jit = njit(cache=True)(_indel_ratio)
+
+
+def _code_points(s: str):
+    """Unicode code points of a string as a numpy array (for the JIT kernel)."""
+    return np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
+
 
 # Country identification
 country_id = "RUS"
@@ -27,7 +115,168 @@ country_name = "Russia"
 country_code = "RU"
 
 
-@dataclass
+def _similarity(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """
+    Similarity ratio (0-1) between two strings.
+
+    Comparisons that cannot reach ``score_cutoff`` are abandoned early and
+    return 0.0.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(a, b, score_cutoff=score_cutoff * 100) / 100.0
+
+    # Checked before the JIT kernel too: it is still a full O(n*m) comparison
+    if len(a) + len(b) > _CHUNKED_DIFF_CHARS:
+        ratio = _chunked_ratio(a, b)
+        return ratio if ratio >= score_cutoff else 0.0
+
+    if NUMBA_AVAILABLE:
+        # Length-only upper bound, as real_quick_ratio() below
+        if 2.0 * min(len(a), len(b)) < score_cutoff * (len(a) + len(b)):
+            return 0.0
+        ratio = _indel_ratio_jit(_code_points(a), _code_points(b))
+        return ratio if ratio >= score_cutoff else 0.0
+
+    # autojunk would treat frequent characters (spaces, common letters) as
+    # junk once a text passes 200 characters, skewing the ratio
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    # Escalate through cheaper upper bounds (length-only, then character
+    # counts) and only run the full match when the cutoff is still in reach
+    if matcher.real_quick_ratio() < score_cutoff or matcher.quick_ratio() < score_cutoff:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= score_cutoff else 0.0
+
+
+def _opcodes(a: Sequence, b: Sequence) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Edit opcodes turning sequence ``a`` into ``b``.
+
+    Works on strings (character-level) and on lists of lines (line-level).
+
+    Returns:
+        List of (tag, i1, i2, j1, j2) tuples, as in difflib.SequenceMatcher
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return [tuple(op) for op in Levenshtein.opcodes(a, b)]
+    return SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+
+
+def _chunk_pair_fits(a: str, b: str) -> bool:
+    """Check whether two chunks are short and close enough in length to diff by character."""
+    total = len(a) + len(b)
+    return 0 < total <= _MAX_CHUNK_DIFF_CHARS and 2 * min(len(a), len(b)) >= total / 2
+
+
+def _chunked_ratio(a: str, b: str) -> float:
+    """
+    Approximate similarity ratio of two long texts, aligned by paragraph.
+
+    Paragraphs are matched whole first (difflib hashes each line, so equal
+    paragraphs anchor the alignment); character matching then runs only on
+    unaligned paragraph pairs that are short and of similar length. Other
+    unaligned text counts as unmatched, so the result is a lower bound on
+    the exact ratio.
+    """
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+
+    matched = 0
+    for tag, i1, i2, j1, j2 in _opcodes(a_lines, b_lines):
+        if tag == 'equal':
+            matched += sum(len(line) for line in a_lines[i1:i2])
+        elif tag == 'replace':
+            for old_line, new_line in zip(a_lines[i1:i2], b_lines[j1:j2]):
+                if _chunk_pair_fits(old_line, new_line):
+                    matcher = SequenceMatcher(None, old_line, new_line, autojunk=False)
+                    matched += sum(block.size for block in matcher.get_matching_blocks())
+
+    return 2.0 * matched / (len(a) + len(b))
+
+
+def _overlaps(piece: str, pattern: str) -> bool:
+    """
+    Check whether ``pattern`` can share text with ``piece`` wherever it stands.
+
+    True when the pattern lies inside the piece, or when it can run across
+    either edge of the piece: part of the pattern matches the piece and the
+    rest is free to match whatever text surrounds it. An empty piece only
+    joins its neighbours, so any pattern longer than one character can span it.
+    """
+    if pattern in piece:
+        return True
+    n, m = len(piece), len(pattern)
+    if m < 2:
+        return False
+    # Offsets of the pattern's start relative to the piece's start at which
+    # the pattern crosses an edge of the piece
+    for offset in range(1 - m, n):
+        if 0 <= offset and offset + m <= n:
+            continue
+        lo, hi = max(offset, 0), min(offset + m, n)
+        if piece[lo:hi] == pattern[lo - offset:hi - offset]:
+            return True
+    return False
+
+
+def _can_batch(replacements: Dict[str, str], old: str, new: str) -> bool:
+    """
+    Check whether a replacement can join a single-pass batch.
+
+    Applying a batch in one scan matches every pattern against the text as it
+    stood before the batch, while applying them one by one matches later
+    patterns against the text earlier replacements produced. The two agree
+    only when the new pattern cannot share text with an earlier pattern
+    (containment or partial overlap) and cannot be formed by an earlier
+    replacement, alone or joined with the text around it.
+    """
+    if not old or old in replacements:
+        return False
+    return not any(
+        _overlaps(other_old, old) or _overlaps(other_new, old)
+        for other_old, other_new in replacements.items()
+    )
+
+
+def _replace_first_occurrences(text: str, replacements: Dict[str, str]) -> Tuple[str, int]:
+    """
+    Replace the first occurrence of each pattern in a single scan over the text.
+
+    Args:
+        text: Text to rewrite
+        replacements: Mapping of old text to new text
+
+    Returns:
+        Tuple of (rewritten text, number of patterns replaced)
+    """
+    if not replacements:
+        return text, 0
+    if len(replacements) == 1:
+        (old, new), = replacements.items()
+        if old not in text:
+            return text, 0
+        return text.replace(old, new, 1), 1
+
+    pattern = re.compile('|'.join(map(re.escape, replacements)))
+    remaining = dict(replacements)
+    pieces = []
+    last = 0
+
+    for match in pattern.finditer(text):
+        found = match.group(0)
+        if found not in remaining:
+            continue
+        pieces.append(text[last:match.start()])
+        pieces.append(remaining.pop(found))
+        last = match.end()
+        if not remaining:
+            break
+
+    pieces.append(text[last:])
+    return ''.join(pieces), len(replacements) - len(remaining)
+
+
+@dataclass(slots=True)
 class ArticleSnapshot:
     """Represents a snapshot of an article at a point in time."""
     article_number: str
@@ -38,9 +287,26 @@ class ArticleSnapshot:
     is_current: bool = True
     is_repealed: bool = False
     repealed_date: Optional[date] = None
+    # Cached text_hash and the article_text it was computed from
+    _text_hash: str = field(default="", init=False, repr=False, compare=False)
+    _hashed_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
+    @property
+    def text_hash(self) -> str:
+        """
+        Hash of article_text, computed once and recomputed only if the text changes.
+
+        Caching keeps the UTF-8 encoding for hashing to once per text, however
+        many times the snapshot is saved; the driver's encoding of the bind
+        parameter is then the only per-save copy.
+        """
+        if self._hashed_text is not self.article_text:
+            self._text_hash = hash_text(self.article_text)
+            self._hashed_text = self.article_text
+        return self._text_hash
 
-@dataclass
+
+@dataclass(slots=True)
 class DiffResult:
     """Result of applying a diff operation."""
     success: bool
@@ -74,8 +340,8 @@ class ArticleDiffEngine:
         """Initialize the diff engine."""
         self.renumbering_map: Dict[str, str] = {}  # Track article renumbering
 
+    @staticmethod
     def apply_text_replacement(
-        self,
         article_text: str,
         old_text: str,
         new_text: str,
@@ -93,7 +359,7 @@ class ArticleDiffEngine:
         """
         if old_text not in article_text:
             # Try fuzzy matching
-            new_article_text = self._fuzzy_replace(article_text, old_text, new_text)
+            new_article_text = ArticleDiffEngine._fuzzy_replace(article_text, old_text, new_text)
             if new_article_text == article_text:
                 return DiffResult(
                     success=False,
@@ -169,8 +435,8 @@ class ArticleDiffEngine:
 
         return current_articles, []
 
+    @staticmethod
     def apply_repeal(
-        self,
         current_articles: Dict[str, ArticleSnapshot],
         article_number: str,
         repeal_date: date,
@@ -202,8 +468,8 @@ class ArticleDiffEngine:
         current_articles[article_number] = article
         return current_articles
 
+    @staticmethod
     def apply_complex_change(
-        self,
         article_text: str,
         changes: List[Dict[str, str]],
     ) -> DiffResult:
@@ -218,34 +484,69 @@ class ArticleDiffEngine:
                      - new: New text (for replace/add)
                      - position: Optional position for insertions
 
+        Consecutive replace/remove operations that cannot interact (see
+        _can_batch) are applied together in one scan; the result is the same
+        as applying every operation one by one, in order.
+
         Returns:
             DiffResult with the modified text
         """
         result_text = article_text
         changes_applied = 0
 
+        # Consecutive independent replace/remove operations are collected and
+        # applied together in one scan instead of one full-text scan each
+        pending: Dict[str, str] = {}
+        # Appended texts are joined on once, when something needs the full text,
+        # rather than copying the whole article for every append
+        suffix_parts: List[str] = []
+
         for change in changes:
             change_type = change.get('type', '')
             old = change.get('old', '')
             new = change.get('new', '')
 
-            if change_type == 'replace':
-                if old in result_text:
-                    result_text = result_text.replace(old, new, 1)
+            needs_full_text = change_type in ('replace', 'remove') or (
+                change.get('position') is not None
+            )
+            if suffix_parts and needs_full_text:
+                result_text = "\n".join([result_text, *suffix_parts])
+                suffix_parts = []
+
+            if change_type in ('replace', 'remove'):
+                if change_type == 'remove':
+                    new = ''
+
+                if not _can_batch(pending, old, new):
+                    result_text, applied = _replace_first_occurrences(result_text, pending)
+                    changes_applied += applied
+                    pending = {}
+
+                if old:
+                    pending[old] = new
+                elif old in result_text:
+                    # Empty pattern matches at the start, as str.replace does
+                    result_text = new + result_text
                     changes_applied += 1
             elif change_type == 'add':
+                # Positions refer to the text after all preceding operations
+                result_text, applied = _replace_first_occurrences(result_text, pending)
+                changes_applied += applied
+                pending = {}
+
                 position = change.get('position')
                 if position is not None:
                     # Insert at specific position
                     result_text = result_text[:position] + new + result_text[position:]
                 else:
                     # Append to end
-                    result_text = result_text + "\n" + new
+                    suffix_parts.append(new)
                 changes_applied += 1
-            elif change_type == 'remove':
-                if old in result_text:
-                    result_text = result_text.replace(old, '', 1)
-                    changes_applied += 1
+
+        result_text, applied = _replace_first_occurrences(result_text, pending)
+        changes_applied += applied
+        if suffix_parts:
+            result_text = "\n".join([result_text, *suffix_parts])
 
         return DiffResult(
             success=changes_applied > 0,
@@ -255,8 +556,8 @@ class ArticleDiffEngine:
             changes_made=changes_applied,
         )
 
+    @staticmethod
     def create_snapshot(
-        self,
         article_number: str,
         article_text: str,
         article_title: str = "",
@@ -287,10 +588,12 @@ class ArticleDiffEngine:
             is_current=is_current,
         )
 
+    @staticmethod
     def compare_versions(
-        self,
         old_version: ArticleSnapshot,
         new_version: ArticleSnapshot,
+        detail: Literal['ratio', 'opcodes'] = 'opcodes',
+        min_similarity: float = 0.0,
     ) -> Dict[str, Any]:
         """
         Compare two versions of an article and highlight differences.
@@ -298,6 +601,10 @@ class ArticleDiffEngine:
         Args:
             old_version: Previous article version
             new_version: New article version
+            detail: 'opcodes' to describe every text change, or 'ratio' to
+                    skip the diff and only report that the text changed
+            min_similarity: Similarity below which the exact score is not
+                            needed; such versions report similarity 0.0
 
         Returns:
             Dictionary with comparison results:
@@ -315,9 +622,11 @@ class ArticleDiffEngine:
         old_text = old_version.article_text
         new_text = new_version.article_text
 
-        # Calculate similarity using SequenceMatcher
-        matcher = SequenceMatcher(None, old_text, new_text)
-        similarity = matcher.ratio()
+        # Identical texts (common for metadata-only amendments) need no diff
+        if old_text == new_text:
+            similarity = 1.0
+        else:
+            similarity = _similarity(old_text, new_text, score_cutoff=min_similarity)
 
         changes = []
 
@@ -328,17 +637,31 @@ class ArticleDiffEngine:
             else:
                 changes.append("Article reinstated")
 
-        # Check for text changes
-        if old_text != new_text:
-            # Get the differences
-            opcodes = matcher.get_opcodes()
-            for tag, i1, i2, j1, j2 in opcodes:
-                if tag == 'replace':
-                    changes.append(f"Replaced: '{old_text[i1:i2][:50]}...' with '{new_text[j1:j2][:50]}...'")
-                elif tag == 'delete':
-                    changes.append(f"Deleted: '{old_text[i1:i2][:50]}...'")
-                elif tag == 'insert':
-                    changes.append(f"Inserted: '{new_text[j1:j2][:50]}...'")
+        # Check for text changes. Articles are line-structured, so diff whole
+        # lines first; this keeps the matched sequences ~50-100x shorter
+        if old_text != new_text and detail == 'ratio':
+            changes.append("Text changed")
+        elif old_text != new_text:
+            old_lines = old_text.splitlines(keepends=True)
+            new_lines = new_text.splitlines(keepends=True)
+
+            for tag, i1, i2, j1, j2 in _opcodes(old_lines, new_lines):
+                old_chunk = ''.join(old_lines[i1:i2])
+                new_chunk = ''.join(new_lines[j1:j2])
+
+                if (
+                    tag == 'replace'
+                    and i2 - i1 == 1
+                    and j2 - j1 == 1
+                    and _chunk_pair_fits(old_chunk, new_chunk)
+                ):
+                    # A single edited line: pinpoint the edit within it
+                    for sub_tag, k1, k2, l1, l2 in _opcodes(old_chunk, new_chunk):
+                        ArticleDiffEngine._describe_change(
+                            changes, sub_tag, old_chunk[k1:k2], new_chunk[l1:l2]
+                        )
+                else:
+                    ArticleDiffEngine._describe_change(changes, tag, old_chunk, new_chunk)
 
         return {
             'changes_detected': len(changes) > 0,
@@ -346,8 +669,23 @@ class ArticleDiffEngine:
             'similarity': similarity,
         }
 
+    @staticmethod
+    def _describe_change(
+        changes: List[str],
+        tag: str,
+        old_chunk: str,
+        new_chunk: str,
+    ):
+        """Append a human-readable description of one diff opcode to ``changes``."""
+        if tag == 'replace':
+            changes.append(f"Replaced: '{old_chunk[:50]}...' with '{new_chunk[:50]}...'")
+        elif tag == 'delete':
+            changes.append(f"Deleted: '{old_chunk[:50]}...'")
+        elif tag == 'insert':
+            changes.append(f"Inserted: '{new_chunk[:50]}...'")
+
+    @staticmethod
     def _fuzzy_replace(
-        self,
         text: str,
         old: str,
         new: str,
@@ -365,20 +703,38 @@ class ArticleDiffEngine:
         Returns:
             Text with replacements made
         """
-        # Split text into words for matching
-        words = text.split()
-        old_words = old.split()
+        # Locate words by position so unmatched text is never copied or rejoined
+        spans = [match.span() for match in _WORD_RE.finditer(text)]
+        window = len(old.split())
+        if not window or window > len(spans):
+            return text
+
+        # Candidate segments are sliced lazily, one per word window
+        candidates = (
+            text[spans[i][0]:spans[i + window - 1][1]]
+            for i in range(len(spans) - window + 1)
+        )
+
+        if RAPIDFUZZ_AVAILABLE:
+            # Best-match search runs in C++; for a generator the key is its index
+            best = process.extractOne(
+                old, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100
+            )
+            start = best[2] if best else None
+        else:
+            start = next(
+                (
+                    i for i, segment in enumerate(candidates)
+                    if _similarity(segment, old, score_cutoff=threshold) >= threshold
+                ),
+                None,
+            )
 
-        # Try to find approximate match
-        for i in range(len(words) - len(old_words) + 1):
-            segment = ' '.join(words[i:i + len(old_words)])
-            matcher = SequenceMatcher(None, segment, old)
-            if matcher.ratio() >= threshold:
-                # Replace this segment
-                words[i:i + len(old_words)] = [new]
-                return ' '.join(words)
+        if start is None:
+            return text
 
-        return text
+        # Replace this segment, keeping the surrounding whitespace as it was
+        return text[:spans[start][0]] + new + text[spans[start + window - 1][1]:]
 
 
 def apply_amendment_to_article(
@@ -404,10 +760,9 @@ def apply_amendment_to_article(
     Returns:
         New ArticleSnapshot with amendment applied
     """
-    engine = ArticleDiffEngine()
-
+    # The engine's text operations are stateless, so no instance is needed
     if amendment_type == 'modification':
-        result = engine.apply_text_replacement(
+        result = ArticleDiffEngine.apply_text_replacement(
             article.article_text,
             amendment_data.get('old_text', ''),
             amendment_data.get('new_text', ''),
@@ -417,7 +772,7 @@ def apply_amendment_to_article(
 
     elif amendment_type == 'repeal':
         articles = {article.article_number: article}
-        articles = engine.apply_repeal(
+        articles = ArticleDiffEngine.apply_repeal(
             articles,
             article.article_number,
             amendment_data.get('repeal_date', date.today()),
@@ -10,16 +10,20 @@ This module tracks historical versions of articles:
 This is the Russia-specific consolidation engine for tracking historical
 versions of Russian legal articles through amendments.
 """
+import copy
 import logging
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
-from sqlalchemy import text
+from sqlalchemy import column, table, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from scripts.core.db import get_db_connection, get_db_session
-from country_modules.russia.consolidation.diff_engine import ArticleSnapshot
+from country_modules.russia.consolidation.diff_engine import TEXT_HASH_ALGO, ArticleSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +34,218 @@ country_name = "Russia"
 country_code = "RU"
 
 
-@dataclass
+# Upsert of one article version; unchanged rows are skipped by the WHERE guard
+_UPSERT_SNAPSHOT_SQL = """
+    INSERT INTO code_article_versions (
+        code_id,
+        article_number,
+        version_date,
+        article_text,
+        article_title,
+        amendment_eo_number,
+        amendment_date,
+        is_current,
+        is_repealed,
+        repealed_date,
+        text_hash,
+        text_hash_algo
+    ) VALUES (
+        :code_id,
+        :article_number,
+        :version_date,
+        :article_text,
+        :article_title,
+        :amendment_eo_number,
+        :amendment_date,
+        :is_current,
+        :is_repealed,
+        :repealed_date,
+        :text_hash,
+        :text_hash_algo
+    )
+    ON CONFLICT (code_id, article_number, version_date) DO UPDATE
+    SET
+        article_text = EXCLUDED.article_text,
+        article_title = EXCLUDED.article_title,
+        amendment_eo_number = EXCLUDED.amendment_eo_number,
+        is_current = EXCLUDED.is_current,
+        is_repealed = EXCLUDED.is_repealed,
+        repealed_date = EXCLUDED.repealed_date,
+        text_hash = EXCLUDED.text_hash,
+        text_hash_algo = EXCLUDED.text_hash_algo
+    -- Unchanged versions are left alone instead of being rewritten
+    WHERE (
+        code_article_versions.text_hash_algo,
+        code_article_versions.text_hash,
+        code_article_versions.article_title,
+        code_article_versions.amendment_eo_number,
+        code_article_versions.is_current,
+        code_article_versions.is_repealed,
+        code_article_versions.repealed_date
+    ) IS DISTINCT FROM (
+        EXCLUDED.text_hash_algo,
+        EXCLUDED.text_hash,
+        EXCLUDED.article_title,
+        EXCLUDED.amendment_eo_number,
+        EXCLUDED.is_current,
+        EXCLUDED.is_repealed,
+        EXCLUDED.repealed_date
+    )
+"""
+_UPSERT_SNAPSHOT_QUERY = text(_UPSERT_SNAPSHOT_SQL)
+
+
+def _build_bulk_upsert_snapshots():
+    """
+    Build the upsert of _UPSERT_SNAPSHOT_SQL as a Core INSERT for bulk saves.
+
+    Executed with a list of parameter sets, a Core INSERT with RETURNING is
+    sent as multi-row INSERT ... VALUES statements (SQLAlchemy
+    "insertmanyvalues", up to 1000 rows each). A text() statement, or an
+    ON CONFLICT DO UPDATE without RETURNING, falls back to executemany, which
+    costs one round trip per row.
+    """
+    versions = table(
+        "code_article_versions",
+        column("code_id"),
+        column("article_number"),
+        column("version_date"),
+        column("article_text"),
+        column("article_title"),
+        column("amendment_eo_number"),
+        column("amendment_date"),
+        column("is_current"),
+        column("is_repealed"),
+        column("repealed_date"),
+        column("text_hash"),
+        column("text_hash_algo"),
+    )
+    stmt = insert(versions)
+    updated = (
+        "article_text",
+        "article_title",
+        "amendment_eo_number",
+        "is_current",
+        "is_repealed",
+        "repealed_date",
+        "text_hash",
+        "text_hash_algo",
+    )
+    # Same guard as _UPSERT_SNAPSHOT_SQL: unchanged versions are left alone
+    compared = (
+        "text_hash_algo",
+        "text_hash",
+        "article_title",
+        "amendment_eo_number",
+        "is_current",
+        "is_repealed",
+        "repealed_date",
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["code_id", "article_number", "version_date"],
+        set_={name: stmt.excluded[name] for name in updated},
+        where=tuple_(*(versions.c[name] for name in compared)).is_distinct_from(
+            tuple_(*(stmt.excluded[name] for name in compared))
+        ),
+    ).returning(versions.c.article_number)
+
+
+_BULK_UPSERT_SNAPSHOTS = _build_bulk_upsert_snapshots()
+
+# Retires older versions and upserts the new one in a single statement; the
+# data-modifying CTE always runs, and touches only rows dated before the new one
+_SAVE_NEW_VERSION_QUERY = text("""
+    WITH retired AS (
+        UPDATE code_article_versions
+        SET is_current = false
+        WHERE code_id = :code_id
+        AND article_number = :article_number
+        AND version_date < :version_date
+        AND is_current = true
+        RETURNING 1
+    )
+""" + _UPSERT_SNAPSHOT_SQL)
+
+
+# Latest current version of an article
+_GET_CURRENT_VERSION_QUERY = text("""
+    SELECT
+        article_number,
+        article_title,
+        article_text,
+        version_date,
+        amendment_eo_number,
+        is_current,
+        is_repealed,
+        repealed_date
+    FROM code_article_versions
+    WHERE code_id = :code_id
+    AND article_number = :article_number
+    AND is_current = true
+    ORDER BY version_date DESC
+    LIMIT 1
+""")
+
+# Version of an article in effect on a date
+_GET_VERSION_ON_DATE_QUERY = text("""
+    SELECT
+        article_number,
+        article_title,
+        article_text,
+        version_date,
+        amendment_eo_number,
+        is_current,
+        is_repealed,
+        repealed_date
+    FROM code_article_versions
+    WHERE code_id = :code_id
+    AND article_number = :article_number
+    AND version_date <= :query_date
+    ORDER BY version_date DESC
+    LIMIT 1
+""")
+
+# All versions of an article, oldest first
+_GET_AMENDMENT_CHAIN_QUERY = text("""
+    SELECT
+        version_date,
+        amendment_eo_number,
+        is_current,
+        is_repealed,
+        text_hash,
+        text_hash_algo
+    FROM code_article_versions
+    WHERE code_id = :code_id
+    AND article_number = :article_number
+    ORDER BY version_date ASC
+""")
+
+_GET_AMENDMENT_CHAINS_QUERY = text("""
+    SELECT
+        article_number,
+        version_date,
+        amendment_eo_number,
+        is_current,
+        is_repealed,
+        text_hash,
+        text_hash_algo
+    FROM code_article_versions
+    WHERE code_id = :code_id
+    AND article_number = ANY(:article_numbers)
+    ORDER BY article_number, version_date ASC
+""")
+
+# Retire versions older than a new one
+_MARK_OLD_VERSIONS_QUERY = text("""
+    UPDATE code_article_versions
+    SET is_current = false
+    WHERE code_id = :code_id
+    AND article_number = :article_number
+    AND version_date < :new_version_date
+""")
+
+
+@dataclass(slots=True)
 class VersionInfo:
     """Information about a specific version of an article."""
     article_number: str
@@ -39,9 +254,11 @@ class VersionInfo:
     is_current: bool
     is_repealed: bool
     text_hash: str = ""
+    # Hashes are only comparable between versions with the same algorithm
+    text_hash_algo: str = "md5"
 
 
-@dataclass
+@dataclass(slots=True)
 class AmendmentChain:
     """Chain of amendments affecting an article."""
     article_number: str
@@ -78,9 +295,138 @@ class VersionManager:
     country_name = "Russia"
     country_code = "RU"
 
-    def __init__(self):
-        """Initialize the version manager."""
-        self.cache: Dict[str, AmendmentChain] = {}
+    # Maximum number of articles whose looked-up versions are kept in memory
+    SNAPSHOT_CACHE_SIZE = 10_000
+
+    def __init__(self, engine=None):
+        """
+        Initialize the version manager.
+
+        Args:
+            engine: Optional SQLAlchemy engine to lease connections from
+                    (defaults to the shared engine behind get_db_connection)
+        """
+        self.engine = engine
+        # LRU of looked-up versions per (code_id, article_number); inner keys
+        # are None for the current version or the query date
+        self._snapshot_cache: OrderedDict = OrderedDict()
+        # Connection leased by batch(), shared by all calls made inside it
+        self._conn = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Lease one connection for a series of calls.
+
+        Every method called inside the block reuses this connection instead
+        of checking one out of the pool per query; work is committed when the
+        block exits cleanly and rolled back otherwise. A failed write inside
+        the block raises instead of returning False/0, since the rest of the
+        block would only run in an aborted transaction.
+
+        Example:
+            with manager.batch():
+                for number in article_numbers:
+                    manager.get_current_version("TK_RF", number)
+        """
+        if self._conn is not None:
+            # Nested batches share the outer connection
+            yield self._conn
+            return
+
+        with self._connection() as conn:
+            self._conn = conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._conn = None
+
+    @contextmanager
+    def _connection(self, conn=None):
+        """Yield the given connection, the batch connection, or a fresh one."""
+        if conn is not None:
+            yield conn
+        elif self._conn is not None:
+            yield self._conn
+        elif self.engine is not None:
+            with self.engine.connect() as conn:
+                yield conn
+        else:
+            with get_db_connection() as conn:
+                yield conn
+
+    def _in_batch(self, conn=None) -> bool:
+        """Check whether a call given ``conn`` runs on the batch() connection."""
+        return conn is None and self._conn is not None
+
+    @contextmanager
+    def _write(self, conn=None):
+        """
+        Yield a connection for a write and settle its transaction.
+
+        Only a connection opened here is committed; batch() and callers that
+        pass ``conn`` commit their own. A failed write is rolled back, except
+        inside batch(), which rolls back the whole block when the error
+        reaches it.
+        """
+        owns_connection = conn is None and self._conn is None
+        in_batch = self._in_batch(conn)
+
+        with self._connection(conn) as conn:
+            try:
+                yield conn
+            except Exception:
+                if not in_batch:
+                    conn.rollback()
+                raise
+            if owns_connection:
+                conn.commit()
+
+    def invalidate(self, code_id: str, article_number: str):
+        """
+        Drop cached versions of an article.
+
+        Called after every write so lookups never return stale versions.
+
+        Args:
+            code_id: Code identifier
+            article_number: Article number
+        """
+        self._snapshot_cache.pop((code_id, article_number), None)
+
+    def _get_cached(
+        self,
+        code_id: str,
+        article_number: str,
+        query_date: Optional[date] = None,
+    ) -> Optional[ArticleSnapshot]:
+        """Return a copy of a cached version, or None on a miss."""
+        versions = self._snapshot_cache.get((code_id, article_number))
+        if versions is None or query_date not in versions:
+            return None
+
+        self._snapshot_cache.move_to_end((code_id, article_number))
+        # Callers may modify the snapshot (e.g. apply_repeal), so hand out a copy
+        return copy.copy(versions[query_date])
+
+    def _put_cached(
+        self,
+        code_id: str,
+        article_number: str,
+        query_date: Optional[date],
+        snapshot: ArticleSnapshot,
+    ):
+        """Cache a looked-up version, evicting the least recently used article."""
+        key = (code_id, article_number)
+        self._snapshot_cache.setdefault(key, {})[query_date] = copy.copy(snapshot)
+        self._snapshot_cache.move_to_end(key)
+
+        if len(self._snapshot_cache) > self.SNAPSHOT_CACHE_SIZE:
+            self._snapshot_cache.popitem(last=False)
 
     def save_snapshot(
         self,
@@ -94,21 +440,18 @@ class VersionManager:
         Args:
             code_id: Code identifier (e.g., 'TK_RF', 'GK_RF')
             snapshot: Article snapshot to save
-            conn: Optional database connection
+            conn: Optional database connection (committed by the caller)
 
         Returns:
             True if save successful, False otherwise
         """
-        import hashlib
-
-        text_hash = hashlib.md5(snapshot.article_text.encode('utf-8')).hexdigest()
+        # Hash is cached on the snapshot, so repeated saves don't rehash the text
+        text_hash = snapshot.text_hash
+        self.invalidate(code_id, snapshot.article_number)
+        in_batch = self._in_batch(conn)
 
         try:
-            if conn is None:
-                # Use connection from context manager
-                with get_db_connection() as conn:
-                    self._insert_snapshot(conn, code_id, snapshot, text_hash)
-            else:
+            with self._write(conn) as conn:
                 self._insert_snapshot(conn, code_id, snapshot, text_hash)
 
             logger.debug(f"Saved snapshot for article {snapshot.article_number} of {code_id}")
@@ -116,48 +459,101 @@ class VersionManager:
 
         except Exception as e:
             logger.error(f"Failed to save snapshot: {e}")
+            if in_batch:
+                raise
             return False
 
-    def _insert_snapshot(self, conn, code_id: str, snapshot: ArticleSnapshot, text_hash: str):
-        """Insert snapshot into database."""
-        query = text("""
-            INSERT INTO code_article_versions (
-                code_id,
-                article_number,
-                version_date,
-                article_text,
-                article_title,
-                amendment_eo_number,
-                amendment_date,
-                is_current,
-                is_repealed,
-                repealed_date,
-                text_hash
-            ) VALUES (
-                :code_id,
-                :article_number,
-                :version_date,
-                :article_text,
-                :article_title,
-                :amendment_eo_number,
-                :amendment_date,
-                :is_current,
-                :is_repealed,
-                :repealed_date,
-                :text_hash
-            )
-            ON CONFLICT (code_id, article_number, version_date) DO UPDATE
-            SET
-                article_text = EXCLUDED.article_text,
-                article_title = EXCLUDED.article_title,
-                amendment_eo_number = EXCLUDED.amendment_eo_number,
-                is_current = EXCLUDED.is_current,
-                is_repealed = EXCLUDED.is_repealed,
-                repealed_date = EXCLUDED.repealed_date,
-                text_hash = EXCLUDED.text_hash
-        """)
-
-        conn.execute(query, {
+    def save_new_version(
+        self,
+        code_id: str,
+        snapshot: ArticleSnapshot,
+        conn=None,
+    ) -> bool:
+        """
+        Save a new version of an article and mark its older versions as not current.
+
+        Both steps run as one statement, so they take a single round trip and
+        commit atomically.
+
+        Args:
+            code_id: Code identifier (e.g., 'TK_RF', 'GK_RF')
+            snapshot: New article version
+            conn: Optional database connection (committed by the caller)
+
+        Returns:
+            True if save successful, False otherwise
+        """
+        params = self._snapshot_params(code_id, snapshot)
+        self.invalidate(code_id, snapshot.article_number)
+        in_batch = self._in_batch(conn)
+
+        try:
+            with self._write(conn) as conn:
+                conn.execute(_SAVE_NEW_VERSION_QUERY, params)
+
+            logger.debug(f"Saved new version of {code_id}:{snapshot.article_number}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save new version: {e}")
+            if in_batch:
+                raise
+            return False
+
+    def save_snapshots_bulk(
+        self,
+        code_id: str,
+        snapshots: Iterable[ArticleSnapshot],
+        conn=None,
+    ) -> int:
+        """
+        Save many article snapshots in one batch and a single transaction.
+
+        The batch is all or nothing: if any row fails, none are saved.
+
+        Args:
+            code_id: Code identifier (e.g., 'TK_RF', 'GK_RF')
+            snapshots: Article snapshots to save
+            conn: Optional database connection (committed by the caller)
+
+        Returns:
+            Number of snapshots saved (0 if the batch failed)
+        """
+        # Hashes are computed up front so the database call is pure I/O. A
+        # multi-row ON CONFLICT DO UPDATE cannot touch the same row twice, so
+        # a repeated version keeps its last snapshot, as one-by-one saves did
+        params_list = list({
+            (params['article_number'], params['version_date']): params
+            for params in (self._snapshot_params(code_id, snapshot) for snapshot in snapshots)
+        }.values())
+        if not params_list:
+            return 0
+
+        for params in params_list:
+            self.invalidate(code_id, params['article_number'])
+        in_batch = self._in_batch(conn)
+
+        try:
+            with self._write(conn) as conn:
+                conn.execute(_BULK_UPSERT_SNAPSHOTS, params_list)
+
+            logger.debug(f"Saved {len(params_list)} snapshots of {code_id}")
+            return len(params_list)
+
+        except Exception as e:
+            logger.error(f"Failed to save snapshots: {e}")
+            if in_batch:
+                raise
+            return 0
+
+    def _snapshot_params(
+        self,
+        code_id: str,
+        snapshot: ArticleSnapshot,
+        text_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build upsert parameters for a snapshot."""
+        return {
             'code_id': code_id,
             'article_number': snapshot.article_number,
             'version_date': snapshot.version_date,
@@ -168,14 +564,19 @@ class VersionManager:
             'is_current': snapshot.is_current,
             'is_repealed': snapshot.is_repealed,
             'repealed_date': snapshot.repealed_date,
-            'text_hash': text_hash,
-        })
-        conn.commit()
+            'text_hash': text_hash or snapshot.text_hash,
+            'text_hash_algo': TEXT_HASH_ALGO,
+        }
+
+    def _insert_snapshot(self, conn, code_id: str, snapshot: ArticleSnapshot, text_hash: str):
+        """Insert snapshot into database."""
+        conn.execute(_UPSERT_SNAPSHOT_QUERY, self._snapshot_params(code_id, snapshot, text_hash))
 
     def get_current_version(
         self,
         code_id: str,
         article_number: str,
+        conn=None,
     ) -> Optional[ArticleSnapshot]:
         """
         Get the current version of an article.
@@ -183,45 +584,25 @@ class VersionManager:
         Args:
             code_id: Code identifier (e.g., 'TK_RF')
             article_number: Article number
+            conn: Optional database connection
 
         Returns:
             ArticleSnapshot or None if not found
         """
-        cache_key = f"{code_id}:{article_number}"
-
-        if cache_key in self.cache:
-            chain = self.cache[cache_key]
-            if chain.current_version:
-                return self._version_info_to_snapshot(article_number, chain.current_version)
-
-        query = text("""
-            SELECT
-                article_number,
-                article_title,
-                article_text,
-                version_date,
-                amendment_eo_number,
-                is_current,
-                is_repealed,
-                repealed_date
-            FROM code_article_versions
-            WHERE code_id = :code_id
-            AND article_number = :article_number
-            AND is_current = true
-            ORDER BY version_date DESC
-            LIMIT 1
-        """)
+        cached = self._get_cached(code_id, article_number)
+        if cached is not None:
+            return cached
 
         try:
-            with get_db_connection() as conn:
-                result = conn.execute(query, {
+            with self._connection(conn) as conn:
+                result = conn.execute(_GET_CURRENT_VERSION_QUERY, {
                     'code_id': code_id,
                     'article_number': article_number,
                 })
 
                 row = result.fetchone()
                 if row:
-                    return ArticleSnapshot(
+                    snapshot = ArticleSnapshot(
                         article_number=row[0],
                         article_title=row[1] or "",
                         article_text=row[2] or "",
@@ -231,6 +612,8 @@ class VersionManager:
                         is_repealed=row[6] or False,
                         repealed_date=row[7],
                     )
+                    self._put_cached(code_id, article_number, None, snapshot)
+                    return snapshot
         except Exception as e:
             logger.error(f"Failed to get current version: {e}")
 
@@ -241,6 +624,7 @@ class VersionManager:
         code_id: str,
         article_number: str,
         query_date: date,
+        conn=None,
     ) -> Optional[ArticleSnapshot]:
         """
         Get the version of an article that was in effect on a specific date.
@@ -249,31 +633,18 @@ class VersionManager:
             code_id: Code identifier
             article_number: Article number
             query_date: Date to query
+            conn: Optional database connection
 
         Returns:
             ArticleSnapshot as of query_date, or None if not found
         """
-        query = text("""
-            SELECT
-                article_number,
-                article_title,
-                article_text,
-                version_date,
-                amendment_eo_number,
-                is_current,
-                is_repealed,
-                repealed_date
-            FROM code_article_versions
-            WHERE code_id = :code_id
-            AND article_number = :article_number
-            AND version_date <= :query_date
-            ORDER BY version_date DESC
-            LIMIT 1
-        """)
+        cached = self._get_cached(code_id, article_number, query_date)
+        if cached is not None:
+            return cached
 
         try:
-            with get_db_connection() as conn:
-                result = conn.execute(query, {
+            with self._connection(conn) as conn:
+                result = conn.execute(_GET_VERSION_ON_DATE_QUERY, {
                     'code_id': code_id,
                     'article_number': article_number,
                     'query_date': query_date,
@@ -281,7 +652,7 @@ class VersionManager:
 
                 row = result.fetchone()
                 if row:
-                    return ArticleSnapshot(
+                    snapshot = ArticleSnapshot(
                         article_number=row[0],
                         article_title=row[1] or "",
                         article_text=row[2] or "",
@@ -291,6 +662,8 @@ class VersionManager:
                         is_repealed=row[6] or False,
                         repealed_date=row[7],
                     )
+                    self._put_cached(code_id, article_number, query_date, snapshot)
+                    return snapshot
         except Exception as e:
             logger.error(f"Failed to get version on date: {e}")
 
@@ -300,6 +673,7 @@ class VersionManager:
         self,
         code_id: str,
         article_number: str,
+        conn=None,
     ) -> AmendmentChain:
         """
         Get the full amendment chain for an article.
@@ -307,49 +681,97 @@ class VersionManager:
         Args:
             code_id: Code identifier
             article_number: Article number
+            conn: Optional database connection
 
         Returns:
             AmendmentChain with all versions
         """
-        query = text("""
-            SELECT
-                version_date,
-                amendment_eo_number,
-                is_current,
-                is_repealed,
-                text_hash
-            FROM code_article_versions
-            WHERE code_id = :code_id
-            AND article_number = :article_number
-            ORDER BY version_date ASC
-        """)
-
         chain = AmendmentChain(article_number=article_number)
 
         try:
-            with get_db_connection() as conn:
-                result = conn.execute(query, {
+            with self._connection(conn) as conn:
+                result = conn.execute(_GET_AMENDMENT_CHAIN_QUERY, {
                     'code_id': code_id,
                     'article_number': article_number,
                 })
 
-                for row in result:
-                    version_info = VersionInfo(
+                chain.versions.extend(
+                    VersionInfo(
                         article_number=article_number,
                         version_date=row[0],
                         amendment_eo_number=row[1] or "",
                         is_current=row[2],
                         is_repealed=row[3] or False,
                         text_hash=row[4] or "",
+                        text_hash_algo=row[5] or "md5",
                     )
-                    chain.versions.append(version_info)
-                    if row[2]:  # is_current
-                        chain.current_version = version_info
+                    for row in result
+                )
+
+                # Rows are ordered by date, so the latest current version wins
+                chain.current_version = next(
+                    (v for v in reversed(chain.versions) if v.is_current), None
+                )
         except Exception as e:
             logger.error(f"Failed to get amendment chain: {e}")
 
         return chain
 
+    def get_amendment_chains(
+        self,
+        code_id: str,
+        article_numbers: Iterable[str],
+        conn=None,
+        yield_per: int = 1000,
+    ) -> Dict[str, AmendmentChain]:
+        """
+        Get the amendment chains of many articles with a single query.
+
+        Equivalent to calling get_amendment_chain for each article, without
+        a round trip per article. Rows are streamed yield_per at a time.
+
+        Args:
+            code_id: Code identifier
+            article_numbers: Article numbers to load
+            conn: Optional database connection
+            yield_per: Rows fetched from the server per batch
+
+        Returns:
+            Dictionary mapping article_number to its AmendmentChain (empty
+            for articles without versions)
+        """
+        chains = {number: AmendmentChain(article_number=number) for number in article_numbers}
+        if not chains:
+            return chains
+
+        try:
+            with self._connection(conn) as conn:
+                result = conn.execute(
+                    _GET_AMENDMENT_CHAINS_QUERY,
+                    {'code_id': code_id, 'article_numbers': list(chains)},
+                    execution_options={'stream_results': True, 'yield_per': yield_per},
+                )
+
+                for row in result.mappings():
+                    chains[row['article_number']].versions.append(VersionInfo(
+                        article_number=row['article_number'],
+                        version_date=row['version_date'],
+                        amendment_eo_number=row['amendment_eo_number'] or "",
+                        is_current=row['is_current'],
+                        is_repealed=row['is_repealed'] or False,
+                        text_hash=row['text_hash'] or "",
+                        text_hash_algo=row['text_hash_algo'] or "md5",
+                    ))
+        except Exception as e:
+            logger.error(f"Failed to get amendment chains: {e}")
+
+        for chain in chains.values():
+            chain.current_version = next(
+                (v for v in reversed(chain.versions) if v.is_current), None
+            )
+
+        return chains
+
     def mark_old_versions_as_not_current(
         self,
         code_id: str,
@@ -364,27 +786,14 @@ class VersionManager:
             code_id: Code identifier
             article_number: Article number
             new_version_date: Date of new version
-            conn: Optional database connection
+            conn: Optional database connection (committed by the caller)
         """
-        query = text("""
-            UPDATE code_article_versions
-            SET is_current = false
-            WHERE code_id = :code_id
-            AND article_number = :article_number
-            AND version_date < :new_version_date
-        """)
+        self.invalidate(code_id, article_number)
+        in_batch = self._in_batch(conn)
 
         try:
-            if conn is None:
-                with get_db_connection() as conn:
-                    conn.execute(query, {
-                        'code_id': code_id,
-                        'article_number': article_number,
-                        'new_version_date': new_version_date,
-                    })
-                    conn.commit()
-            else:
-                conn.execute(query, {
+            with self._write(conn) as conn:
+                conn.execute(_MARK_OLD_VERSIONS_QUERY, {
                     'code_id': code_id,
                     'article_number': article_number,
                     'new_version_date': new_version_date,
@@ -394,21 +803,47 @@ class VersionManager:
 
         except Exception as e:
             logger.error(f"Failed to mark old versions: {e}")
+            if in_batch:
+                raise
+
+
+def _build_article_history_query(include_preview: bool, has_start: bool, has_end: bool):
+    """Build the article history query for one combination of optional parts."""
+    preview_column = ""
+    if include_preview:
+        preview_column = ",\n            LEFT(article_text, 100) as text_preview"
+
+    query = f"""
+        SELECT
+            version_date,
+            amendment_eo_number,
+            is_current,
+            is_repealed,
+            article_title{preview_column}
+        FROM code_article_versions
+        WHERE code_id = :code_id
+        AND article_number = :article_number
+    """
+
+    if has_start:
+        query += " AND version_date >= :start_date"
+
+    if has_end:
+        query += " AND version_date <= :end_date"
+
+    query += " ORDER BY version_date DESC"
+    return text(query)
 
-    def _version_info_to_snapshot(
-        self,
-        article_number: str,
-        version_info: VersionInfo,
-    ) -> ArticleSnapshot:
-        """Convert VersionInfo to ArticleSnapshot."""
-        return ArticleSnapshot(
-            article_number=article_number,
-            version_date=version_info.version_date,
-            amendment_eo_number=version_info.amendment_eo_number,
-            is_current=version_info.is_current,
-            is_repealed=version_info.is_repealed,
-            repealed_date=version_info.repealed_date,
-        )
+
+# Every (include_preview, has_start, has_end) variant, compiled once at import
+_ARTICLE_HISTORY_QUERIES = {
+    (include_preview, has_start, has_end): _build_article_history_query(
+        include_preview, has_start, has_end
+    )
+    for include_preview in (True, False)
+    for has_start in (True, False)
+    for has_end in (True, False)
+}
 
 
 def get_article_history(
@@ -416,7 +851,9 @@ def get_article_history(
     article_number: str,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> List[Dict[str, Any]]:
+    stream: bool = False,
+    include_preview: bool = True,
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
     """
     Get version history for an article within a date range.
 
@@ -425,40 +862,48 @@ def get_article_history(
         article_number: Article number
         start_date: Optional start date
         end_date: Optional end date
+        stream: If True, return an iterator fed by a server-side cursor
+            instead of a list, so memory stays flat for long histories
+        include_preview: If False, skip the text_preview column
 
     Returns:
-        List of version dictionaries
-    """
-    query = """
-        SELECT
-            version_date,
-            amendment_eo_number,
-            is_current,
-            is_repealed,
-            article_title,
-            LEFT(article_text, 100) as text_preview
-        FROM code_article_versions
-        WHERE code_id = :code_id
-        AND article_number = :article_number
+        List (or iterator, if stream) of version dictionaries
     """
-
     params = {'code_id': code_id, 'article_number': article_number}
 
     if start_date:
-        query += " AND version_date >= :start_date"
         params['start_date'] = start_date
 
     if end_date:
-        query += " AND version_date <= :end_date"
         params['end_date'] = end_date
 
-    query += " ORDER BY version_date DESC"
+    query = _ARTICLE_HISTORY_QUERIES[(include_preview, bool(start_date), bool(end_date))]
+
+    if stream:
+        return _stream_article_history(query, params)
 
     try:
         with get_db_connection() as conn:
-            result = conn.execute(text(query), params)
+            result = conn.execute(query, params)
             columns = result.keys()
             return [dict(zip(columns, row)) for row in result]
     except Exception as e:
         logger.error(f"Failed to get article history: {e}")
         return []
+
+
+def _stream_article_history(
+    query,
+    params: Dict[str, Any],
+    yield_per: int = 100,
+) -> Iterator[Dict[str, Any]]:
+    """Yield article history rows from a server-side cursor, yield_per rows at a time."""
+    try:
+        with get_db_connection() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=yield_per
+            ).execute(query, params)
+            for row in result.mappings():
+                yield dict(row)
+    except Exception as e:
+        logger.error(f"Failed to stream article history: {e}")
@@ -11,7 +11,7 @@ Phase 7C scope:
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 from datetime import date
 import sys
 from pathlib import Path
@@ -31,6 +31,90 @@ from country_modules.russia.scrapers.court_scraper import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of per-item imports awaiting the database at once
+IMPORT_CONCURRENCY = 32
+
+# (court_type, case_number, decision_date): the court_decisions_unique_case key
+DecisionKey = Tuple[str, str, date]
+
+# Upserts a batch of decisions passed as one array per column. legal_issues
+# arrives as JSON text per row because unnest would flatten a 2-D text array.
+# xmax = 0 only for rows this statement inserted.
+_UPSERT_COURT_DECISIONS_SQL = """
+    INSERT INTO court_decisions
+    (country_id, country_code, court_type, court_level, decision_type,
+     case_number, decision_date, title, summary, full_text,
+     legal_issues, articles_interpreted, binding_nature, status, source_url)
+    SELECT $1, $2, d.court_type, 'federal', d.decision_type,
+           d.case_number, d.decision_date, d.title, d.summary, d.full_text,
+           ARRAY(SELECT jsonb_array_elements_text(d.legal_issues::jsonb)),
+           d.articles_interpreted::jsonb, d.binding_nature, 'active', d.source_url
+    FROM unnest(
+        $3::text[], $4::text[], $5::text[], $6::date[], $7::text[], $8::text[],
+        $9::text[], $10::text[], $11::text[], $12::text[], $13::text[]
+    ) AS d(court_type, decision_type, case_number, decision_date, title, summary,
+           full_text, legal_issues, articles_interpreted, binding_nature, source_url)
+    ON CONFLICT (country_id, court_type, case_number, decision_date) DO UPDATE
+    SET title = EXCLUDED.title, summary = EXCLUDED.summary,
+        full_text = EXCLUDED.full_text, legal_issues = EXCLUDED.legal_issues,
+        articles_interpreted = EXCLUDED.articles_interpreted,
+        binding_nature = EXCLUDED.binding_nature, source_url = EXCLUDED.source_url,
+        status = 'active', updated_at = NOW()
+    RETURNING id, court_type, case_number, decision_date, (xmax = 0) AS inserted
+"""
+
+# (court_type, review_title, publication_date): identifies an existing review
+ReviewKey = Tuple[str, str, date]
+
+# practice_reviews has no unique key to upsert on, so existing reviews are
+# looked up in one query and the batch is split into an UPDATE and an INSERT.
+# As with decisions, per-row text arrays arrive as JSON text.
+_SELECT_PRACTICE_REVIEW_IDS_SQL = """
+    SELECT p.id, p.court_type, p.review_title, p.publication_date
+    FROM practice_reviews p
+    JOIN unnest($2::text[], $3::text[], $4::date[])
+        AS k(court_type, review_title, publication_date)
+      ON p.court_type = k.court_type
+     AND p.review_title = k.review_title
+     AND p.publication_date = k.publication_date
+    WHERE p.country_id = $1
+"""
+
+_UPDATE_PRACTICE_REVIEWS_SQL = """
+    UPDATE practice_reviews p
+    SET period_covered = r.period_covered, content = r.content,
+        key_conclusions = ARRAY(SELECT jsonb_array_elements_text(r.key_conclusions::jsonb)),
+        common_errors = ARRAY(SELECT jsonb_array_elements_text(r.common_errors::jsonb)),
+        correct_approach = ARRAY(SELECT jsonb_array_elements_text(r.correct_approach::jsonb)),
+        cases_analyzed = r.cases_analyzed, source_url = r.source_url,
+        updated_at = NOW()
+    FROM unnest(
+        $1::uuid[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[],
+        $7::int[], $8::text[]
+    ) AS r(id, period_covered, content, key_conclusions, common_errors,
+           correct_approach, cases_analyzed, source_url)
+    WHERE p.id = r.id
+"""
+
+_INSERT_PRACTICE_REVIEWS_SQL = """
+    INSERT INTO practice_reviews
+    (country_id, country_code, court_type, review_title, publication_date,
+     period_covered, content, key_conclusions, common_errors,
+     correct_approach, cases_analyzed, source_url)
+    SELECT $1, $2, r.court_type, r.review_title, r.publication_date,
+           r.period_covered, r.content,
+           ARRAY(SELECT jsonb_array_elements_text(r.key_conclusions::jsonb)),
+           ARRAY(SELECT jsonb_array_elements_text(r.common_errors::jsonb)),
+           ARRAY(SELECT jsonb_array_elements_text(r.correct_approach::jsonb)),
+           r.cases_analyzed, r.source_url
+    FROM unnest(
+        $3::text[], $4::text[], $5::date[], $6::text[], $7::text[], $8::text[],
+        $9::text[], $10::text[], $11::int[], $12::text[]
+    ) AS r(court_type, review_title, publication_date, period_covered, content,
+           key_conclusions, common_errors, correct_approach, cases_analyzed, source_url)
+    RETURNING id, court_type, review_title, publication_date
+"""
+
 
 class CourtDecisionImporter:
     """
@@ -49,6 +133,44 @@ class CourtDecisionImporter:
         self.country_id = 1  # Russia's ID in countries table
         self.country_code = "RU"
 
+    @staticmethod
+    async def _import_concurrently(
+        items: List[Any],
+        key: Callable[[Any], Hashable],
+        import_one: Callable[[Any], Awaitable[Any]]
+    ) -> List[Any]:
+        """
+        Run import_one over items with at most IMPORT_CONCURRENCY in flight.
+
+        Items sharing a key are imported one after another, in input order,
+        so the later one still updates the row the earlier one inserted
+        instead of both seeing no row and inserting twice.
+
+        Args:
+            items: Items to import
+            key: Returns the identity of the row an item writes
+            import_one: Coroutine function importing a single item
+
+        Returns:
+            Results aligned with items; a failed import yields its exception
+        """
+        semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+        results: List[Any] = [None] * len(items)
+        groups: Dict[Hashable, List[int]] = {}
+        for i, item in enumerate(items):
+            groups.setdefault(key(item), []).append(i)
+
+        async def run(indices: List[int]) -> None:
+            async with semaphore:
+                for i in indices:
+                    try:
+                        results[i] = await import_one(items[i])
+                    except Exception as e:
+                        results[i] = e
+
+        await asyncio.gather(*(run(indices) for indices in groups.values()))
+        return results
+
     async def import_court_decision(self, decision: CourtDecision) -> str:
         """
         Import a court decision into the database.
@@ -59,78 +181,111 @@ class CourtDecisionImporter:
         Returns:
             UUID of inserted/updated decision record
         """
-        # Check if decision already exists (by case_number and decision_date)
-        existing = await self.db.execute(
-            """
-            SELECT id FROM court_decisions
-            WHERE country_id = $1 AND court_type = $2
-              AND case_number = $3 AND decision_date = $4
-            """,
+        decision_ids = await self.import_court_decisions([decision])
+        return decision_ids[self._decision_key(decision)]
+
+    @staticmethod
+    def _decision_key(decision: CourtDecision) -> DecisionKey:
+        """Key identifying an existing decision (court_decisions_unique_case)."""
+        return decision.court_type, decision.case_number, decision.decision_date
+
+    async def import_court_decisions(
+        self,
+        decisions: List[CourtDecision]
+    ) -> Dict[DecisionKey, str]:
+        """
+        Insert or update court decisions in a single upsert statement.
+
+        Requires the court_decisions_unique_case constraint (migration 006).
+
+        Args:
+            decisions: CourtDecision objects
+
+        Returns:
+            Dict mapping (court_type, case_number, decision_date) to the
+            UUID of the inserted/updated record
+        """
+        if not decisions:
+            return {}
+
+        # One statement cannot update the same row twice; keep the last of any
+        # repeated decision, as importing them one by one did
+        rows = list({self._decision_key(d): d for d in decisions}.values())
+
+        result = await self.db.execute(
+            _UPSERT_COURT_DECISIONS_SQL,
             self.country_id,
-            decision.court_type,
-            decision.case_number,
-            decision.decision_date
+            self.country_code,
+            [d.court_type for d in rows],
+            [d.decision_type for d in rows],
+            [d.case_number for d in rows],
+            [d.decision_date for d in rows],
+            [d.title for d in rows],
+            [d.summary for d in rows],
+            [d.full_text for d in rows],
+            [json.dumps(d.legal_issues or []) for d in rows],
+            [
+                json.dumps(d.articles_interpreted) if d.articles_interpreted else None
+                for d in rows
+            ],
+            [d.binding_nature for d in rows],
+            [d.source_url for d in rows],
         )
 
-        articles_interpreted_json = (
-            json.dumps(decision.articles_interpreted)
-            if decision.articles_interpreted
-            else None
+        decision_ids = {
+            (row["court_type"], row["case_number"], row["decision_date"]): row["id"]
+            for row in result
+        }
+        inserted = sum(1 for row in result if row["inserted"])
+        logger.info(
+            f"Upserted {len(rows)} court decisions "
+            f"({inserted} inserted, {len(rows) - inserted} updated)"
         )
+        return decision_ids
 
-        if existing:
-            # Update existing decision
-            decision_uuid = existing[0]["id"]
-            await self.db.execute(
-                """
-                UPDATE court_decisions
-                SET title = $1, summary = $2, full_text = $3,
-                    legal_issues = $4, articles_interpreted = $5,
-                    binding_nature = $6, source_url = $7,
-                    status = 'active', updated_at = NOW()
-                WHERE id = $8
-                """,
-                decision.title,
-                decision.summary,
-                decision.full_text,
-                decision.legal_issues or [],
-                articles_interpreted_json,
-                decision.binding_nature,
-                decision.source_url,
-                decision_uuid
+    async def _import_decisions_with_stats(
+        self,
+        decisions: List[CourtDecision],
+        stats: Dict[str, int]
+    ) -> Dict[str, str]:
+        """
+        Import decisions in one batch, falling back to one at a time on failure.
+
+        The fallback keeps the per-decision error accounting: one bad decision
+        fails only itself rather than the whole batch.
+
+        Args:
+            decisions: CourtDecision objects
+            stats: Statistics dict; "decisions" and "errors" are incremented
+
+        Returns:
+            Dict mapping case_number to decision UUID for imported decisions
+        """
+        try:
+            decision_ids = await self.import_court_decisions(decisions)
+        except Exception as e:
+            logger.error(
+                f"Batch import of {len(decisions)} decisions failed, "
+                f"retrying one by one: {e}"
             )
-            logger.debug(f"Updated court decision: {decision.case_number}")
         else:
-            # Insert new decision
-            result = await self.db.execute(
-                """
-                INSERT INTO court_decisions
-                (country_id, country_code, court_type, court_level, decision_type,
-                 case_number, decision_date, title, summary, full_text,
-                 legal_issues, articles_interpreted, binding_nature, status, source_url)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
-                RETURNING id
-                """,
-                self.country_id,
-                self.country_code,
-                decision.court_type,
-                "federal",  # Supreme and Constitutional are federal courts
-                decision.decision_type,
-                decision.case_number,
-                decision.decision_date,
-                decision.title,
-                decision.summary,
-                decision.full_text,
-                decision.legal_issues or [],
-                articles_interpreted_json,
-                decision.binding_nature,
-                "active",
-                decision.source_url
-            )
-            decision_uuid = result[0]["id"]
-            logger.info(f"Inserted court decision: {decision.case_number}")
+            stats["decisions"] += len(decisions)
+            return {
+                d.case_number: decision_ids[self._decision_key(d)] for d in decisions
+            }
 
-        return decision_uuid
+        results = await self._import_concurrently(
+            decisions, self._decision_key, self.import_court_decision
+        )
+        decision_map = {}
+        for decision, result in zip(decisions, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to import decision {decision.case_number}: {result}")
+                stats["errors"] += 1
+            else:
+                decision_map[decision.case_number] = result
+                stats["decisions"] += 1
+        return decision_map
 
     async def import_practice_review(self, review: PracticeReview) -> str:
         """
@@ -142,69 +297,126 @@ class CourtDecisionImporter:
         Returns:
             UUID of inserted/updated review record
         """
-        # Check if review already exists
+        review_ids = await self.import_practice_reviews([review])
+        return review_ids[self._review_key(review)]
+
+    @staticmethod
+    def _review_key(review: PracticeReview) -> ReviewKey:
+        """Key identifying an existing practice review."""
+        return review.court_type, review.review_title, review.publication_date
+
+    async def import_practice_reviews(
+        self,
+        reviews: List[PracticeReview]
+    ) -> Dict[ReviewKey, str]:
+        """
+        Insert or update practice reviews with one lookup for the whole batch.
+
+        Existing reviews are fetched in a single query, then updated in one
+        statement and the new ones inserted in another.
+
+        Args:
+            reviews: PracticeReview objects
+
+        Returns:
+            Dict mapping (court_type, review_title, publication_date) to the
+            UUID of the inserted/updated record
+        """
+        if not reviews:
+            return {}
+
+        # Keep the last of any repeated review, as importing them one by one did
+        rows = list({self._review_key(r): r for r in reviews}.values())
+
         existing = await self.db.execute(
-            """
-            SELECT id FROM practice_reviews
-            WHERE country_id = $1 AND court_type = $2
-              AND review_title = $3 AND publication_date = $4
-            """,
+            _SELECT_PRACTICE_REVIEW_IDS_SQL,
             self.country_id,
-            review.court_type,
-            review.review_title,
-            review.publication_date
+            [r.court_type for r in rows],
+            [r.review_title for r in rows],
+            [r.publication_date for r in rows],
         )
+        review_ids: Dict[ReviewKey, str] = {}
+        for row in existing:
+            review_ids.setdefault(
+                (row["court_type"], row["review_title"], row["publication_date"]),
+                row["id"]
+            )
 
-        if existing:
-            # Update existing review
-            review_uuid = existing[0]["id"]
+        to_update = [r for r in rows if self._review_key(r) in review_ids]
+        to_insert = [r for r in rows if self._review_key(r) not in review_ids]
+
+        if to_update:
             await self.db.execute(
-                """
-                UPDATE practice_reviews
-                SET period_covered = $1, content = $2,
-                    key_conclusions = $3, common_errors = $4,
-                    correct_approach = $5, cases_analyzed = $6,
-                    source_url = $7, updated_at = NOW()
-                WHERE id = $8
-                """,
-                review.period_covered,
-                review.content,
-                review.key_conclusions or [],
-                review.common_errors or [],
-                review.correct_approaches or [],
-                review.cases_analyzed,
-                review.source_url,
-                review_uuid
+                _UPDATE_PRACTICE_REVIEWS_SQL,
+                [review_ids[self._review_key(r)] for r in to_update],
+                [r.period_covered for r in to_update],
+                [r.content for r in to_update],
+                [json.dumps(r.key_conclusions or []) for r in to_update],
+                [json.dumps(r.common_errors or []) for r in to_update],
+                [json.dumps(r.correct_approaches or []) for r in to_update],
+                [r.cases_analyzed for r in to_update],
+                [r.source_url for r in to_update],
             )
-            logger.debug(f"Updated practice review: {review.review_title}")
-        else:
-            # Insert new review
+
+        if to_insert:
             result = await self.db.execute(
-                """
-                INSERT INTO practice_reviews
-                (country_id, country_code, court_type, review_title, publication_date,
-                 period_covered, content, key_conclusions, common_errors,
-                 correct_approach, cases_analyzed, source_url)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                RETURNING id
-                """,
+                _INSERT_PRACTICE_REVIEWS_SQL,
                 self.country_id,
                 self.country_code,
-                review.court_type,
-                review.review_title,
-                review.publication_date,
-                review.period_covered,
-                review.content,
-                review.key_conclusions or [],
-                review.common_errors or [],
-                review.correct_approaches or [],
-                review.cases_analyzed,
-                review.source_url
+                [r.court_type for r in to_insert],
+                [r.review_title for r in to_insert],
+                [r.publication_date for r in to_insert],
+                [r.period_covered for r in to_insert],
+                [r.content for r in to_insert],
+                [json.dumps(r.key_conclusions or []) for r in to_insert],
+                [json.dumps(r.common_errors or []) for r in to_insert],
+                [json.dumps(r.correct_approaches or []) for r in to_insert],
+                [r.cases_analyzed for r in to_insert],
+                [r.source_url for r in to_insert],
+            )
+            for row in result:
+                review_ids[
+                    (row["court_type"], row["review_title"], row["publication_date"])
+                ] = row["id"]
+
+        logger.info(
+            f"Imported {len(rows)} practice reviews "
+            f"({len(to_insert)} inserted, {len(to_update)} updated)"
+        )
+        return review_ids
+
+    async def _import_reviews_with_stats(
+        self,
+        reviews: List[PracticeReview],
+        stats: Dict[str, int]
+    ) -> None:
+        """
+        Import reviews in one batch, falling back to one at a time on failure.
+
+        Args:
+            reviews: PracticeReview objects
+            stats: Statistics dict; "reviews" and "errors" are incremented
+        """
+        try:
+            await self.import_practice_reviews(reviews)
+        except Exception as e:
+            logger.error(
+                f"Batch import of {len(reviews)} reviews failed, "
+                f"retrying one by one: {e}"
             )
-            review_uuid = result[0]["id"]
-            logger.info(f"Inserted practice review: {review.review_title}")
+        else:
+            stats["reviews"] += len(reviews)
+            return
 
-        return review_uuid
+        results = await self._import_concurrently(
+            reviews, self._review_key, self.import_practice_review
+        )
+        for review, result in zip(reviews, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to import review {review.review_title}: {result}")
+                stats["errors"] += 1
+            else:
+                stats["reviews"] += 1
 
     async def import_legal_position(
         self,
@@ -294,22 +506,10 @@ class CourtDecisionImporter:
         }
 
         # Import decisions
-        for decision in decisions:
-            try:
-                await self.import_court_decision(decision)
-                stats["decisions"] += 1
-            except Exception as e:
-                logger.error(f"Failed to import decision {decision.case_number}: {e}")
-                stats["errors"] += 1
+        await self._import_decisions_with_stats(decisions, stats)
 
         # Import practice reviews
-        for review in reviews:
-            try:
-                await self.import_practice_review(review)
-                stats["reviews"] += 1
-            except Exception as e:
-                logger.error(f"Failed to import review {review.review_title}: {e}")
-                stats["errors"] += 1
+        await self._import_reviews_with_stats(reviews, stats)
 
         return stats
 
@@ -335,29 +535,29 @@ class CourtDecisionImporter:
         }
 
         # Import decisions
-        decision_map = {}  # Map case_number to decision UUID
-        for decision in decisions:
-            try:
-                decision_uuid = await self.import_court_decision(decision)
-                decision_map[decision.case_number] = decision_uuid
-                stats["decisions"] += 1
-            except Exception as e:
-                logger.error(f"Failed to import decision {decision.case_number}: {e}")
-                stats["errors"] += 1
+        decision_map = await self._import_decisions_with_stats(decisions, stats)
 
         # Import legal positions
         if positions:
+            matched = []  # (decision UUID, position)
             for position in positions:
-                try:
-                    decision_uuid = decision_map.get(position.decision_id)
-                    if decision_uuid:
-                        await self.import_legal_position(decision_uuid, position)
-                        stats["positions"] += 1
-                    else:
-                        logger.warning(f"No decision found for position: {position.decision_id}")
-                except Exception as e:
-                    logger.error(f"Failed to import legal position: {e}")
+                decision_uuid = decision_map.get(position.decision_id)
+                if decision_uuid:
+                    matched.append((decision_uuid, position))
+                else:
+                    logger.warning(f"No decision found for position: {position.decision_id}")
+
+            results = await self._import_concurrently(
+                matched,
+                lambda item: (item[0], item[1].position_text),
+                lambda item: self.import_legal_position(*item)
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to import legal position: {result}")
                     stats["errors"] += 1
+                else:
+                    stats["positions"] += 1
 
         return stats
 
@@ -291,21 +291,6 @@ class CourtScraper(BaseScraper):
         logger.warning(f"{self.court_type} court updates fetching not yet implemented")
         return []
 
-    async def verify_document(self, doc_id: str, content_hash: str) -> bool:
-        """
-        Verify court decision content matches hash.
-
-        Args:
-            doc_id: Document identifier
-            content_hash: Expected hash value (SHA-256)
-
-        Returns:
-            bool: True if hash matches
-        """
-        doc = await self.fetch_document(doc_id)
-        computed_hash = hashlib.sha256(doc.content).hexdigest()
-        return computed_hash == content_hash
-
     async def fetch_supreme_plenary_resolutions(
         self,
         since: Optional[date] = None,
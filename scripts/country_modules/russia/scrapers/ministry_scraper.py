@@ -1593,21 +1593,6 @@ class MinistryScraper(BaseScraper):
         logger.info(f"Fetched {len(documents)} documents since {since}")
         return documents
 
-    async def verify_document(self, doc_id: str, content_hash: str) -> bool:
-        """
-        Verify ministry letter content matches hash.
-
-        Args:
-            doc_id: Document identifier
-            content_hash: Expected hash value (SHA-256)
-
-        Returns:
-            bool: True if hash matches
-        """
-        doc = await self.fetch_document(doc_id)
-        computed_hash = hashlib.sha256(doc.content).hexdigest()
-        return computed_hash == content_hash
-
     async def fetch_letters(
         self,
         start_date: Optional[date] = None,
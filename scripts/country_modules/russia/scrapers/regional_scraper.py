@@ -22,7 +22,6 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import date
 from dataclasses import dataclass
-import hashlib
 import re
 
 from ...base.scraper import BaseScraper, RawDocument
@@ -234,21 +233,6 @@ class RegionalScraper(BaseScraper):
         logger.warning("Regional updates fetching not yet implemented")
         return []
 
-    async def verify_document(self, doc_id: str, content_hash: str) -> bool:
-        """
-        Verify regional document content matches hash.
-
-        Args:
-            doc_id: Document identifier
-            content_hash: Expected hash value (SHA-256)
-
-        Returns:
-            bool: True if hash matches
-        """
-        doc = await self.fetch_document(doc_id)
-        computed_hash = hashlib.sha256(doc.content).hexdigest()
-        return computed_hash == content_hash
-
     async def fetch_regional_koap(self, region_key: str) -> Dict[str, Any]:
         """
         Fetch regional Administrative Code (KoAP) for a specific region.
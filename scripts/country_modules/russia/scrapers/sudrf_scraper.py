@@ -599,12 +599,9 @@ class SudrfScraper(BaseScraper):
         # Extract decision content
         decision_data = self._parse_decision_page(soup, doc_id, url)
 
-        # Generate content
+        # Generate content (RawDocument.content_hash hashes it on demand)
         content = decision_data.get("full_text", "")
 
-        # Generate hash
-        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-
         return RawDocument(
             doc_id=doc_id,
             url=url,
@@ -743,25 +740,6 @@ class SudrfScraper(BaseScraper):
         logger.info(f"Fetched {len(documents)} court decisions from SUDRF")
         return documents
 
-    async def verify_document(
-        self,
-        doc_id: str,
-        content_hash: str
-    ) -> bool:
-        """
-        Verify document content matches hash.
-
-        Args:
-            doc_id: Document identifier
-            content_hash: Expected hash value
-
-        Returns:
-            bool: True if hash matches
-        """
-        doc = await self.fetch_document(doc_id)
-        actual_hash = hashlib.sha256(doc.content).hexdigest()
-        return actual_hash == content_hash
-
 
 # Convenience function for quick usage
 async def fetch_court_decisions(
@@ -10,6 +10,7 @@ current centralized architecture, enabling future P2P implementations.
 import hashlib
 import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -81,9 +82,10 @@ class PostgreSQLSync(DocumentSync):
         """
         self._ensure_manifest_table_exists()
 
+        manifest.last_updated = int(time.time())
         manifest_data = {
             "country_id": manifest.country_id,
-            "documents": manifest.documents,
+            "documents": dict(manifest.documents),
             "last_updated": manifest.last_updated,
             "metadata": manifest.metadata,
         }
@@ -121,8 +123,10 @@ class PostgreSQLSync(DocumentSync):
         """
         self._ensure_manifest_table_exists()
 
+        # last_updated is a TIMESTAMP without time zone written by NOW() in the
+        # session time zone; the cast reads it back in that zone, not as UTC
         query = text("""
-            SELECT manifest_data, last_updated
+            SELECT manifest_data, EXTRACT(EPOCH FROM last_updated::timestamptz)::bigint
             FROM document_manifests
             WHERE country_id = :country_id
         """)
@@ -136,10 +140,15 @@ class PostgreSQLSync(DocumentSync):
                     return None
 
                 manifest_data = row[0]
+                # publish_manifest stores the epoch seconds it set; manifests
+                # published before that carry an ISO string instead
+                last_updated = manifest_data.get("last_updated")
+                if not isinstance(last_updated, int):
+                    last_updated = row[1] or 0
                 return DocumentManifest(
                     country_id=manifest_data["country_id"],
                     documents=manifest_data["documents"],
-                    last_updated=row[1],
+                    last_updated=last_updated,
                     metadata=manifest_data.get("metadata", {}),
                 )
         except Exception as e:
@@ -53,6 +53,23 @@ class TestArticleSnapshot:
         assert snapshot.article_title == "Test Article"
         assert snapshot.is_repealed is True
 
+    def test_text_hash_follows_article_text(self):
+        """Test that text_hash is cached and refreshed when the text changes."""
+        snapshot = ArticleSnapshot(article_number="123", article_text="Old text")
+        old_hash = snapshot.text_hash
+
+        assert len(old_hash) == 32
+        assert snapshot.text_hash == old_hash
+
+        snapshot.article_text = "New text"
+        assert snapshot.text_hash != old_hash
+
+    def test_hash_text_accepts_bytes(self):
+        """Test that pre-encoded text hashes the same as the string."""
+        from country_modules.russia.consolidation.diff_engine import hash_text
+
+        assert hash_text("Статья 1".encode("utf-8")) == hash_text("Статья 1")
+
 
 class TestDiffResult:
     """Tests for DiffResult dataclass."""
@@ -149,6 +166,15 @@ class TestApplyTextReplacement:
         # Empty string is in any string, so it might succeed or fail
         assert isinstance(result, DiffResult)
 
+    def test_replace_without_instance(self):
+        """Test that text operations can be called on the class directly."""
+        result = ArticleDiffEngine.apply_text_replacement(
+            "The quick brown fox",
+            "quick",
+            "slow",
+        )
+        assert result.new_text == "The slow brown fox"
+
 
 class TestApplyAddition:
     """Tests for apply_addition method."""
@@ -314,6 +340,71 @@ class TestApplyComplexChange:
 
         assert result.new_text == "12345MIDDLE67890"
 
+    def test_apply_replacements_first_occurrence_each(self):
+        """Test that each replacement changes only its first occurrence."""
+        engine = ArticleDiffEngine()
+        changes = [
+            {"type": "replace", "old": "cat", "new": "dog"},
+            {"type": "remove", "old": "big "},
+            {"type": "replace", "old": "mouse", "new": "rat"},
+        ]
+
+        result = engine.apply_complex_change(
+            "The big cat saw a mouse, a big cat and a mouse",
+            changes,
+        )
+
+        assert result.new_text == "The dog saw a rat, a big cat and a mouse"
+        assert result.changes_made == 3
+
+    def test_apply_chained_replacements_in_order(self):
+        """Test that a replacement of a previous replacement's output still applies."""
+        engine = ArticleDiffEngine()
+        changes = [
+            {"type": "replace", "old": "one", "new": "two"},
+            {"type": "replace", "old": "two", "new": "three"},
+        ]
+
+        result = engine.apply_complex_change("one", changes)
+
+        assert result.new_text == "three"
+        assert result.changes_made == 2
+
+    @pytest.mark.parametrize(
+        "text,replacements,expected",
+        [
+            # Patterns overlap partially in the text
+            ("abcde", [("cde", "Y"), ("abc", "X")], "abY"),
+            # A replacement joined with the following text forms a later pattern
+            ("xyb", [("xy", "a"), ("ab", "Z")], "Z"),
+            # A later pattern only occurs once an earlier one is replaced
+            ("ab abc", [("ab", "Q"), ("bc", "R")], "Q aR"),
+        ],
+    )
+    def test_apply_interacting_replacements_in_order(self, text, replacements, expected):
+        """Test that replacements that interact give the one-by-one result."""
+        engine = ArticleDiffEngine()
+        changes = [{"type": "replace", "old": old, "new": new} for old, new in replacements]
+
+        result = engine.apply_complex_change(text, changes)
+
+        assert result.new_text == expected
+
+    def test_apply_appends_then_replace_in_appended_text(self):
+        """Test that appended paragraphs are visible to later operations."""
+        engine = ArticleDiffEngine()
+        changes = [
+            {"type": "add", "new": "Part 2"},
+            {"type": "add", "new": "Part 3"},
+            {"type": "replace", "old": "Part 3", "new": "Part 3 (amended)"},
+            {"type": "add", "new": "Part 4"},
+        ]
+
+        result = engine.apply_complex_change("Part 1", changes)
+
+        assert result.new_text == "Part 1\nPart 2\nPart 3 (amended)\nPart 4"
+        assert result.changes_made == 4
+
     def test_apply_complex_change_no_changes(self):
         """Test applying changes that don't match."""
         engine = ArticleDiffEngine()
@@ -381,6 +472,19 @@ class TestCompareVersions:
         assert result["changes_detected"] is False
         assert result["similarity"] == 1.0
 
+    @patch("country_modules.russia.consolidation.diff_engine._similarity")
+    def test_compare_identical_versions_skips_diff(self, mock_similarity):
+        """Test that identical texts are not run through the matcher."""
+        engine = ArticleDiffEngine()
+        v1 = ArticleSnapshot(article_number="123", article_text="Same text")
+        v2 = ArticleSnapshot(article_number="123", article_text="Same text")
+
+        result = engine.compare_versions(v1, v2)
+
+        mock_similarity.assert_not_called()
+        assert result["changes"] == []
+        assert result["similarity"] == 1.0
+
     def test_compare_different_text(self):
         """Test comparing versions with different text."""
         engine = ArticleDiffEngine()
@@ -399,6 +503,45 @@ class TestCompareVersions:
         assert result["similarity"] < 1.0
         assert len(result["changes"]) > 0
 
+    def test_compare_ratio_only(self):
+        """Test that detail='ratio' skips the per-change descriptions."""
+        engine = ArticleDiffEngine()
+        v1 = ArticleSnapshot(article_number="123", article_text="Old text")
+        v2 = ArticleSnapshot(article_number="123", article_text="New text")
+
+        result = engine.compare_versions(v1, v2, detail="ratio")
+
+        assert result["changes_detected"] is True
+        assert result["changes"] == ["Text changed"]
+        assert 0.0 < result["similarity"] < 1.0
+
+    def test_compare_below_min_similarity(self):
+        """Test that versions below min_similarity report similarity 0.0."""
+        engine = ArticleDiffEngine()
+        v1 = ArticleSnapshot(article_number="123", article_text="Old text")
+        v2 = ArticleSnapshot(article_number="123", article_text="Completely different")
+
+        result = engine.compare_versions(v1, v2, detail="ratio", min_similarity=0.9)
+
+        assert result["similarity"] == 0.0
+        assert result["changes_detected"] is True
+
+    def test_compare_multiline_text_by_lines(self):
+        """Test that changes are reported per line, not per character run."""
+        engine = ArticleDiffEngine()
+        v1 = ArticleSnapshot(
+            article_number="123",
+            article_text="First line\nSecond line\n",
+        )
+        v2 = ArticleSnapshot(
+            article_number="123",
+            article_text="First line\nSecond line\nThird line\n",
+        )
+
+        result = engine.compare_versions(v1, v2)
+
+        assert result["changes"] == ["Inserted: 'Third line\n...'"]
+
     def test_compare_different_articles(self):
         """Test comparing different article numbers."""
         engine = ArticleDiffEngine()
@@ -524,3 +667,74 @@ class TestFuzzyReplace:
         )
         # May or may not succeed depending on similarity
         assert isinstance(result, str)
+
+    def test_fuzzy_replace_preserves_whitespace(self):
+        """Test that text outside the matched window keeps its whitespace."""
+        engine = ArticleDiffEngine()
+        result = engine._fuzzy_replace(
+            "1. The qick brown fox\n2. Second  line",
+            "quick brown",
+            "slow grey",
+            threshold=0.8,
+        )
+        assert result == "1. The slow grey fox\n2. Second  line"
+
+
+class TestIndelRatio:
+    """Tests for the similarity kernel used when rapidfuzz is unavailable."""
+
+    def test_indel_ratio_matches_rapidfuzz_scale(self):
+        """Test that the kernel computes 2 * LCS / (len(a) + len(b))."""
+        from country_modules.russia.consolidation.diff_engine import _indel_ratio
+
+        # LCS of "статья" and "статьи" is "стать" (5 of 12 characters each side)
+        assert _indel_ratio("статья", "статьи") == pytest.approx(10 / 12)
+        assert _indel_ratio("", "") == 1.0
+        assert _indel_ratio("abc", "xyz") == 0.0
+
+    def test_large_text_skips_kernel(self):
+        """Test that very long texts are aligned by paragraph even with numba."""
+        from country_modules.russia.consolidation.diff_engine import _similarity
+
+        old = "".join(f"Пункт {i}. Работодатель обязан соблюдать закон.\n" for i in range(5000))
+        new = old.replace("Пункт 2500. Работодатель", "Пункт 2500. Работник")
+
+        module = "country_modules.russia.consolidation.diff_engine"
+        with patch(f"{module}.RAPIDFUZZ_AVAILABLE", False), patch(
+            f"{module}.NUMBA_AVAILABLE", True
+        ), patch(f"{module}._indel_ratio_jit", create=True) as kernel:
+            assert 0.99 < _similarity(old, new) < 1.0
+
+        kernel.assert_not_called()
+
+
+
+class TestDifflibFallback:
+    """Tests for the difflib similarity path used without rapidfuzz or numba."""
+
+    @pytest.fixture(autouse=True)
+    def difflib_only(self):
+        with patch(
+            "country_modules.russia.consolidation.diff_engine.RAPIDFUZZ_AVAILABLE", False
+        ), patch("country_modules.russia.consolidation.diff_engine.NUMBA_AVAILABLE", False):
+            yield
+
+    def test_long_text_not_skewed_by_autojunk(self):
+        """Test that frequent characters still count as matches past 200 characters."""
+        from country_modules.russia.consolidation.diff_engine import _indel_ratio, _similarity
+
+        old = "статья " * 50
+        new = "статья " * 49 + "пункт "
+        assert _similarity(old, new) == pytest.approx(_indel_ratio(old, new))
+
+    def test_large_text_aligned_by_paragraph(self):
+        """Test that very long texts are compared paragraph by paragraph."""
+        from country_modules.russia.consolidation.diff_engine import _similarity
+
+        paragraphs = [f"Пункт {i}. Работодатель обязан соблюдать закон.\n" for i in range(5000)]
+        old = "".join(paragraphs)
+        paragraphs[2500] = "Пункт 2500. Работник обязан соблюдать закон.\n"
+        new = "".join(paragraphs)
+
+        assert len(old) + len(new) > 200_000
+        assert 0.99 < _similarity(old, new) < 1.0
@@ -105,13 +105,14 @@ class TestVersionManagerInit:
     def test_init_default(self):
         """Test default initialization."""
         manager = VersionManager()
-        assert manager.cache == {}
+        assert manager.engine is None
+        assert len(manager._snapshot_cache) == 0
 
 
 class TestSaveSnapshot:
     """Tests for save_snapshot method."""
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_save_snapshot_success(self, mock_get_conn):
         """Test successful snapshot save."""
         mock_conn = MagicMock()
@@ -126,13 +127,13 @@ class TestSaveSnapshot:
             amendment_eo_number="0001202601170001",
         )
 
-        result = manager.save_snapshot("TK_RF", snapshot, mock_conn)
+        result = manager.save_snapshot("TK_RF", snapshot)
 
         assert result is True
         mock_conn.execute.assert_called_once()
         mock_conn.commit.assert_called_once()
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_save_snapshot_with_provided_conn(self, mock_get_conn):
         """Test saving snapshot with provided connection."""
         mock_conn = MagicMock()
@@ -148,8 +149,11 @@ class TestSaveSnapshot:
         assert result is True
         # Should use provided connection, not get_db_connection
         mock_conn.execute.assert_called_once()
+        mock_get_conn.assert_not_called()
+        # The caller owns the transaction
+        mock_conn.commit.assert_not_called()
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_save_snapshot_database_error(self, mock_get_conn):
         """Test handling database error during save."""
         mock_conn = MagicMock()
@@ -165,12 +169,127 @@ class TestSaveSnapshot:
         result = manager.save_snapshot("TK_RF", snapshot)
 
         assert result is False
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+
+
+class TestSaveNewVersion:
+    """Tests for save_new_version method."""
+
+    def test_save_new_version_single_statement(self):
+        """Test that retiring old versions and inserting is one statement."""
+        mock_conn = MagicMock()
+
+        manager = VersionManager()
+        snapshot = ArticleSnapshot(
+            article_number="123",
+            article_text="New content",
+            version_date=date(2026, 1, 1),
+        )
+
+        result = manager.save_new_version("TK_RF", snapshot, conn=mock_conn)
+
+        assert result is True
+        mock_conn.execute.assert_called_once()
+        query = str(mock_conn.execute.call_args[0][0])
+        assert "UPDATE code_article_versions" in query
+        assert "INSERT INTO code_article_versions" in query
+        # The caller owns the transaction
+        mock_conn.commit.assert_not_called()
+
+    def test_save_new_version_database_error(self):
+        """Test handling database error during save."""
+        mock_conn = MagicMock()
+        mock_conn.execute.side_effect = Exception("Database error")
+
+        snapshot = ArticleSnapshot(article_number="123", article_text="New content")
+        result = VersionManager().save_new_version("TK_RF", snapshot, conn=mock_conn)
+
+        assert result is False
+        mock_conn.rollback.assert_called_once()
+
+
+class TestSaveSnapshotsBulk:
+    """Tests for save_snapshots_bulk method."""
+
+    def test_save_snapshots_bulk_single_batch(self):
+        """Test that all snapshots go out in one execute and one commit."""
+        mock_engine = MagicMock()
+        mock_conn = mock_engine.connect.return_value.__enter__.return_value
+
+        manager = VersionManager(engine=mock_engine)
+        snapshots = [
+            ArticleSnapshot(article_number="1", article_text="First"),
+            ArticleSnapshot(article_number="2", article_text="Second"),
+        ]
+
+        saved = manager.save_snapshots_bulk("TK_RF", snapshots)
+
+        assert saved == 2
+        mock_conn.execute.assert_called_once()
+        params_list = mock_conn.execute.call_args[0][1]
+        assert [p["article_number"] for p in params_list] == ["1", "2"]
+        mock_conn.commit.assert_called_once()
+
+    def test_save_snapshots_bulk_sent_as_multirow_insert(self):
+        """Test that the bulk upsert compiles to multi-row INSERTs, not executemany."""
+        from sqlalchemy.dialects.postgresql import psycopg2
+
+        from country_modules.russia.consolidation.version_manager import _BULK_UPSERT_SNAPSHOTS
+
+        params = VersionManager()._snapshot_params(
+            "TK_RF", ArticleSnapshot(article_number="1", article_text="First")
+        )
+        dialect = psycopg2.dialect()
+        compiled = dialect.statement_compiler(
+            dialect, _BULK_UPSERT_SNAPSHOTS, column_keys=list(params), for_executemany=True
+        )
+
+        assert compiled._insertmanyvalues is not None
+        assert "ON CONFLICT (code_id, article_number, version_date) DO UPDATE" in compiled.string
+
+    def test_save_snapshots_bulk_repeated_version_keeps_last(self):
+        """Test that a version given twice is sent once, with its last snapshot."""
+        mock_conn = MagicMock()
+
+        snapshots = [
+            ArticleSnapshot(article_number="1", article_text="Old", version_date=date(2026, 1, 1)),
+            ArticleSnapshot(article_number="2", article_text="Other", version_date=date(2026, 1, 1)),
+            ArticleSnapshot(article_number="1", article_text="New", version_date=date(2026, 1, 1)),
+        ]
+        saved = VersionManager().save_snapshots_bulk("TK_RF", snapshots, conn=mock_conn)
+
+        assert saved == 2
+        params_list = mock_conn.execute.call_args[0][1]
+        assert [(p["article_number"], p["article_text"]) for p in params_list] == [
+            ("1", "New"),
+            ("2", "Other"),
+        ]
+
+    def test_save_snapshots_bulk_empty(self):
+        """Test that an empty batch does not touch the database."""
+        mock_conn = MagicMock()
+
+        saved = VersionManager().save_snapshots_bulk("TK_RF", [], conn=mock_conn)
+
+        assert saved == 0
+        mock_conn.execute.assert_not_called()
+
+    def test_save_snapshots_bulk_database_error(self):
+        """Test that a failed batch reports nothing saved."""
+        mock_conn = MagicMock()
+        mock_conn.execute.side_effect = Exception("Database error")
+
+        snapshots = [ArticleSnapshot(article_number="1", article_text="First")]
+        saved = VersionManager().save_snapshots_bulk("TK_RF", snapshots, conn=mock_conn)
+
+        assert saved == 0
 
 
 class TestGetCurrentVersion:
     """Tests for get_current_version method."""
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_current_version_found(self, mock_get_conn):
         """Test getting current version when found."""
         mock_row = (
@@ -197,7 +316,7 @@ class TestGetCurrentVersion:
         assert snapshot.article_title == "Test Title"
         assert snapshot.is_current is True
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_current_version_not_found(self, mock_get_conn):
         """Test getting current version when not found."""
         mock_result = MagicMock()
@@ -211,36 +330,11 @@ class TestGetCurrentVersion:
 
         assert snapshot is None
 
-    @pytest.mark.skip(reason="Source code bug: VersionInfo missing repealed_date field")
-    @patch("scripts.consolidation.version_manager.get_db_connection")
-    def test_get_current_version_cached(self, mock_get_conn):
-        """Test that current version can come from cache."""
-        # NOTE: This test is skipped because _version_info_to_snapshot
-        # tries to access version_info.repealed_date which doesn't exist
-        # on the VersionInfo dataclass
-        manager = VersionManager()
-        cache_key = "TK_RF:123"
-        chain = AmendmentChain(article_number="123")
-        chain.current_version = VersionInfo(
-            article_number="123",
-            version_date=date(2026, 1, 1),
-            amendment_eo_number="cached",
-            is_current=True,
-            is_repealed=False,
-        )
-        manager.cache[cache_key] = chain
-
-        snapshot = manager.get_current_version("TK_RF", "123")
-
-        # Should not call database (mock not called)
-        mock_get_conn.assert_not_called()
-        assert snapshot is not None
-
 
 class TestGetVersionOnDate:
     """Tests for get_version_on_date method."""
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_version_on_date_found(self, mock_get_conn):
         """Test getting version on specific date."""
         mock_row = (
@@ -265,7 +359,7 @@ class TestGetVersionOnDate:
         assert snapshot is not None
         assert snapshot.version_date == date(2025, 6, 1)
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_version_on_date_not_found(self, mock_get_conn):
         """Test getting version on date when not found."""
         mock_result = MagicMock()
@@ -280,15 +374,68 @@ class TestGetVersionOnDate:
         assert snapshot is None
 
 
+class TestSnapshotCache:
+    """Tests for the in-process version cache."""
+
+    @staticmethod
+    def _mock_db(mock_get_conn):
+        mock_row = ("123", "Title", "Text", date(2025, 6, 1), "eo123", True, False, None)
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = mock_row
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value = mock_result
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+        return mock_conn
+
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_repeated_lookup_hits_cache(self, mock_get_conn):
+        """Test that a repeated lookup does not query the database again."""
+        mock_conn = self._mock_db(mock_get_conn)
+
+        manager = VersionManager()
+        first = manager.get_version_on_date("TK_RF", "123", date(2026, 1, 1))
+        second = manager.get_version_on_date("TK_RF", "123", date(2026, 1, 1))
+
+        assert mock_conn.execute.call_count == 1
+        assert second == first
+        # Cached snapshots are handed out as copies
+        assert second is not first
+
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_write_invalidates_cache(self, mock_get_conn):
+        """Test that writing an article drops its cached versions."""
+        mock_conn = self._mock_db(mock_get_conn)
+
+        manager = VersionManager()
+        manager.get_current_version("TK_RF", "123")
+        manager.save_snapshot("TK_RF", ArticleSnapshot(article_number="123"), conn=MagicMock())
+        manager.get_current_version("TK_RF", "123")
+
+        assert mock_conn.execute.call_count == 2
+
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_least_recently_used_article_evicted(self, mock_get_conn):
+        """Test that the cache is bounded by SNAPSHOT_CACHE_SIZE articles."""
+        mock_conn = self._mock_db(mock_get_conn)
+
+        manager = VersionManager()
+        manager.SNAPSHOT_CACHE_SIZE = 1
+        manager.get_current_version("TK_RF", "1")
+        manager.get_current_version("TK_RF", "2")
+        manager.get_current_version("TK_RF", "1")
+
+        assert mock_conn.execute.call_count == 3
+
+
 class TestGetAmendmentChain:
     """Tests for get_amendment_chain method."""
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_amendment_chain(self, mock_get_conn):
         """Test getting full amendment chain."""
         mock_rows = [
-            (date(2025, 1, 1), "eo_old", False, False, "hash1"),
-            (date(2026, 1, 1), "eo_new", True, False, "hash2"),
+            (date(2025, 1, 1), "eo_old", False, False, "hash1", "md5"),
+            (date(2026, 1, 1), "eo_new", True, False, "hash2", "xxh3_128"),
         ]
         mock_result = MagicMock()
         mock_result.__iter__ = lambda self: iter(mock_rows)
@@ -306,7 +453,7 @@ class TestGetAmendmentChain:
         assert chain.current_version is not None
         assert chain.current_version.is_current is True
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_amendment_chain_empty(self, mock_get_conn):
         """Test getting amendment chain with no versions."""
         mock_result = MagicMock()
@@ -322,11 +469,47 @@ class TestGetAmendmentChain:
         assert len(chain.versions) == 0
         assert chain.current_version is None
 
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_get_amendment_chains_single_query(self, mock_get_conn):
+        """Test loading chains for many articles in one query."""
+        mock_rows = [
+            {
+                "article_number": "1", "version_date": date(2025, 1, 1),
+                "amendment_eo_number": "eo_old", "is_current": False, "is_repealed": False,
+                "text_hash": "hash1", "text_hash_algo": "md5",
+            },
+            {
+                "article_number": "1", "version_date": date(2026, 1, 1),
+                "amendment_eo_number": "eo_new", "is_current": True, "is_repealed": False,
+                "text_hash": "hash2", "text_hash_algo": "xxh3_128",
+            },
+            {
+                "article_number": "2", "version_date": date(2025, 6, 1),
+                "amendment_eo_number": None, "is_current": True, "is_repealed": None,
+                "text_hash": None, "text_hash_algo": None,
+            },
+        ]
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value.mappings.return_value = iter(mock_rows)
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+
+        manager = VersionManager()
+        chains = manager.get_amendment_chains("TK_RF", ["1", "2", "999"])
+
+        assert mock_conn.execute.call_count == 1
+        params = mock_conn.execute.call_args[0][1]
+        assert params["article_numbers"] == ["1", "2", "999"]
+        assert [v.amendment_eo_number for v in chains["1"].versions] == ["eo_old", "eo_new"]
+        assert chains["1"].current_version.amendment_eo_number == "eo_new"
+        assert chains["2"].current_version.text_hash_algo == "md5"
+        assert chains["999"].versions == []
+        assert chains["999"].current_version is None
+
 
 class TestMarkOldVersionsAsNotCurrent:
     """Tests for mark_old_versions_as_not_current method."""
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_mark_old_versions(self, mock_get_conn):
         """Test marking old versions as not current."""
         mock_conn = MagicMock()
@@ -342,7 +525,7 @@ class TestMarkOldVersionsAsNotCurrent:
         mock_conn.execute.assert_called_once()
         mock_conn.commit.assert_called_once()
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_mark_old_versions_with_conn(self, mock_get_conn):
         """Test marking with provided connection."""
         mock_conn = MagicMock()
@@ -359,12 +542,13 @@ class TestMarkOldVersionsAsNotCurrent:
         mock_conn.execute.assert_called_once()
         # Should not call get_db_connection
         mock_get_conn.assert_not_called()
+        mock_conn.commit.assert_not_called()
 
 
 class TestGetArticleHistory:
     """Tests for get_article_history convenience function."""
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_article_history(self, mock_get_conn):
         """Test getting article history."""
         mock_rows = [
@@ -385,7 +569,7 @@ class TestGetArticleHistory:
         assert len(history) == 1
         assert history[0]["amendment_eo_number"] == "eo123"
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_article_history_with_date_range(self, mock_get_conn):
         """Test getting article history with date range."""
         mock_result = MagicMock()
@@ -409,7 +593,7 @@ class TestGetArticleHistory:
         assert "start_date" in params
         assert "end_date" in params
 
-    @patch("scripts.consolidation.version_manager.get_db_connection")
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
     def test_get_article_history_error(self, mock_get_conn):
         """Test handling database error."""
         mock_get_conn.side_effect = Exception("Database error")
@@ -418,3 +602,77 @@ class TestGetArticleHistory:
 
         # Should return empty list on error
         assert history == []
+
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_get_article_history_stream(self, mock_get_conn):
+        """Test streaming history through a server-side cursor."""
+        row = {"version_date": date(2026, 1, 1), "amendment_eo_number": "eo123"}
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = [row]
+        mock_conn = MagicMock()
+        mock_conn.execution_options.return_value.execute.return_value = mock_result
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+
+        history = get_article_history("TK_RF", "123", stream=True, include_preview=False)
+
+        # Nothing is queried until the iterator is consumed
+        mock_get_conn.assert_not_called()
+        assert list(history) == [row]
+        mock_conn.execution_options.assert_called_once_with(stream_results=True, yield_per=100)
+        query = str(mock_conn.execution_options.return_value.execute.call_args[0][0])
+        assert "text_preview" not in query
+
+
+class TestBatch:
+    """Tests for VersionManager.batch connection reuse."""
+
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_batch_reuses_one_connection(self, mock_get_conn):
+        """Test that calls inside batch() share a single leased connection."""
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = None
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value = mock_result
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+
+        manager = VersionManager()
+        with manager.batch():
+            manager.get_current_version("TK_RF", "1")
+            manager.get_version_on_date("TK_RF", "2", date(2026, 1, 1))
+            manager.mark_old_versions_as_not_current("TK_RF", "3", date(2026, 1, 1))
+
+        mock_get_conn.assert_called_once()
+        assert mock_conn.execute.call_count == 3
+        # Committed once, when the batch exits
+        mock_conn.commit.assert_called_once()
+
+    @patch("country_modules.russia.consolidation.version_manager.get_db_connection")
+    def test_batch_write_error_rolls_back_block(self, mock_get_conn):
+        """Test that a failed write inside batch() aborts and rolls back the block."""
+        mock_conn = MagicMock()
+        mock_conn.execute.side_effect = [None, Exception("Database error")]
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+
+        manager = VersionManager()
+        snapshot = ArticleSnapshot(article_number="2", article_text="Second")
+        with pytest.raises(Exception, match="Database error"):
+            with manager.batch():
+                manager.mark_old_versions_as_not_current("TK_RF", "1", date(2026, 1, 1))
+                manager.save_new_version("TK_RF", snapshot)
+                manager.save_snapshot("TK_RF", snapshot)
+
+        # The block stopped at the failed write
+        assert mock_conn.execute.call_count == 2
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+
+    def test_engine_connection_used_outside_batch(self):
+        """Test that a provided engine is used instead of the shared one."""
+        mock_engine = MagicMock()
+        mock_conn = mock_engine.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value.fetchone.return_value = None
+
+        VersionManager(engine=mock_engine).get_current_version("TK_RF", "1")
+
+        mock_engine.connect.assert_called_once()
+        mock_conn.execute.assert_called_once()
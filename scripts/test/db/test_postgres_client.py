@@ -11,6 +11,7 @@ from scripts.core.db import (
     get_db_session,
     check_db_connection,
     execute_sql,
+    execute_sql_iter,
     execute_sql_write,
     engine,
     SessionLocal,
@@ -130,7 +131,8 @@ class TestCheckDbConnection:
         result = check_db_connection()
 
         assert result is True
-        mock_conn.execute.assert_called_once()
+        # Connecting is the check; pool_pre_ping covers pooled connections
+        mock_conn.execute.assert_not_called()
         mock_logger.info.assert_called_once()
 
     @patch("scripts.core.db.get_db_connection")
@@ -146,11 +148,9 @@ class TestCheckDbConnection:
 
     @patch("scripts.core.db.get_db_connection")
     @patch("scripts.core.db.logger")
-    def test_check_connection_execute_error(self, mock_logger, mock_get_conn):
-        """Test connection check when execute fails."""
-        mock_conn = MagicMock()
-        mock_get_conn.return_value.__enter__.return_value = mock_conn
-        mock_conn.execute.side_effect = Exception("Execute failed")
+    def test_check_connection_ping_error(self, mock_logger, mock_get_conn):
+        """Test connection check when the pooled connection fails its ping."""
+        mock_get_conn.return_value.__enter__.side_effect = Exception("Ping failed")
 
         result = check_db_connection()
 
@@ -231,6 +231,31 @@ class TestExecuteSql:
         assert mock_conn.execute.call_args[0][1] == {}
 
 
+class TestExecuteSqlIter:
+    """Tests for execute_sql_iter function."""
+
+    @patch("scripts.core.db.get_db_connection")
+    def test_execute_sql_iter_streams_rows(self, mock_get_conn):
+        """Test that execute_sql_iter yields rows from a streaming result."""
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value = iter([("row1",), ("row2",)])
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+
+        query = "SELECT * FROM documents"
+        rows = execute_sql_iter(query, chunk_size=500)
+
+        # Nothing runs until the iterator is consumed
+        mock_conn.execute.assert_not_called()
+        assert list(rows) == [("row1",), ("row2",)]
+        assert mock_conn.execute.call_args[0][0].text == query
+        assert mock_conn.execute.call_args[0][1] == {}
+        assert mock_conn.execute.call_args[1]["execution_options"] == {
+            "stream_results": True,
+            "yield_per": 500,
+        }
+        mock_get_conn.return_value.__exit__.assert_called_once()
+
+
 class TestExecuteSqlWrite:
     """Tests for execute_sql_write function."""
 
@@ -84,6 +84,28 @@ class TestIdentifyTargetCode:
         assert result.code_id == "NK_RF"
         assert "Налоговый кодекс" in result.code_name
 
+    def test_identify_code_from_title_first(self):
+        """Test that a code named in the title wins over codes cited in the text."""
+        parser = AmendmentParser()
+
+        result = parser._identify_target_code(
+            "О внесении изменений в Налоговый кодекс",
+            "В соответствии со статьей 81 Трудового кодекса..."
+        )
+
+        assert result.code_id == "NK_RF"
+
+    def test_identify_code_from_text(self):
+        """Test fallback to the text when the title names no code."""
+        parser = AmendmentParser()
+
+        result = parser._identify_target_code(
+            "О внесении изменений в отдельные законодательные акты",
+            "Статья 1. Внести в Семейный кодекс Российской Федерации..."
+        )
+
+        assert result.code_id == "SK_RF"
+
     def test_identify_unknown_code(self):
         """Test handling of unknown code."""
         parser = AmendmentParser()
@@ -153,6 +175,17 @@ class TestExtractArticles:
         found = any("15" in str(item) for item in result)
         assert found
 
+    def test_extract_articles_flat_and_ordered(self):
+        """Test that references are flattened to strings, deduplicated in order."""
+        parser = AmendmentParser()
+
+        result = parser._extract_articles(
+            "О внесении изменений в статью 81 и ст. 5",
+            "В статье 81 ... пункт 3 ... ст. 5"
+        )
+
+        assert result == ["81", "5", "3"]
+
     def test_extract_no_articles(self):
         """Test when no articles are referenced."""
         parser = AmendmentParser()
@@ -366,6 +399,48 @@ class TestConvenienceFunctions:
         assert result[0].code_id == "TK_RF"
         assert result[1].action_type == "addition"
 
+    def test_parse_amendments_batch_parses_duplicates_once(self):
+        """Test that repeated amendments are parsed once and returned as copies."""
+        amendment = {
+            "eo_number": "0001202601170001",
+            "title": "О внесении изменений в Трудовой кодекс",
+            "full_text": "В статье 123...",
+        }
+        other = {**amendment, "title": "О внесении изменений в Налоговый кодекс"}
+
+        with patch.object(
+            AmendmentParser, "parse_amendment", autospec=True,
+            side_effect=AmendmentParser.parse_amendment,
+        ) as mock_parse:
+            result = parse_amendments_batch([amendment, other, dict(amendment)])
+
+        assert mock_parse.call_count == 2
+        assert [a.code_id for a in result] == ["TK_RF", "NK_RF", "TK_RF"]
+        assert result[2] == result[0]
+        assert result[2] is not result[0]
+        assert result[2].changes is not result[0].changes
+
+    def test_parse_amendments_batch_with_workers(self):
+        """Test that parsing in worker processes keeps results and order."""
+        amendments = [
+            {
+                "eo_number": f"000120260117{i:04d}",
+                "title": "О внесении изменений в Трудовой кодекс" if i % 2 else "О дополнении Кодекса",
+                "full_text": "В статье 123..." if i % 2 else "Дополнить статьей 456...",
+            }
+            for i in range(100)
+        ]
+
+        sequential = parse_amendments_batch(amendments)
+        parallel = parse_amendments_batch(amendments, max_workers=2)
+
+        assert [a.eo_number for a in parallel] == [a["eo_number"] for a in amendments]
+        assert [(a.code_id, a.action_type) for a in parallel] == [
+            (a.code_id, a.action_type) for a in sequential
+        ]
+        # Code strings from worker processes are interned back to one object
+        assert len({id(a.code_name) for a in parallel if a.code_id == "TK_RF"}) == 1
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""